@@ -0,0 +1,339 @@
+# benchmarks/run.py
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+if __package__ in (None, ""):
+    # Run as a script: make the src and benchmarks packages importable
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+from benchmarks.synthetic import generate_cases, generate_repository, parse_size, search_terms, size_label
+from src.config import Config
+from src.models.case import Case
+from src.utils.scheduler import ScheduleCalculator
+from src.utils.storage import StorageManager
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+GROUPS = ("scheduler", "storage", "ui")
+
+USAGE_NOTES = """\
+Timings are machine specific, so no baseline is committed. Record one on
+the machine that runs the comparison, then compare later runs against it:
+
+  python benchmarks/run.py --save-baseline   # writes benchmarks/baseline.json
+  python benchmarks/run.py                   # exit status 1 on a regression
+
+Without a baseline file a run only reports its timings. The ui group needs
+a display and is skipped (and listed in the summary) without one.
+"""
+
+class BenchmarkRunner:
+    """Times benchmark functions and collects their results by name.
+
+    Each benchmark is run ``repeat`` times untraced for timing, then once
+    under tracemalloc for its peak memory, so tracing does not distort the
+    timings.
+    """
+
+    def __init__(self, repeat: int):
+        self.repeat = repeat
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.skipped: Dict[str, str] = {}
+        self.failures: Dict[str, str] = {}
+
+    def run(
+        self,
+        name: str,
+        function: Callable[[], Any],
+        setup: Optional[Callable[[], None]] = None,
+        operations: int = 1
+    ) -> None:
+        """Benchmark ``function``; ``setup`` runs untimed before every call"""
+        timings = []
+        for _ in range(self.repeat):
+            if setup is not None:
+                setup()
+            gc.collect()
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+
+        if setup is not None:
+            setup()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            function()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        best = min(timings)
+        self.results[name] = {
+            "seconds": best,
+            "mean_seconds": sum(timings) / len(timings),
+            "max_seconds": max(timings),
+            "per_operation_us": best / operations * 1e6,
+            "operations": operations,
+            "peak_bytes": peak,
+            "repeat": len(timings)
+        }
+        print(f"  {name:<52} {best * 1000:10.2f} ms  {peak / 1e6:9.2f} MB peak", flush=True)
+
+    def check(self, name: str, function: Callable[[], Any]) -> None:
+        """Run a correctness check; an AssertionError fails the whole run"""
+        try:
+            function()
+        except AssertionError as error:
+            self.failures[name] = str(error)
+            print(f"  {name:<52} FAILED: {error}", flush=True)
+        else:
+            print(f"  {name:<52} ok", flush=True)
+
+    def skip(self, name: str, reason: str) -> None:
+        self.skipped[name] = reason
+        print(f"  {name:<52} skipped: {reason}", flush=True)
+
+def bench_scheduler(runner: BenchmarkRunner, count: int, seed: int) -> None:
+    """ScheduleCalculator over a synthetic backlog"""
+    label = size_label(count)
+    cases = list(generate_cases(count, seed))
+    followups = [case for case in cases if case.case_type == 'Follow-ups']
+    strikes = [case for case in cases if case.case_type != 'Follow-ups']
+
+    def calculate_followups() -> None:
+        for case in followups:
+            ScheduleCalculator.calculate_followups(case)
+
+    def calculate_strikes() -> None:
+        for case in strikes:
+            ScheduleCalculator.calculate_strikes(case)
+
+    def format_schedule() -> None:
+        for case in cases:
+            ScheduleCalculator.format_schedule(case)
+
+    runner.run(f"scheduler.calculate_followups[{label}]", calculate_followups, operations=len(followups) or 1)
+    runner.run(f"scheduler.calculate_strikes[{label}]", calculate_strikes, operations=len(strikes) or 1)
+    runner.run(f"scheduler.format_schedule[{label}]", format_schedule, operations=count)
+
+def bench_storage(runner: BenchmarkRunner, count: int, seed: int, mode: str, directory: str) -> None:
+    """StorageManager load and save in one storage mode"""
+    label = size_label(count)
+    prefix = f"storage.{mode}"
+    Config.STORAGE_MODE = mode
+    paths = {"counter": 0}
+    state: Dict[str, Any] = {}
+
+    def use_fresh_files() -> None:
+        # New paths also drop StorageManager's cached file state
+        StorageManager.close()
+        paths["counter"] += 1
+        stem = os.path.join(directory, f"{mode}-{label}-{paths['counter']}")
+        Config.CASES_FILE = stem + ".json"
+        Config.JOURNAL_FILE = stem + ".journal"
+        Config.SQLITE_FILE = stem + ".db"
+
+    def fill_store() -> None:
+        StorageManager.save_cases(generate_repository(count, seed, saved=False))
+
+    def prepare_full_save() -> None:
+        use_fresh_files()
+        state["cases"] = generate_repository(count, seed, saved=False)
+
+    runner.run(f"{prefix}.save_cases.full[{label}]", lambda: StorageManager.save_cases(state["cases"]), setup=prepare_full_save, operations=count)
+
+    use_fresh_files()
+    fill_store()
+    StorageManager.close()
+    runner.run(f"{prefix}.load_cases[{label}]", StorageManager.load_cases, operations=count)
+
+    def prepare_first_change() -> None:
+        # Start cold: the first save after a load also reads the JSON file
+        # into the fragment cache
+        StorageManager.close()
+        cases = StorageManager.load_cases()
+        state["cases"] = cases
+        cases.upsert(Case("BENCH-CHANGE", Config.CASE_TYPES[0], Config.WEEKDAYS[0], Config.SEVERITY_LEVELS[0]))
+
+    runner.run(f"{prefix}.save_cases.first_change[{label}]", lambda: StorageManager.save_cases(state["cases"]), setup=prepare_first_change)
+
+    def prepare_next_change() -> None:
+        state["cases"].upsert(Case(f"BENCH-{time.perf_counter_ns()}", Config.CASE_TYPES[-1], Config.WEEKDAYS[-1], Config.SEVERITY_LEVELS[-1]))
+
+    runner.run(f"{prefix}.save_cases.next_change[{label}]", lambda: StorageManager.save_cases(state["cases"]), setup=prepare_next_change)
+    StorageManager.close()
+
+def _create_root():
+    """Create a hidden Tk root, or return the reason there is none"""
+    try:
+        import ttkbootstrap as tb
+        root = tb.Window(themename=Config.DEFAULT_THEME)
+    except Exception as error:  # No display, or no Tk at all
+        return None, str(error).splitlines()[0]
+    root.withdraw()
+    return root, None
+
+def bench_ui(runner: BenchmarkRunner, count: int, seed: int, root) -> None:
+    """CaseListFrame refresh and search with the window hidden"""
+    from src.ui.case_list import CaseListFrame
+    from src.utils.search import CaseSearchIndex
+
+    label = size_label(count)
+    cases = generate_repository(count, seed)
+    search_index = CaseSearchIndex.from_repository(cases)
+    frame = CaseListFrame(
+        root,
+        on_case_select=lambda: None,
+        view_case_callback=lambda selected: None,
+        edit_case=lambda case: None,
+        delete_cases=lambda selected: None,
+        search_query=search_index.search
+    )
+    frame.pack()
+
+    def refresh() -> None:
+        frame.refresh_case_list(cases)
+        root.update_idletasks()
+
+    runner.run(f"ui.refresh_case_list[{label}]", refresh)
+
+    terms = search_terms(50, seed)
+
+    def search() -> None:
+        # _on_search only schedules the debounced search; run it straight away
+        for term in terms:
+            frame.search_entry.delete(0, "end")
+            frame.search_entry.insert(0, term)
+            frame._on_search()
+            frame._run_search()
+        root.update_idletasks()
+
+    search()  # Build the n-gram index outside the timings
+    runner.run(f"ui.search[{label}]", search, operations=len(terms))
+    frame.destroy()
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    time_threshold: float,
+    memory_threshold: float
+) -> List[str]:
+    """Print how results compare with a baseline and return the regressions"""
+    regressions = []
+    print(f"\n{'benchmark':<52} {'time':>8} {'memory':>8}")
+    for name, result in sorted(results.items()):
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<52} {'new':>8}")
+            continue
+        time_ratio = result["seconds"] / base["seconds"] if base["seconds"] else 1.0
+        memory_ratio = result["peak_bytes"] / base["peak_bytes"] if base["peak_bytes"] else 1.0
+        flags = []
+        if time_ratio > 1 + time_threshold:
+            flags.append("time")
+        if memory_ratio > 1 + memory_threshold:
+            flags.append("memory")
+        marker = f"  REGRESSION ({', '.join(flags)})" if flags else ""
+        print(f"{name:<52} {time_ratio:7.2f}x {memory_ratio:7.2f}x{marker}")
+        if flags:
+            regressions.append(name)
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Schedule Calculator benchmarks",
+        epilog=USAGE_NOTES,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", default="1k,100k,1M", help="comma-separated case counts, e.g. 1k,100k,1M")
+    parser.add_argument("--only", default=",".join(GROUPS), help=f"comma-separated groups from {', '.join(GROUPS)}")
+    parser.add_argument("--storage-modes", default="json,journal,sqlite", help="storage modes to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark; the fastest is kept")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic data")
+    parser.add_argument("--output", "-o", help="write results as JSON to this file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare against, if it exists")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before a regression, as a fraction")
+    parser.add_argument("--memory-threshold", type=float, default=0.25, help="allowed peak memory growth, as a fraction")
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(label) for label in args.sizes.split(",") if label]
+    groups = [group for group in args.only.split(",") if group]
+    runner = BenchmarkRunner(max(1, args.repeat))
+
+    root = None
+    if "ui" in groups:
+        root, reason = _create_root()
+
+    if "scheduler" in groups:
+        # Timings of a closed form that disagrees with the loop are worthless
+        runner.check("scheduler.verify_closed_form", ScheduleCalculator.verify_closed_form)
+
+    with tempfile.TemporaryDirectory(prefix="schedule-bench-") as directory:
+        for count in sizes:
+            print(f"{size_label(count)} cases", flush=True)
+            if "scheduler" in groups:
+                bench_scheduler(runner, count, args.seed)
+            if "storage" in groups:
+                for mode in args.storage_modes.split(","):
+                    bench_storage(runner, count, args.seed, mode, directory)
+            if "ui" in groups:
+                if root is None:
+                    runner.skip(f"ui.*[{size_label(count)}]", reason)
+                else:
+                    bench_ui(runner, count, args.seed, root)
+    if root is not None:
+        root.destroy()
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "sizes": sizes,
+            "repeat": runner.repeat,
+            "seed": args.seed
+        },
+        "results": runner.results,
+        "skipped": runner.skipped,
+        "failures": runner.failures
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=4)
+
+    regressions: List[str] = []
+    summary = [f"{len(runner.results)} benchmark(s)"]
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=4)
+        summary.append(f"baseline saved to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(runner.results, baseline, args.threshold, args.memory_threshold)
+        summary.append(f"{len(regressions)} regression(s) against {args.baseline}")
+    else:
+        summary.append(f"not compared: no baseline at {args.baseline} (record one with --save-baseline)")
+    if runner.failures:
+        summary.append(f"{len(runner.failures)} check(s) failed: {', '.join(runner.failures)}")
+    if runner.skipped:
+        reasons = sorted(set(runner.skipped.values()))
+        summary.append(f"{len(runner.skipped)} skipped: {', '.join(runner.skipped)} ({'; '.join(reasons)})")
+    print("\n" + "; ".join(summary))
+    return 1 if regressions or runner.failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+# benchmarks/synthetic.py
+import random
+from typing import Iterator, List
+from src.models.case import Case
+from src.models.case_repository import CaseRepository
+from src.config import Config
+
+# Size labels accepted on the command line
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1M": 1_000_000}
+
+def parse_size(label: str) -> int:
+    """Turn a label such as 100k or 1M (or a plain number) into a case count"""
+    if label in SIZES:
+        return SIZES[label]
+    return int(label.replace("_", ""))
+
+def size_label(count: int) -> str:
+    """Inverse of parse_size for the standard sizes"""
+    for label, size in SIZES.items():
+        if size == count:
+            return label
+    return str(count)
+
+def generate_cases(count: int, seed: int = 0) -> Iterator[Case]:
+    """Yield ``count`` cases with reproducible, evenly mixed fields"""
+    rng = random.Random(seed)
+    for index in range(count):
+        yield Case(
+            case_number=f"CS{index:07d}-{rng.randrange(10_000):04d}",
+            case_type=rng.choice(Config.CASE_TYPES),
+            last_contact_day=rng.choice(Config.WEEKDAYS),
+            severity=rng.choice(Config.SEVERITY_LEVELS)
+        )
+
+def generate_repository(count: int, seed: int = 0, saved: bool = True) -> CaseRepository:
+    """Build a repository of synthetic cases.
+
+    With ``saved=False`` every case is left as a pending change, so the
+    next save writes all of them.
+    """
+    cases = CaseRepository()
+    for case in generate_cases(count, seed):
+        cases.upsert(case)
+    if saved:
+        for case_map in cases.maps.values():
+            case_map.mark_clean()
+    return cases
+
+def search_terms(count: int, seed: int = 0) -> List[str]:
+    """Search box inputs of 1 to 8 characters, as a user would type them"""
+    rng = random.Random(seed + 1)
+    terms = []
+    for _ in range(count):
+        number = f"CS{rng.randrange(10_000_000):07d}-{rng.randrange(10_000):04d}"
+        start = rng.randrange(len(number))
+        terms.append(number[start:start + rng.randint(1, 8)])
+    return terms
@@ -0,0 +1,200 @@
+# src/cli.py
+import argparse
+import contextlib
+import os
+import sys
+from typing import Iterator, Optional, TextIO
+
+if __package__ in (None, ""):
+    # Run as a script: make the src package importable, as in main.py
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if project_root not in sys.path:
+        sys.path.append(project_root)
+
+from src.config import Config
+from src.utils.agenda import EVENTS, AgendaIndex
+from src.utils.case_io import (
+    CASE_FIELDS, FORMATS, SCHEDULE_FIELDS, RecordWriter, case_record, detect_format,
+    export_cases, import_cases, read_cases, schedule_record, write_error_report
+)
+from src.utils.parallel import ParallelScheduleExecutor
+from src.utils.storage import StorageManager
+
+@contextlib.contextmanager
+def _open_input(path: str) -> Iterator[TextIO]:
+    """Open ``path`` for reading, or use stdin for '-'"""
+    if path == "-":
+        yield sys.stdin
+    else:
+        with open(path, "r", encoding="utf-8", newline="") as file:
+            yield file
+
+@contextlib.contextmanager
+def _open_output(path: Optional[str]) -> Iterator[TextIO]:
+    """Open ``path`` for writing, or use stdout when it is not given"""
+    if path is None or path == "-":
+        yield sys.stdout
+        sys.stdout.flush()
+    else:
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            yield file
+
+class _Rejections:
+    """Collects rejected input rows and reports each one on stderr"""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, line: int, message: str) -> None:
+        self.count += 1
+        print(f"line {line}: {message}", file=sys.stderr)
+
+def _command_compute(args: argparse.Namespace) -> int:
+    """Stream cases from the input and write their schedules"""
+    rejected = _Rejections()
+    input_format = args.input_format or detect_format(args.input)
+    output_format = args.format or detect_format(args.output)
+    with _open_input(args.input) as source, _open_output(args.output) as target:
+        writer = RecordWriter(target, output_format, SCHEDULE_FIELDS)
+        if args.workers == 1:
+            writer.write_all(
+                schedule_record(case)
+                for case in read_cases(source, input_format, on_error=rejected)
+            )
+            count = writer.count
+        else:
+            executor = ParallelScheduleExecutor(args.workers, args.chunk_size)
+            count = 0
+            for chunk in executor.render_file(source, input_format, output_format):
+                target.write(chunk.text)
+                count += chunk.count
+                for line, message in chunk.errors:
+                    rejected(line, message)
+    print(f"Computed {count} schedules, rejected {rejected.count} rows", file=sys.stderr)
+    return 1 if rejected.count else 0
+
+def _command_import(args: argparse.Namespace) -> int:
+    """Add or update stored cases from the input"""
+    cases = StorageManager.load_cases()
+    with _open_input(args.input) as source:
+        result = import_cases(
+            source,
+            args.input_format or detect_format(args.input),
+            cases,
+            on_error=_Rejections()
+        )
+    # The whole import is written in one save
+    StorageManager.save_cases(cases)
+    if args.errors:
+        with _open_output(args.errors) as target:
+            write_error_report(target, detect_format(args.errors, default="csv"), result.rejected)
+    print(result.summary(), file=sys.stderr)
+    return 1 if result.rejected else 0
+
+def _command_export(args: argparse.Namespace) -> int:
+    """Write stored cases, optionally filtered"""
+    output_format = args.format or detect_format(args.output)
+    if args.severity or args.day or args.number:
+        # Only the matching rows are read in sqlite mode
+        matches = StorageManager.query_cases(args.type, args.severity, args.day, args.number)
+        with _open_output(args.output) as target:
+            writer = RecordWriter(target, output_format, CASE_FIELDS)
+            writer.write_all(case_record(case.case_number, case.to_dict()) for case in matches)
+            count = writer.count
+    else:
+        cases = StorageManager.load_cases()
+        with _open_output(args.output) as target:
+            count = export_cases(target, output_format, cases, [args.type] if args.type else None)
+    print(f"Exported {count} cases", file=sys.stderr)
+    return 0
+
+def _command_agenda(args: argparse.Namespace) -> int:
+    """Write what is due on a weekday"""
+    agenda = AgendaIndex.from_repository(StorageManager.load_cases())
+    with _open_output(args.output) as target:
+        writer = RecordWriter(target, args.format or detect_format(args.output), ["event", "case_number", "case_type"])
+        writer.write_all(
+            {"event": event, "case_number": case_number, "case_type": case_type}
+            for event, (case_number, case_type) in agenda.due_on(args.day, args.event)
+        )
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Schedule Calculator command line")
+    parser.add_argument(
+        "--storage-mode",
+        choices=("json", "journal", "sqlite"),
+        help=f"storage backend (default: {Config.STORAGE_MODE})"
+    )
+    parser.add_argument("--cases-file", help=f"cases JSON file (default: {Config.CASES_FILE})")
+    parser.add_argument("--journal-file", help=f"journal file (default: {Config.JOURNAL_FILE})")
+    parser.add_argument("--sqlite-file", help=f"SQLite database (default: {Config.SQLITE_FILE})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_input(command: argparse.ArgumentParser) -> None:
+        command.add_argument("input", nargs="?", default="-", help="CSV or JSON Lines file, or - for stdin")
+        command.add_argument("--input-format", choices=FORMATS, help="input format (default: from the file name, else jsonl)")
+
+    def add_output(command: argparse.ArgumentParser) -> None:
+        command.add_argument("--output", "-o", help="output file (default: stdout)")
+        command.add_argument("--format", choices=FORMATS, help="output format (default: from the file name, else jsonl)")
+
+    compute = commands.add_parser("compute", help="compute schedules for input cases")
+    add_input(compute)
+    add_output(compute)
+    compute.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=1,
+        help="worker processes; 0 uses every core (default: 1, no pool)"
+    )
+    compute.add_argument(
+        "--chunk-size",
+        type=int,
+        help=f"cases per chunk sent to a worker (default: {Config.PARALLEL_CHUNK_SIZE})"
+    )
+    compute.set_defaults(handler=_command_compute)
+
+    import_ = commands.add_parser("import", help="add or update stored cases from input")
+    add_input(import_)
+    import_.add_argument("--errors", help="also write rejected rows (line, reason) to this CSV or JSON Lines file")
+    import_.set_defaults(handler=_command_import)
+
+    export = commands.add_parser("export", help="write stored cases")
+    export.add_argument("--type", choices=Config.CASE_TYPES, help="only export one case type")
+    export.add_argument("--severity", choices=Config.SEVERITY_LEVELS, help="only export one severity")
+    export.add_argument("--day", choices=Config.WEEKDAYS, help="only export cases last contacted on this weekday")
+    export.add_argument("--number", help="only export this case number")
+    add_output(export)
+    export.set_defaults(handler=_command_export)
+
+    agenda = commands.add_parser("agenda", help="list what is due on a weekday")
+    agenda.add_argument("day", choices=Config.WEEKDAYS)
+    agenda.add_argument("--event", choices=EVENTS, help="only list one kind of event")
+    add_output(agenda)
+    agenda.set_defaults(handler=_command_agenda)
+
+    return parser
+
+def main(argv: Optional[list] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.storage_mode:
+        Config.STORAGE_MODE = args.storage_mode
+    if args.cases_file:
+        Config.CASES_FILE = args.cases_file
+    if args.journal_file:
+        Config.JOURNAL_FILE = args.journal_file
+    if args.sqlite_file:
+        Config.SQLITE_FILE = args.sqlite_file
+
+    try:
+        return args.handler(args)
+    except BrokenPipeError:
+        # e.g. piped into head; not an error for a batch job
+        sys.stderr.close()
+        return 0
+    finally:
+        StorageManager.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,45 @@ class Config:
     WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
     CASE_TYPES = ['Follow-ups', 'Strikes']
     SEVERITY_LEVELS = ['B', 'C']
-    DEFAULT_THEME = "solar"
+    DARK_THEME = "solar"
+    LIGHT_THEME = "litera"
+    DEFAULT_THEME = DARK_THEME
     DEFAULT_WINDOW_SIZE = "1200x800"
-    CASES_FILE = "data/cases.json"
\ No newline at end of file
+    CASES_FILE = "data/cases.json"
+    # "json" rewrites CASES_FILE on every save; "journal" appends each change
+    # to JOURNAL_FILE and folds it into CASES_FILE in the background;
+    # "sqlite" keeps cases in an indexed table in SQLITE_FILE
+    STORAGE_MODE = "json"
+    JOURNAL_FILE = "data/cases.journal"
+    JOURNAL_COMPACT_THRESHOLD = 1000
+    SQLITE_FILE = "data/cases.db"
+    # Several instances can share the same files: writers take an advisory
+    # lock on CASES_FILE + LOCK_FILE_SUFFIX, each instance checks for the
+    # others' changes every SHARED_POLL_MS, and the last
+    # SHARED_CHANGE_LOG_SIZE changed cases are logged for them to read (in
+    # CASES_FILE + CHANGE_LOG_SUFFIX in json mode, a table in sqlite mode)
+    LOCK_FILE_SUFFIX = ".lock"
+    CHANGE_LOG_SUFFIX = ".changes"
+    SHARED_POLL_MS = 1000
+    SHARED_CHANGE_LOG_SIZE = 10000
+    # Background saving: queued change sets, how long to wait for a burst of
+    # edits before writing, and how long to wait before retrying a failed write
+    SAVE_QUEUE_SIZE = 64
+    SAVE_COALESCE_SECONDS = 0.2
+    SAVE_RETRY_SECONDS = 5.0
+    SAVE_ERROR_POLL_MS = 500
+    # Startup loading: cases handed to the list per chunk, and how often the
+    # UI checks the loader thread for new chunks
+    LOAD_CHUNK_SIZE = 5000
+    LOAD_POLL_MS = 50
+    # Parallel schedule runs: worker processes (None uses every core) and
+    # cases per chunk sent to a worker
+    PARALLEL_WORKERS = None
+    PARALLEL_CHUNK_SIZE = 20000
+    # Default file name for "Dump to File" in the performance stats panel
+    METRICS_FILE = "data/metrics.json"
+    # Date-based scheduling: the years covered by the business-day index and
+    # a text file of holidays, one YYYY-MM-DD date per line
+    CALENDAR_FIRST_YEAR = 2000
+    CALENDAR_LAST_YEAR = 2099
+    HOLIDAYS_FILE = "data/holidays.txt"
@@ -1,15 +1,34 @@
 # src/main.py
-import sys
+import argparse
 import os
+import sys
 
-# Add the parent directory to the Python path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from src.ui.main_window import MainWindow
+if __package__ in (None, ""):
+    # Run as a script (python src/main.py or the PyInstaller build): make the
+    # src package importable, without adding the path more than once
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if project_root not in sys.path:
+        sys.path.append(project_root)
 
 def main():
+    parser = argparse.ArgumentParser(description="Schedule Calculator")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print an import-time and startup phase breakdown once cases are loaded"
+    )
+    args = parser.parse_args()
+
+    from src.utils.startup import StartupProfiler
+    if args.profile_startup:
+        StartupProfiler.enable()
+
+    # Imported here so the profiler can see the cost of the UI modules
+    from src.ui.main_window import MainWindow
+    StartupProfiler.mark("imports")
+
     app = MainWindow()
     app.run()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
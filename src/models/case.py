@@ -1,18 +1,130 @@
 # src/models/case.py
-from dataclasses import dataclass
-from typing import Literal, Dict, Any
+import datetime
+import sys
+from typing import Literal, Dict, Any, List, Optional, Tuple
+from ..config import Config
 
 CaseType = Literal['Follow-ups', 'Strikes']
 SeverityLevel = Literal['B', 'C']
 
-@dataclass
+class CodeTable:
+    """Interned table mapping short strings to small integer codes.
+
+    Codes are assigned in insertion order and never change, so the initial
+    Config values keep the same codes as their index in the Config lists.
+    """
+    __slots__ = ('values', 'codes')
+
+    def __init__(self, initial: List[str]):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+        for value in initial:
+            self.encode(value)
+
+    def encode(self, value: str) -> int:
+        """Return the code for ``value``, adding it to the table if needed"""
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(sys.intern(value))
+            self.codes[value] = code
+        return code
+
+    def decode(self, code: int) -> str:
+        """Return the value stored under ``code``"""
+        return self.values[code]
+
+def parse_date(value: Optional[str]) -> Optional[datetime.date]:
+    """Parse a stored YYYY-MM-DD date; empty values mean no date"""
+    return datetime.date.fromisoformat(value) if value else None
+
+CASE_TYPE_CODES = CodeTable(Config.CASE_TYPES)
+DAY_CODES = CodeTable(Config.WEEKDAYS)
+SEVERITY_CODES = CodeTable(Config.SEVERITY_LEVELS)
+
 class Case:
-    """Represents a support case with its scheduling information"""
-    case_number: str
-    case_type: CaseType
-    last_contact_day: str
-    severity: SeverityLevel
-    
+    """Represents a support case with its scheduling information.
+
+    Type, day and severity are stored as small integer codes into the shared
+    code tables above; ``__slots__`` avoids a per-instance ``__dict__``.
+    ``last_contact_date`` is optional; when it is set, schedules are
+    calculated as calendar dates instead of weekday names.
+    """
+    __slots__ = ('case_number', '_type_code', '_day_code', '_severity_code', 'last_contact_date')
+
+    def __init__(
+        self,
+        case_number: str,
+        case_type: CaseType,
+        last_contact_day: str,
+        severity: SeverityLevel,
+        last_contact_date: Optional[datetime.date] = None
+    ):
+        self.case_number = case_number
+        self._type_code = CASE_TYPE_CODES.encode(case_type)
+        self._day_code = DAY_CODES.encode(last_contact_day)
+        self._severity_code = SEVERITY_CODES.encode(severity)
+        self.last_contact_date = last_contact_date
+
+    @classmethod
+    def from_codes(
+        cls,
+        case_number: str,
+        type_code: int,
+        day_code: int,
+        severity_code: int,
+        last_contact_date: Optional[datetime.date] = None
+    ) -> 'Case':
+        """Create a Case directly from code table codes"""
+        case = cls.__new__(cls)
+        case.case_number = case_number
+        case._type_code = type_code
+        case._day_code = day_code
+        case._severity_code = severity_code
+        case.last_contact_date = last_contact_date
+        return case
+
+    @property
+    def case_type(self) -> CaseType:
+        return CASE_TYPE_CODES.values[self._type_code]
+
+    @case_type.setter
+    def case_type(self, value: CaseType) -> None:
+        self._type_code = CASE_TYPE_CODES.encode(value)
+
+    @property
+    def last_contact_day(self) -> str:
+        return DAY_CODES.values[self._day_code]
+
+    @last_contact_day.setter
+    def last_contact_day(self, value: str) -> None:
+        self._day_code = DAY_CODES.encode(value)
+
+    @property
+    def severity(self) -> SeverityLevel:
+        return SEVERITY_CODES.values[self._severity_code]
+
+    @severity.setter
+    def severity(self, value: SeverityLevel) -> None:
+        self._severity_code = SEVERITY_CODES.encode(value)
+
+    @property
+    def type_code(self) -> int:
+        return self._type_code
+
+    @property
+    def day_code(self) -> int:
+        return self._day_code
+
+    @property
+    def severity_code(self) -> int:
+        return self._severity_code
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """Repository key: (case number, case type)"""
+        return (self.case_number, self.case_type)
+
     @property
     def unique_id(self) -> str:
         """Create a unique identifier that combines case number and type"""
@@ -25,16 +137,41 @@ class Case:
             case_number=case_number,
             case_type=data['type'],
             last_contact_day=data['day'],
-            severity=data['severity']
+            severity=data['severity'],
+            last_contact_date=parse_date(data.get('date'))
         )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the Case instance to a dictionary"""
-        return {
+        data = {
             'type': self.case_type,
             'day': self.last_contact_day,
             'severity': self.severity
         }
+        # Only dated cases store a date, so existing files keep their layout
+        if self.last_contact_date is not None:
+            data['date'] = self.last_contact_date.isoformat()
+        return data
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.case_number == other.case_number
+            and self._type_code == other._type_code
+            and self._day_code == other._day_code
+            and self._severity_code == other._severity_code
+            and self.last_contact_date == other.last_contact_date
+        )
+
+    __hash__ = None  # Mutable, like the dataclass it replaces
+
+    def __repr__(self) -> str:
+        date = f", last_contact_date={self.last_contact_date!r}" if self.last_contact_date is not None else ""
+        return (
+            f"Case(case_number={self.case_number!r}, case_type={self.case_type!r}, "
+            f"last_contact_day={self.last_contact_day!r}, severity={self.severity!r}{date})"
+        )
 
     def __str__(self) -> str:
-        return f"Case {self.case_number} ({self.case_type})"
\ No newline at end of file
+        return f"Case {self.case_number} ({self.case_type})"
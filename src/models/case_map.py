@@ -0,0 +1,146 @@
+# src/models/case_map.py
+from typing import Any, Dict, Iterator, List, MutableMapping, Optional, Set, Tuple, Union
+from .case import Case, CASE_TYPE_CODES, DAY_CODES, SEVERITY_CODES, parse_date
+
+class TrackedCaseMap(MutableMapping):
+    """Mapping of case number to case that remembers which entries changed since the last save"""
+
+    def __init__(self, *args, **kwargs):
+        self._data: Dict[str, Case] = {}
+        self._dirty: Set[str] = set()
+        self._deleted: Dict[str, Case] = {}
+        self.update(*args, **kwargs)
+
+    def __getitem__(self, key: str) -> Case:
+        return self._data[key]
+
+    def __setitem__(self, key: str, case: Case) -> None:
+        self._data[key] = case
+        self._deleted.pop(key, None)
+        self._dirty.add(key)
+
+    def __delitem__(self, key: str) -> None:
+        case = self._data.pop(key)
+        self._dirty.discard(key)
+        self._deleted[key] = case
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether anything was added, updated or deleted since the last save"""
+        return bool(self._dirty or self._deleted)
+
+    def changes(self) -> Tuple[List[Case], List[Case]]:
+        """Return the (upserted, deleted) cases since the map was last marked clean"""
+        return [self._data[key] for key in self._dirty], list(self._deleted.values())
+
+    def mark_clean(self) -> None:
+        """Forget all pending changes"""
+        self._dirty.clear()
+        self._deleted.clear()
+
+    def is_pending(self, key: str) -> bool:
+        """Whether the entry was added, updated or deleted since the last save"""
+        return key in self._dirty or key in self._deleted
+
+    def stored(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return an entry's data as it is stored, or None if there is no such entry"""
+        case = self._data.get(key)
+        return case.to_dict() if case is not None else None
+
+    def put_stored(self, key: str, data: Dict[str, Any]) -> None:
+        """Store an entry saved elsewhere without marking it dirty"""
+        self._data[key] = Case.from_dict(key, data)
+
+    def discard_stored(self, key: str) -> None:
+        """Drop an entry deleted elsewhere without recording a delete"""
+        self._data.pop(key, None)
+
+    def records(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (case number, stored data) for every case"""
+        for case in self._data.values():
+            yield case.case_number, case.to_dict()
+
+class LazyCaseMap(TrackedCaseMap):
+    """Case mapping that holds raw stored fields and builds Case objects on access.
+
+    Iteration, ``len()`` and membership tests only touch the keys, so a large
+    file can be loaded without creating a ``Case`` for every entry.
+    """
+
+    def __init__(self, case_type: str):
+        super().__init__()
+        self.case_type = case_type
+        self._type_code = CASE_TYPE_CODES.encode(case_type)
+        # Values are either Case objects or (day code, severity code, stored
+        # date or None) tuples
+        self._data: Dict[str, Union[Case, Tuple[int, int, Optional[str]]]] = {}
+
+    def add_raw(self, case_number: str, data: Dict[str, Any]) -> None:
+        """Store a loaded case without building a Case or marking it dirty"""
+        self._data[case_number] = (
+            DAY_CODES.encode(data['day']),
+            SEVERITY_CODES.encode(data['severity']),
+            data.get('date')
+        )
+
+    def __getitem__(self, key: str) -> Case:
+        value = self._data[key]
+        if isinstance(value, tuple):
+            day_code, severity_code, contact_date = value
+            value = Case.from_codes(key, self._type_code, day_code, severity_code, parse_date(contact_date))
+            self._data[key] = value
+        return value
+
+    def changes(self) -> Tuple[List[Case], List[Case]]:
+        """Return the (upserted, deleted) cases since the map was last marked clean"""
+        return [self[key] for key in self._dirty], list(self._deleted.values())
+
+    def __delitem__(self, key: str) -> None:
+        self[key]  # Materialize so the deleted case can be reported
+        super().__delitem__(key)
+
+    def _raw_data(self, value: Tuple[int, int, Optional[str]]) -> Dict[str, Any]:
+        """Rebuild the stored data of an entry that was never materialized"""
+        day_code, severity_code, contact_date = value
+        data = {
+            'type': self.case_type,
+            'day': DAY_CODES.values[day_code],
+            'severity': SEVERITY_CODES.values[severity_code]
+        }
+        if contact_date:
+            data['date'] = contact_date
+        return data
+
+    def stored(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return an entry's data as it is stored, without materializing it"""
+        value = self._data.get(key)
+        if isinstance(value, tuple):
+            return self._raw_data(value)
+        return value.to_dict() if value is not None else None
+
+    def put_stored(self, key: str, data: Dict[str, Any]) -> None:
+        """Store an entry saved elsewhere without building a Case or marking it dirty"""
+        self.add_raw(key, data)
+
+    def records(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (case number, stored data) without materializing cases"""
+        for case_number, value in self._data.items():
+            if isinstance(value, tuple):
+                yield case_number, self._raw_data(value)
+            else:
+                yield value.case_number, value.to_dict()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.case_type!r}, {len(self)} cases)"
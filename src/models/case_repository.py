@@ -0,0 +1,233 @@
+# src/models/case_repository.py
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+from .case import Case
+from .case_map import TrackedCaseMap
+from ..config import Config
+
+# (case number, case type), the same order the case list hands out selections in
+CaseKey = Tuple[str, str]
+
+class CaseRepository:
+    """In-memory store of all cases, looked up by (case number, case type).
+
+    Cases are held in one TrackedCaseMap per type keyed by case number, so a
+    lookup is two dict hits with no string building. A secondary index maps
+    each case number to the types it exists under; it is built on first use
+    and then kept up to date by every change.
+    """
+
+    def __init__(self, maps: Optional[Dict[str, TrackedCaseMap]] = None):
+        self._maps: Dict[str, TrackedCaseMap] = (
+            maps if maps is not None
+            else {case_type: TrackedCaseMap() for case_type in Config.CASE_TYPES}
+        )
+        self._types_by_number: Optional[Dict[str, Tuple[str, ...]]] = None
+
+    @property
+    def maps(self) -> Dict[str, TrackedCaseMap]:
+        """The per-type case maps, for storage backends"""
+        return self._maps
+
+    def _number_index(self) -> Dict[str, Tuple[str, ...]]:
+        """Return the case number index, building it on first use"""
+        if self._types_by_number is None:
+            index: Dict[str, Tuple[str, ...]] = {}
+            for case_type, case_map in self._maps.items():
+                for case_number in case_map:
+                    index[case_number] = index.get(case_number, ()) + (case_type,)
+            self._types_by_number = index
+        return self._types_by_number
+
+    def _index_add(self, case_number: str, case_type: str) -> None:
+        """Record a new case in the case number index, if it has been built"""
+        if self._types_by_number is not None:
+            types = self._types_by_number.get(case_number, ())
+            self._types_by_number[case_number] = types + (case_type,)
+
+    def _index_remove(self, case_number: str, case_type: str) -> None:
+        """Drop a removed case from the case number index, if it has been built"""
+        if self._types_by_number is not None:
+            types = tuple(t for t in self._types_by_number.get(case_number, ()) if t != case_type)
+            if types:
+                self._types_by_number[case_number] = types
+            else:
+                self._types_by_number.pop(case_number, None)
+
+    def __len__(self) -> int:
+        return sum(len(case_map) for case_map in self._maps.values())
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, tuple) or len(key) != 2:
+            return False
+        case_number, case_type = key
+        case_map = self._maps.get(case_type)
+        return case_map is not None and case_number in case_map
+
+    def __getitem__(self, key: CaseKey) -> Case:
+        case_number, case_type = key
+        return self._maps[case_type][case_number]
+
+    def __iter__(self) -> Iterator[Case]:
+        return self.cases()
+
+    def get(self, case_number: str, case_type: str) -> Optional[Case]:
+        """Return the case, or None if it does not exist"""
+        case_map = self._maps.get(case_type)
+        if case_map is None:
+            return None
+        return case_map.get(case_number)
+
+    def find_by_number(self, case_number: str) -> List[Case]:
+        """Return the case under every type it exists as"""
+        return [
+            self._maps[case_type][case_number]
+            for case_type in self._number_index().get(case_number, ())
+        ]
+
+    def numbers(self, case_type: str) -> Iterator[str]:
+        """Iterate the case numbers of one type without building Case objects"""
+        return iter(self._maps.get(case_type, ()))
+
+    def keys(self, case_type: Optional[str] = None) -> Iterator[CaseKey]:
+        """Iterate keys, optionally restricted to one type"""
+        types = self._maps if case_type is None else (case_type,)
+        for current_type in types:
+            for case_number in self._maps.get(current_type, ()):
+                yield case_number, current_type
+
+    def cases(self, case_type: Optional[str] = None) -> Iterator[Case]:
+        """Iterate cases, optionally restricted to one type"""
+        types = self._maps if case_type is None else (case_type,)
+        for current_type in types:
+            case_map = self._maps.get(current_type)
+            if case_map is not None:
+                yield from case_map.values()
+
+    def query(
+        self,
+        case_type: Optional[str] = None,
+        severity: Optional[str] = None,
+        last_contact_day: Optional[str] = None,
+        case_number: Optional[str] = None
+    ) -> List[Case]:
+        """Return cases matching every filter that is given, ordered by case number.
+
+        A case number is looked up in the case number index and a type picks
+        one map; the other filters are checked on the stored fields, so only
+        matching cases are built.
+        """
+        if case_number is not None:
+            keys: Iterable[CaseKey] = (
+                (case_number, current_type)
+                for current_type in self._number_index().get(case_number, ())
+                if case_type is None or current_type == case_type
+            )
+            records = ((key, self._maps[key[1]].stored(key[0])) for key in keys)
+        else:
+            types = self._maps if case_type is None else (case_type,)
+            records = (
+                ((number, current_type), data)
+                for current_type in types if current_type in self._maps
+                for number, data in self._maps[current_type].records()
+            )
+        matches = sorted(
+            key for key, data in records
+            if (severity is None or data["severity"] == severity)
+            and (last_contact_day is None or data["day"] == last_contact_day)
+        )
+        return [self._maps[current_type][number] for number, current_type in matches]
+
+    def count(self, case_type: str) -> int:
+        """Return the number of cases of one type"""
+        return len(self._maps.get(case_type, ()))
+
+    def upsert(self, case: Case) -> bool:
+        """Add or replace a case; return True if it was new"""
+        case_map = self._maps.get(case.case_type)
+        if case_map is None:
+            case_map = self._maps[case.case_type] = TrackedCaseMap()
+
+        is_new = case.case_number not in case_map
+        case_map[case.case_number] = case
+        if is_new:
+            self._index_add(case.case_number, case.case_type)
+        return is_new
+
+    def delete(self, case_number: str, case_type: str) -> Optional[Case]:
+        """Remove a case and return it, or None if it did not exist"""
+        case_map = self._maps.get(case_type)
+        if case_map is None or case_number not in case_map:
+            return None
+
+        case = case_map.pop(case_number)
+        self._index_remove(case_number, case_type)
+        return case
+
+    def delete_many(self, keys: Iterable[CaseKey]) -> List[Case]:
+        """Remove several cases and return the ones that existed"""
+        deleted = []
+        for case_number, case_type in keys:
+            case = self.delete(case_number, case_type)
+            if case is not None:
+                deleted.append(case)
+        return deleted
+
+    def merge_stored(
+        self,
+        entries: Mapping[CaseKey, Optional[Dict[str, Any]]],
+        complete: bool = False
+    ) -> Tuple[List[CaseKey], List[CaseKey], List[CaseKey]]:
+        """Bring in cases that were saved elsewhere, without marking them as changed.
+
+        ``entries`` maps keys to stored data, or to None for deleted cases;
+        if ``complete`` is set it holds every stored case and cases missing
+        from it are removed as well. Entries equal to what is held already
+        are skipped, and cases with unsaved local changes are left alone.
+        Returns the (inserted, updated, removed) keys.
+        """
+        inserted: List[CaseKey] = []
+        updated: List[CaseKey] = []
+        removed: List[CaseKey] = []
+        for key, data in entries.items():
+            case_number, case_type = key
+            case_map = self._maps.get(case_type)
+            if case_map is None:
+                if data is None:
+                    continue
+                case_map = self._maps[case_type] = TrackedCaseMap()
+            if case_map.is_pending(case_number):
+                continue
+            current = case_map.stored(case_number)
+            if data is None:
+                if current is not None:
+                    case_map.discard_stored(case_number)
+                    self._index_remove(case_number, case_type)
+                    removed.append(key)
+            elif current != data:
+                case_map.put_stored(case_number, data)
+                if current is None:
+                    self._index_add(case_number, case_type)
+                    inserted.append(key)
+                else:
+                    updated.append(key)
+
+        if complete:
+            for case_type, case_map in self._maps.items():
+                missing = [
+                    case_number for case_number in case_map
+                    if (case_number, case_type) not in entries and not case_map.is_pending(case_number)
+                ]
+                for case_number in missing:
+                    case_map.discard_stored(case_number)
+                    self._index_remove(case_number, case_type)
+                    removed.append((case_number, case_type))
+        return inserted, updated, removed
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any case changed since the last save"""
+        return any(case_map.has_changes for case_map in self._maps.values())
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{case_type}={len(case_map)}" for case_type, case_map in self._maps.items())
+        return f"CaseRepository({counts})"
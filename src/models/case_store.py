@@ -0,0 +1,195 @@
+# src/models/case_store.py
+import datetime
+from array import array
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from .case import Case, CASE_TYPE_CODES, DAY_CODES, SEVERITY_CODES
+
+class CaseView:
+    """Lightweight read-only view of one row in a CaseStore"""
+    __slots__ = ('_store', '_key')
+
+    def __init__(self, store: 'CaseStore', key: Tuple[int, str]):
+        self._store = store
+        self._key = key
+
+    @property
+    def _row(self) -> int:
+        return self._store._rows[self._key]
+
+    @property
+    def case_number(self) -> str:
+        return self._key[1]
+
+    @property
+    def case_type(self) -> str:
+        return CASE_TYPE_CODES.values[self._key[0]]
+
+    @property
+    def last_contact_day(self) -> str:
+        return DAY_CODES.values[self._store._days[self._row]]
+
+    @property
+    def severity(self) -> str:
+        return SEVERITY_CODES.values[self._store._severities[self._row]]
+
+    @property
+    def last_contact_date(self) -> Optional[datetime.date]:
+        ordinal = self._store._dates[self._row]
+        return datetime.date.fromordinal(ordinal) if ordinal else None
+
+    @property
+    def unique_id(self) -> str:
+        """Create a unique identifier that combines case number and type"""
+        return f"{self.case_number}_{self.case_type}"
+
+    def to_case(self) -> Case:
+        """Materialize the row as a standalone Case"""
+        row = self._row
+        return Case.from_codes(
+            self._key[1],
+            self._key[0],
+            self._store._days[row],
+            self._store._severities[row],
+            self.last_contact_date
+        )
+
+    def to_dict(self) -> Dict[str, str]:
+        """Convert the row to the stored dictionary format"""
+        return self.to_case().to_dict()
+
+    def __repr__(self) -> str:
+        return f"CaseView({self.case_number!r}, {self.case_type!r})"
+
+class CaseStore:
+    """Columnar in-memory storage for large numbers of cases.
+
+    Cases are kept in parallel ``array`` columns of code table codes, with
+    case numbers in a plain list and last contact dates as date ordinals
+    (0 for cases without a date). Rows are looked up by (type code, case
+    number); removing a case moves the last row into its slot.
+    """
+
+    def __init__(self, cases: Iterable[Case] = ()):
+        self._numbers = []
+        self._types = array('H')
+        self._days = array('H')
+        self._severities = array('H')
+        self._dates = array('l')
+        self._rows: Dict[Tuple[int, str], int] = {}
+        for case in cases:
+            self.add(case)
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def __iter__(self) -> Iterator[CaseView]:
+        for row in range(len(self._numbers)):
+            yield CaseView(self, (self._types[row], self._numbers[row]))
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, tuple) or len(key) != 2:
+            return False
+        case_type, case_number = key
+        code = CASE_TYPE_CODES.codes.get(case_type)
+        return code is not None and (code, case_number) in self._rows
+
+    @staticmethod
+    def _date_ordinal(case: Case) -> int:
+        return case.last_contact_date.toordinal() if case.last_contact_date is not None else 0
+
+    def _columns(self) -> Tuple[array, array, array, array]:
+        return (self._types, self._days, self._severities, self._dates)
+
+    def _truncate(self, length: int) -> None:
+        """Cut every code column back to ``length`` rows"""
+        for column in self._columns():
+            del column[length:]
+
+    def add(self, case: Case) -> CaseView:
+        """Insert or update a case and return a view of its row.
+
+        If a column rejects a value, every column is put back the way it
+        was before the error is raised.
+        """
+        key = (case.type_code, case.case_number)
+        values = (case.type_code, case.day_code, case.severity_code, self._date_ordinal(case))
+        row = self._rows.get(key)
+        if row is None:
+            row = len(self._numbers)
+            try:
+                for column, value in zip(self._columns(), values):
+                    column.append(value)
+            except BaseException:
+                self._truncate(row)
+                raise
+            self._numbers.append(case.case_number)
+            self._rows[key] = row
+        else:
+            previous = [column[row] for column in self._columns()]
+            try:
+                for column, value in zip(self._columns(), values):
+                    column[row] = value
+            except BaseException:
+                for column, value in zip(self._columns(), previous):
+                    column[row] = value
+                raise
+        return CaseView(self, key)
+
+    def get(self, case_type: str, case_number: str) -> Optional[CaseView]:
+        """Return a view of the case, or None if it is not stored"""
+        code = CASE_TYPE_CODES.codes.get(case_type)
+        if code is None or (code, case_number) not in self._rows:
+            return None
+        return CaseView(self, (code, case_number))
+
+    def remove(self, case_type: str, case_number: str) -> bool:
+        """Remove a case; return False if it was not stored"""
+        code = CASE_TYPE_CODES.codes.get(case_type)
+        row = self._rows.pop((code, case_number), None)
+        if row is None:
+            return False
+
+        last = len(self._numbers) - 1
+        removed = [column[row] for column in self._columns()]
+        moved = [column[last] for column in self._columns()]
+        try:
+            # Move the last row into the freed slot, then drop the last row
+            for column, value in zip(self._columns(), moved):
+                column[row] = value
+            self._truncate(last)
+        except BaseException:
+            for column, value, last_value in zip(self._columns(), removed, moved):
+                if len(column) == last:
+                    column.append(last_value)
+                column[row] = value
+            self._rows[(code, case_number)] = row
+            raise
+
+        number = self._numbers.pop()
+        if row != last:
+            self._numbers[row] = number
+            self._rows[(self._types[row], number)] = row
+        return True
+
+    def columns(self):
+        """Return (day, severity, type) code columns as NumPy arrays.
+
+        The arrays are copies, so they stay valid after the store changes
+        and never pin its buffers; they can be passed straight to
+        ``BatchScheduleCalculator.calculate``.
+        """
+        import numpy as np
+        return (
+            np.array(self._days, dtype=np.uint16),
+            np.array(self._severities, dtype=np.uint16),
+            np.array(self._types, dtype=np.uint16)
+        )
+
+    def date_column(self):
+        """Return last contact dates as a NumPy array of date ordinals, 0 where unset.
+
+        Like ``columns``, the array is a copy; it can be passed to
+        ``BatchScheduleCalculator.calculate_dates``.
+        """
+        import numpy as np
+        return np.array(self._dates, dtype=np.dtype(f"i{self._dates.itemsize}"))
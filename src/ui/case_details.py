@@ -1,9 +1,11 @@
 # src/ui/case_details.py
+import datetime
 import tkinter as tk
 from tkinter import ttk
 from typing import Callable, Optional
 from ..models.case import Case
 from ..config import Config
+from ..utils.scheduler import ScheduleCalculator
 
 class CaseDetailsFrame(ttk.LabelFrame):
     """Frame containing the case details form"""
@@ -60,6 +62,19 @@ class CaseDetailsFrame(ttk.LabelFrame):
         self.day_combobox.pack(side=tk.LEFT, padx=10)
         self.day_combobox.bind("<<ComboboxSelected>>", self.on_field_change)
 
+        # Last Contact Date (optional; schedules then use calendar dates)
+        date_frame = ttk.Frame(self)
+        date_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(date_frame, text="Last Contact Date:").pack(side=tk.LEFT)
+        self.date_var = tk.StringVar()
+        self.date_entry = ttk.Entry(date_frame, textvariable=self.date_var, width=15)
+        self.date_entry.pack(side=tk.LEFT, padx=10)
+        ttk.Label(date_frame, text="YYYY-MM-DD, optional").pack(side=tk.LEFT)
+        self.date_var.trace_add("write", self._on_date_change)
+        # Says why a complete date cannot be used
+        self.date_error = ttk.Label(self, style='danger.TLabel', wraplength=300)
+        self.date_error.pack(fill=tk.X)
+
         # Severity Level
         severity_frame = ttk.Frame(self)
         severity_frame.pack(fill=tk.X, pady=5)
@@ -106,21 +121,58 @@ class CaseDetailsFrame(ttk.LabelFrame):
             wrap=tk.WORD,
             state=tk.DISABLED
         )
+        self._shown_result = ""
         self.result_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=(0, 10))
 
+    def get_contact_date(self) -> Optional[datetime.date]:
+        """Parse the date field; None if it is empty or not a weekday that can be scheduled.
+
+        A complete date that cannot be used gets an error message under the field.
+        """
+        message = ""
+        try:
+            contact_date = datetime.date.fromisoformat(self.date_var.get().strip())
+        except ValueError:
+            contact_date = None  # Empty, or still being typed
+        if contact_date is not None:
+            if contact_date.weekday() >= len(Config.WEEKDAYS):
+                message = f"{contact_date} is not a weekday"
+            else:
+                try:
+                    ScheduleCalculator.check_contact_date(contact_date)
+                except ValueError as error:
+                    message = str(error)
+            if message:
+                contact_date = None
+        self.date_error.config(text=message)
+        return contact_date
+
+    def _on_date_change(self, *args) -> None:
+        """Match the day to a valid date, then recalculate"""
+        contact_date = self.get_contact_date()
+        if contact_date is not None:
+            self.day_combobox.set(Config.WEEKDAYS[contact_date.weekday()])
+        self.on_field_change()
+
     def get_form_data(self) -> Optional[Case]:
         """Get the current form data as a Case object"""
         case_number = self.case_entry.get()
         case_type = self.type_var.get()
         day = self.day_combobox.get()
         severity = self.severity_var.get()
+        contact_date = self.get_contact_date()
+        if self.date_var.get().strip() and contact_date is None:
+            return None  # A date was typed but is not valid (yet)
+        if contact_date is not None:
+            day = Config.WEEKDAYS[contact_date.weekday()]
         
         if all([case_number, case_type, day, severity]):
             return Case(
                 case_number=case_number,
                 case_type=case_type,
                 last_contact_day=day,
-                severity=severity
+                severity=severity,
+                last_contact_date=contact_date
             )
         return None
 
@@ -130,21 +182,38 @@ class CaseDetailsFrame(ttk.LabelFrame):
         self.case_entry.insert(0, case.case_number)
         self.type_var.set(case.case_type)
         self.day_combobox.set(case.last_contact_day)
+        self.date_var.set(case.last_contact_date.isoformat() if case.last_contact_date is not None else '')
         self.severity_var.set(case.severity)
 
     def show_result(self, result: str) -> None:
-        """Display the calculation result"""
+        """Display the calculation result, leaving the Text alone if it already shows it"""
+        if result == self._shown_result:
+            return
+        self._shown_result = result
         self.result_text.config(state=tk.NORMAL)
         self.result_text.delete(1.0, tk.END)
         self.result_text.insert(tk.END, result)
         self.result_text.config(state=tk.DISABLED)
 
+    def set_editable(self, editable: bool) -> None:
+        """Enable or disable every input and button in the form"""
+        state = ['!disabled'] if editable else ['disabled']
+        widgets = list(self.winfo_children())
+        while widgets:
+            widget = widgets.pop()
+            widgets.extend(widget.winfo_children())
+            # Comboboxes are Entry subclasses and keep their readonly flag
+            if isinstance(widget, (ttk.Entry, ttk.Radiobutton, ttk.Button)):
+                widget.state(state)
+
     def clear_form(self) -> None:
         """Clear all form fields"""
         self.case_entry.delete(0, tk.END)
         self.type_var.set('')
         self.day_combobox.set('')
+        self.date_var.set('')
         self.severity_var.set('')
+        self._shown_result = ""
         self.result_text.config(state=tk.NORMAL)
         self.result_text.delete(1.0, tk.END)
         self.result_text.config(state=tk.DISABLED)
\ No newline at end of file
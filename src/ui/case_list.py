@@ -1,13 +1,17 @@
 # src/ui/case_list.py
 import tkinter as tk
 from tkinter import ttk
-from ttkbootstrap.dialogs import Messagebox
-from typing import Callable, Dict
-from ..models.case import Case
+from typing import Callable, Dict, Iterable, Optional
+from ..models.case_repository import CaseKey, CaseRepository
+from ..config import Config
+from ..utils.agenda import EVENTS
+from .virtual_list import VirtualListbox
 
 class CaseListFrame(ttk.LabelFrame):
     """Frame containing the case list with search functionality"""
     
+    SEARCH_DELAY_MS = 150  # Wait this long after the last keystroke before searching
+    
     def __init__(
         self, 
         parent: ttk.Frame,
@@ -15,17 +19,27 @@ class CaseListFrame(ttk.LabelFrame):
         view_case_callback: Callable,
         edit_case: Callable,
         delete_cases: Callable,
+        agenda_query: Optional[Callable] = None,
+        search_query: Optional[Callable] = None,
         **kwargs
     ):
         super().__init__(parent, text="Cases", **kwargs)
         self.parent = parent  # This should be the MainWindow instance
         self.on_case_select = on_case_select
-        self.view_case = view_case_callback  # This should be a method that accepts selected_case
+        self.view_case = view_case_callback  # Called with a list of (case number, case type) keys
         self.edit_case = edit_case
         self.delete_cases = delete_cases
+        self.agenda_query = agenda_query  # Called as agenda_query(day, event) -> [(event, key)]
+        self.search_query = search_query  # Called as search_query(term, case_type) -> [case_number]
+        self._cases: Optional[CaseRepository] = None
+        self._search_job: Optional[str] = None
+        self._applied_term = ""
+        self._loading = False
         
         self._create_search_frame()
         self._create_notebook()
+        self._create_agenda_tab()
+        self._create_progress_frame()
         
     def _create_search_frame(self) -> None:
         """Create the search frame with search entry and buttons"""
@@ -45,19 +59,21 @@ class CaseListFrame(ttk.LabelFrame):
         right_frame = ttk.Frame(search_frame)
         right_frame.pack(side=tk.RIGHT)
         
-        ttk.Button(
+        self.view_button = ttk.Button(
             right_frame, 
             text="View Selected",
             command=self._view_selected,
             style='primary.TButton'
-        ).pack(side=tk.LEFT, padx=2)
+        )
+        self.view_button.pack(side=tk.LEFT, padx=2)
         
-        ttk.Button(
+        self.delete_button = ttk.Button(
             right_frame, 
             text="Delete Selected",
             command=self._delete_selected,
             style='danger.TButton'
-        ).pack(side=tk.LEFT, padx=2)
+        )
+        self.delete_button.pack(side=tk.LEFT, padx=2)
 
     def _create_notebook(self) -> None:
         """Create notebook with separate tabs for follow-ups and strikes"""
@@ -68,70 +84,215 @@ class CaseListFrame(ttk.LabelFrame):
         followup_frame = ttk.Frame(self.notebook)
         strike_frame = ttk.Frame(self.notebook)
         
-        # Create listboxes with improved styling and multi-select
-        self.followup_listbox = tk.Listbox(
-            followup_frame, 
-            height=20,
-            selectmode=tk.EXTENDED,  # Changed to allow multi-select
-            activestyle='none',
-            font=('TkDefaultFont', 10),
-            borderwidth=0,
-            highlightthickness=1
+        # Create virtualized lists with improved styling and multi-select;
+        # only the visible rows exist as listbox items
+        self.followup_listbox = VirtualListbox(
+            followup_frame,
+            on_double_click=self._on_double_click
         )
         self.followup_listbox.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        self.strike_listbox = tk.Listbox(
-            strike_frame, 
-            height=20,
-            selectmode=tk.EXTENDED,  # Changed to allow multi-select
-            activestyle='none',
-            font=('TkDefaultFont', 10),
-            borderwidth=0,
-            highlightthickness=1
+        self.strike_listbox = VirtualListbox(
+            strike_frame,
+            on_double_click=self._on_double_click
         )
         self.strike_listbox.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Bind events
-        self.followup_listbox.bind('<Double-Button-1>', self._on_double_click)
-        self.strike_listbox.bind('<Double-Button-1>', self._on_double_click)
-        
         # Add frames to notebook
         self.notebook.add(followup_frame, text="Follow-ups")
         self.notebook.add(strike_frame, text="Strikes")
 
-    def refresh_case_list(self, cases: Dict[str, Dict[str, Case]]) -> None:
-        """Refresh the case lists with current data"""
-        self.followup_listbox.delete(0, tk.END)
-        self.strike_listbox.delete(0, tk.END)
+    def _create_agenda_tab(self) -> None:
+        """Create the tab listing what is due on a chosen weekday"""
+        self.agenda_frame = ttk.Frame(self.notebook)
         
-        # Show unique case numbers for each type
-        for case in cases["Follow-ups"].values():
-            self.followup_listbox.insert(tk.END, case.case_number)
-            
-        for case in cases["Strikes"].values():
-            self.strike_listbox.insert(tk.END, case.case_number)
+        filter_frame = ttk.Frame(self.agenda_frame)
+        filter_frame.pack(fill=tk.X, padx=5, pady=(5, 0))
+        
+        ttk.Label(filter_frame, text="Day:").pack(side=tk.LEFT)
+        self.agenda_day_combobox = ttk.Combobox(
+            filter_frame,
+            values=Config.WEEKDAYS,
+            state="readonly",
+            width=15
+        )
+        self.agenda_day_combobox.set(Config.WEEKDAYS[0])
+        self.agenda_day_combobox.pack(side=tk.LEFT, padx=(5, 15))
+        
+        ttk.Label(filter_frame, text="Event:").pack(side=tk.LEFT)
+        self.agenda_event_combobox = ttk.Combobox(
+            filter_frame,
+            values=["All", *EVENTS],
+            state="readonly",
+            width=12
+        )
+        self.agenda_event_combobox.set("All")
+        self.agenda_event_combobox.pack(side=tk.LEFT, padx=5)
+        
+        self.agenda_tree = ttk.Treeview(
+            self.agenda_frame,
+            columns=("event", "case", "type"),
+            show="headings",
+            selectmode=tk.EXTENDED
+        )
+        for column, heading in zip(("event", "case", "type"), ("Event", "Case", "Type")):
+            self.agenda_tree.heading(column, text=heading)
+        self.agenda_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Tree item id -> case key of that row
+        self._agenda_keys: Dict[str, CaseKey] = {}
+        
+        self.agenda_day_combobox.bind("<<ComboboxSelected>>", lambda event: self.refresh_agenda())
+        self.agenda_event_combobox.bind("<<ComboboxSelected>>", lambda event: self.refresh_agenda())
+        self.agenda_tree.bind('<Double-Button-1>', self._on_double_click)
+        
+        self.notebook.add(self.agenda_frame, text="Agenda")
 
-    def _on_search(self) -> None:
-        """Handle search functionality"""
-        search_term = self.search_entry.get().lower()
-        current_tab = self.notebook.select()
-        listbox = (
-            self.followup_listbox 
-            if "followup" in str(current_tab) 
-            else self.strike_listbox
+    def _create_progress_frame(self) -> None:
+        """Create the loading progress bar, shown while cases load"""
+        self.progress_frame = ttk.Frame(self)
+        self.progress_label = ttk.Label(self.progress_frame, text="Loading cases...")
+        self.progress_label.pack(side=tk.LEFT)
+        self.progress_bar = ttk.Progressbar(
+            self.progress_frame,
+            mode='determinate',
+            maximum=1.0,
+            style='info.Striped.Horizontal.TProgressbar'
         )
+        self.progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+
+    def start_loading(self) -> None:
+        """Show the progress bar and disable the controls that need loaded cases"""
+        self._loading = True
+        self.progress_bar['value'] = 0.0
+        self.progress_frame.pack(fill=tk.X, padx=10, pady=(10, 0), before=self.notebook)
+        for widget in (self.search_entry, self.view_button, self.delete_button):
+            widget.state(['disabled'])
+
+    def add_loaded(self, keys: Iterable[CaseKey], fraction: float) -> None:
+        """Add a chunk of freshly loaded cases to the lists and update progress"""
+        listboxes = {"Follow-ups": self.followup_listbox, "Strikes": self.strike_listbox}
+        numbers: Dict[str, list] = {case_type: [] for case_type in listboxes}
+        for case_number, case_type in keys:
+            if case_type in numbers:
+                numbers[case_type].append(case_number)
+        for case_type, listbox in listboxes.items():
+            listbox.add_items(numbers[case_type])
+        self.progress_bar['value'] = fraction
+        self.progress_label.config(
+            text=f"Loading cases... {self.followup_listbox.size() + self.strike_listbox.size():,}"
+        )
+
+    def show_load_error(self, message: str) -> None:
+        """Leave the controls disabled and show why loading stopped"""
+        self.progress_label.config(text=message)
+
+    def finish_loading(self, cases: CaseRepository) -> None:
+        """Hide the progress bar, show every loaded case and enable the controls"""
+        self._loading = False
+        self.progress_frame.pack_forget()
+        for widget in (self.search_entry, self.view_button, self.delete_button):
+            widget.state(['!disabled'])
+        self.refresh_case_list(cases)
+        self.refresh_agenda()
+
+    def _is_agenda_tab(self) -> bool:
+        """Check whether the agenda tab is the one being shown"""
+        return self.notebook.select() == str(self.agenda_frame)
+
+    def refresh_agenda(self) -> None:
+        """Show the agenda entries for the chosen day and event"""
+        self.agenda_tree.delete(*self.agenda_tree.get_children())
+        self._agenda_keys.clear()
+        if self.agenda_query is None:
+            return
         
-        listbox.delete(0, tk.END)
-        for item in self._get_all_items(listbox):
-            if search_term in item.lower():
-                listbox.insert(tk.END, item)
+        event_filter = self.agenda_event_combobox.get()
+        entries = self.agenda_query(
+            self.agenda_day_combobox.get(),
+            None if event_filter == "All" else event_filter
+        )
+        for event, (case_number, case_type) in entries:
+            item = self.agenda_tree.insert("", tk.END, values=(event, case_number, case_type))
+            self._agenda_keys[item] = (case_number, case_type)
+
+    def refresh_case_list(self, cases: CaseRepository) -> None:
+        """Refresh the case lists with current data, keeping any search filter"""
+        self._cases = cases
+        self._show_matches(self._applied_term)
 
-    def _get_all_items(self, listbox: tk.Listbox) -> list:
-        """Get all items from a listbox"""
-        return [listbox.get(i) for i in range(listbox.size())]
+    def apply_changes(
+        self,
+        inserted: Iterable[CaseKey] = (),
+        updated: Iterable[CaseKey] = (),
+        removed: Iterable[CaseKey] = ()
+    ) -> None:
+        """Apply added and removed cases to the lists without rebuilding them.
+
+        Rows only show case numbers, so updated cases need no list change.
+        Scroll position and selection are preserved.
+        """
+        listboxes = {"Follow-ups": self.followup_listbox, "Strikes": self.strike_listbox}
+        term = self._applied_term.lower()
+        
+        for case_number, case_type in removed:
+            listbox = listboxes.get(case_type)
+            if listbox is not None:
+                listbox.remove_item(case_number)
+        
+        added: dict = {}
+        for case_number, case_type in inserted:
+            # Respect an active search filter
+            if case_type in listboxes and term in case_number.lower():
+                added.setdefault(case_type, []).append(case_number)
+        for case_type, numbers in added.items():
+            if len(numbers) == 1:
+                listboxes[case_type].insert_item(numbers[0])
+            else:
+                # A bulk import: merge the whole batch in one pass
+                listboxes[case_type].add_items(numbers)
+
+    def _matching_numbers(self, term: str, case_type: str) -> list:
+        """Return the sorted case numbers of a type that match the search term"""
+        if not term:
+            return sorted(self._cases.numbers(case_type))
+        if self.search_query is not None:
+            return self.search_query(term, case_type)
+        term = term.lower()
+        return sorted(number for number in self._cases.numbers(case_type) if term in number.lower())
+
+    def _show_matches(self, term: str) -> None:
+        """Fill both lists with the case numbers that match ``term``"""
+        if self._cases is None:
+            return
+        
+        for listbox, case_type in (
+            (self.followup_listbox, "Follow-ups"),
+            (self.strike_listbox, "Strikes")
+        ):
+            listbox.set_items(self._matching_numbers(term, case_type))
+
+    def _on_search(self, event=None) -> None:
+        """Restart the search timer so the search runs once typing pauses"""
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(self.SEARCH_DELAY_MS, self._run_search)
+
+    def _run_search(self) -> None:
+        """Filter the lists by the current search term"""
+        self._search_job = None
+        term = self.search_entry.get().strip()
+        if term == self._applied_term:
+            return  # e.g. arrow keys or modifiers: nothing to redo
+        self._applied_term = term
+        self._show_matches(term)
 
     def get_selected_case(self) -> tuple[str, str]:
         """Get the currently selected case number and type"""
+        if self._is_agenda_tab():
+            selected_cases = self.get_selected_cases()
+            return selected_cases[0] if selected_cases else (None, None)
+        
         current_tab = self.notebook.index(self.notebook.select())
         listbox = (
             self.followup_listbox 
@@ -140,33 +301,39 @@ class CaseListFrame(ttk.LabelFrame):
         )
         case_type = Config.CASE_TYPES[current_tab]
         
-        selection = listbox.curselection()
+        selection = listbox.selected_items()
         if not selection:
             return None, None
             
-        case_number = listbox.get(selection[0])
+        case_number = selection[0]
         return case_number, case_type
 
     def _on_double_click(self, event) -> None:
         """Handle double-click on a case in the list"""
+        if self._loading:
+            return
         selected_case = self.get_selected_case()
         if selected_case:
-            self.view_case(selected_case)
+            self.view_case([selected_case])
 
     def get_selected_cases(self) -> list[tuple[str, str]]:
         """Get all selected cases numbers and types"""
+        if self._is_agenda_tab():
+            # A case can appear on several rows; list it once
+            keys = (self._agenda_keys[item] for item in self.agenda_tree.selection())
+            return list(dict.fromkeys(keys))
+        
         current_tab = self.notebook.index(self.notebook.select())
         listbox = self.followup_listbox if current_tab == 0 else self.strike_listbox
         case_type = Config.CASE_TYPES[current_tab]
         
-        selected_indices = listbox.curselection()
-        return [(listbox.get(idx), case_type) for idx in selected_indices]
+        return [(case_number, case_type) for case_number in listbox.selected_items()]
 
     def _view_selected(self) -> None:
-        """View the selected cases"""
-        selected_cases = self.get_selected_cases()  # Get all selected cases
-        for selected_case in selected_cases:
-            self.view_case(selected_case)  # Call view_case for each selected case
+        """View the selected cases in one window that pages through them"""
+        selected_cases = self.get_selected_cases()
+        if selected_cases:
+            self.view_case(selected_cases)
 
     def _delete_selected(self) -> None:
         """Delete all selected cases with custom styled confirmation dialog"""
@@ -187,7 +354,8 @@ class CaseListFrame(ttk.LabelFrame):
                     "This action cannot be undone."
                 )
             
-            # Create custom messagebox
+            # Create custom messagebox; the dialogs module is only needed here
+            from ttkbootstrap.dialogs import Messagebox
             dialog = Messagebox.show_question(
                 title=title,
                 message=msg,
@@ -212,7 +380,6 @@ class CaseListFrame(ttk.LabelFrame):
 from tkinter import ttk
 from typing import Optional
 from ..models.case import Case
-from ..config import Config
 
 class CaseDetailsFrame(ttk.LabelFrame):
     """Frame containing the case details form"""
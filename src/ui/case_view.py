@@ -3,122 +3,219 @@ import tkinter as tk
 from tkinter import ttk
 import ttkbootstrap as tb
 from ..models.case import Case
+from ..models.case_repository import CaseKey
 from ..utils.scheduler import ScheduleCalculator
-from typing import Callable
+from typing import Callable, List, Optional, Sequence
 
 class CaseViewDialog:
-    """Dialog window for viewing case details"""
-    
-    def __init__(self, parent: tk.Tk, case: Case, edit_callback: Callable = None):
+    """Reusable window for viewing case details, paging through a selection.
+
+    The window and its widgets are created once. ``show`` replaces the
+    selection and only the case on screen is looked up and rendered, so
+    opening 300 selected cases costs the same as opening one. Closing the
+    window hides it for the next ``show``.
+    """
+
+    def __init__(
+        self,
+        parent: tk.Tk,
+        get_case: Callable[[str, str], Optional[Case]],
+        edit_callback: Callable = None
+    ):
         self.popup = tb.Toplevel(parent)
         self.parent = parent
-        self.case = case
+        self.get_case = get_case
         self.edit_callback = edit_callback
-        
-        self.popup.title(f"Case Details - {case.case_number}")
+        self.case: Optional[Case] = None
+        self._keys: List[CaseKey] = []
+        self._index = 0
+
         self.popup.geometry("400x600")
-        
+
         # Make the window resizable
         self.popup.resizable(True, True)
-        
+        self.popup.protocol("WM_DELETE_WINDOW", self.hide)
+        self.popup.bind("<Left>", lambda event: self.previous())
+        self.popup.bind("<Right>", lambda event: self.next())
+
         # Configure grid weights for dynamic resizing
         self.popup.grid_columnconfigure(0, weight=1)
         self.popup.grid_rowconfigure(0, weight=1)
-        
-        self._create_content(case)
-        
-    def _create_content(self, case: Case) -> None:
-        """Create the dialog content"""
+
+        self._create_content()
+
+    def _create_content(self) -> None:
+        """Create the dialog widgets, filled in by _render"""
         # Main container with grid
         content = ttk.Frame(self.popup, padding="20")
         content.grid(row=0, column=0, sticky="nsew")
-        
+
         # Configure grid weights
         content.grid_columnconfigure(0, weight=1)
-        content.grid_rowconfigure(4, weight=1)  # Make schedule frame expandable
-        
+        content.grid_rowconfigure(5, weight=1)  # Make schedule frame expandable
+
+        # Paging through the selection
+        nav_frame = ttk.Frame(content)
+        nav_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
+        nav_frame.grid_columnconfigure(1, weight=1)
+        self.previous_button = ttk.Button(
+            nav_frame,
+            text="◀ Previous",
+            command=self.previous,
+            style='secondary-outline.TButton'
+        )
+        self.previous_button.grid(row=0, column=0)
+        self.position_label = ttk.Label(nav_frame, anchor="center")
+        self.position_label.grid(row=0, column=1, sticky="ew")
+        self.next_button = ttk.Button(
+            nav_frame,
+            text="Next ▶",
+            command=self.next,
+            style='secondary-outline.TButton'
+        )
+        self.next_button.grid(row=0, column=2)
+
         # Case details - using grid instead of pack
-        ttk.Label(
-            content,
-            text=f"Case Number: {case.case_number}",
-            font=("", 12, "bold")
-        ).grid(row=0, column=0, sticky="w", pady=(5,15))
-        
-        ttk.Label(
-            content,
-            text=f"Type: {case.case_type}",
-            font=("", 10)
-        ).grid(row=1, column=0, sticky="w", pady=5)
-        
-        ttk.Label(
-            content,
-            text=f"Last Contact Day: {case.last_contact_day}",
-            font=("", 10)
-        ).grid(row=2, column=0, sticky="w", pady=5)
-        
-        ttk.Label(
-            content,
-            text=f"Severity Level: {case.severity}",
-            font=("", 10)
-        ).grid(row=3, column=0, sticky="w", pady=5)
-        
+        self.number_label = ttk.Label(content, font=("", 12, "bold"))
+        self.number_label.grid(row=1, column=0, sticky="w", pady=(5,15))
+
+        self.type_label = ttk.Label(content, font=("", 10))
+        self.type_label.grid(row=2, column=0, sticky="w", pady=5)
+
+        self.day_label = ttk.Label(content, font=("", 10))
+        self.day_label.grid(row=3, column=0, sticky="w", pady=5)
+
+        self.severity_label = ttk.Label(content, font=("", 10))
+        self.severity_label.grid(row=4, column=0, sticky="w", pady=5)
+
         # Schedule frame
         schedule_frame = ttk.LabelFrame(content, text="Schedule", padding="10")
-        schedule_frame.grid(row=4, column=0, sticky="nsew", pady=(20,10))
-        
+        schedule_frame.grid(row=5, column=0, sticky="nsew", pady=(20,10))
+
         # Configure schedule frame grid
         schedule_frame.grid_columnconfigure(0, weight=1)
         schedule_frame.grid_rowconfigure(0, weight=1)
-        
+
         # Schedule text widget
-        schedule_text = tk.Text(
-            schedule_frame, 
+        self.schedule_text = tk.Text(
+            schedule_frame,
             wrap=tk.WORD,
             font=('TkDefaultFont', 10),
             padx=10,
-            pady=10
+            pady=10,
+            state=tk.DISABLED
         )
-        schedule_text.grid(row=0, column=0, sticky="nsew")
-        
+        self.schedule_text.grid(row=0, column=0, sticky="nsew")
+
         # Add scrollbar
-        scrollbar = ttk.Scrollbar(schedule_frame, orient="vertical", command=schedule_text.yview)
+        scrollbar = ttk.Scrollbar(schedule_frame, orient="vertical", command=self.schedule_text.yview)
         scrollbar.grid(row=0, column=1, sticky="ns")
-        schedule_text.configure(yscrollcommand=scrollbar.set)
-        
-        # Calculate and display schedule
-        schedule = ScheduleCalculator.format_schedule(case)
-        schedule_text.insert("1.0", schedule)
-        schedule_text.config(state=tk.DISABLED)
-        
+        self.schedule_text.configure(yscrollcommand=scrollbar.set)
+
         # Button frame at the bottom
         button_frame = ttk.Frame(content)
-        button_frame.grid(row=5, column=0, sticky="ew", pady=(10,0))
-        
+        button_frame.grid(row=6, column=0, sticky="ew", pady=(10,0))
+
         # Configure button frame columns
         button_frame.grid_columnconfigure(0, weight=1)  # Center spacing
         button_frame.grid_columnconfigure(1, weight=1)  # Center spacing
 
         # Edit button
+        self.edit_button = None
         if self.edit_callback:
-            ttk.Button(
+            self.edit_button = ttk.Button(
                 button_frame,
                 text="Edit",
                 command=self._edit_case,
                 style='info.TButton',
                 width=15
-            ).grid(row=0, column=0, padx=5)
+            )
+            self.edit_button.grid(row=0, column=0, padx=5)
 
         # Close button
         ttk.Button(
             button_frame,
             text="Close",
-            command=self.popup.destroy,
+            command=self.hide,
             style='danger.TButton',  # Set style to pink
             width=15
         ).grid(row=0, column=1, padx=5)
 
+    def exists(self) -> bool:
+        """Whether the window has not been destroyed"""
+        return bool(self.popup.winfo_exists())
+
+    def show(self, keys: Sequence[CaseKey], index: int = 0) -> None:
+        """Page through ``keys``, starting at ``index``, and bring the window up"""
+        self._keys = list(keys)
+        self._index = min(max(index, 0), max(len(self._keys) - 1, 0))
+        self._render()
+        self.popup.deiconify()
+        self.popup.lift()
+        self.popup.focus_set()
+
+    def hide(self) -> None:
+        """Hide the window and drop the selection; it is reused by the next show"""
+        self.popup.withdraw()
+        self._keys = []
+        self.case = None
+
+    def refresh(self) -> None:
+        """Render the case on screen again, e.g. after it changed elsewhere"""
+        if self._keys:
+            self._render()
+
+    def previous(self) -> None:
+        if self._index > 0:
+            self._index -= 1
+            self._render()
+
+    def next(self) -> None:
+        if self._index < len(self._keys) - 1:
+            self._index += 1
+            self._render()
+
+    def _render(self) -> None:
+        """Fill the widgets with the case at the current position"""
+        total = len(self._keys)
+        self.position_label.config(text=f"{self._index + 1} of {total}" if total > 1 else "")
+        self.previous_button.state(['!disabled'] if self._index > 0 else ['disabled'])
+        self.next_button.state(['!disabled'] if self._index < total - 1 else ['disabled'])
+
+        # Cases are looked up as they are shown, so a selection can be
+        # paged through even if some cases were deleted in the meantime
+        self.case = self.get_case(*self._keys[self._index]) if total else None
+        case = self.case
+        if case is None:
+            case_number = self._keys[self._index][0] if total else ""
+            self.popup.title(f"Case Details - {case_number}")
+            self.number_label.config(text=f"Case Number: {case_number}")
+            for label in (self.type_label, self.day_label, self.severity_label):
+                label.config(text="")
+            schedule = "This case no longer exists."
+        else:
+            self.popup.title(f"Case Details - {case.case_number}")
+            self.number_label.config(text=f"Case Number: {case.case_number}")
+            self.type_label.config(text=f"Type: {case.case_type}")
+            self.day_label.config(
+                text=(
+                    f"Last Contact Date: {ScheduleCalculator.format_date(case.last_contact_date)}"
+                    if case.last_contact_date is not None
+                    else f"Last Contact Day: {case.last_contact_day}"
+                )
+            )
+            self.severity_label.config(text=f"Severity Level: {case.severity}")
+            schedule = ScheduleCalculator.format_schedule(case)
+        if self.edit_button is not None:
+            self.edit_button.state(['!disabled'] if case is not None else ['disabled'])
+
+        self.schedule_text.config(state=tk.NORMAL)
+        self.schedule_text.delete("1.0", tk.END)
+        self.schedule_text.insert("1.0", schedule)
+        self.schedule_text.config(state=tk.DISABLED)
+
     def _edit_case(self):
         """Handle edit case action"""
-        if self.edit_callback:
+        if self.edit_callback and self.case is not None:
             self.edit_callback(self.case)
-            self.popup.destroy()
\ No newline at end of file
+            self.hide()
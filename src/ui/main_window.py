@@ -1,47 +1,113 @@
 # src/ui/main_window.py
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk
+from typing import Optional
 import ttkbootstrap as tb
 from ..models.case import Case
+from ..models.case_repository import CaseRepository
 from ..config import Config
-from ..utils.storage import StorageManager
+from ..utils.storage import ExternalChanges, StorageManager
+from ..utils.save_worker import SaveWorker
 from ..utils.scheduler import ScheduleCalculator
+from ..utils.agenda import AgendaIndex
+from ..utils.case_io import ImportResult, detect_format, export_cases, import_cases, write_error_report
+from ..utils.search import CaseSearchIndex
 from .case_list import CaseListFrame
 from .case_details import CaseDetailsFrame
-from .case_view import CaseViewDialog
+from .update_scheduler import UpdateScheduler
+from ..utils.startup import StartupProfiler
+from ..utils.instrumentation import Instrumentation, instrumented
 
 class MainWindow:
     """Main application window"""
     
     def __init__(self):
-        # Initialize the dark theme flag
-        self.is_dark = True  # Set initial theme to dark
+        # Initialize the dark theme flag from the configured theme
+        self.is_dark = Config.DEFAULT_THEME == Config.DARK_THEME
         
-        # Check if StorageManager.load_cases() is functioning correctly
-        self.cases = StorageManager.load_cases()  # Ensure this does not raise an error
-        
-        # Ensure tb.Window is initialized correctly
-        self.root = tb.Window(themename=Config.DEFAULT_THEME)  # Check Config.DEFAULT_THEME
+        # Create the window first; cases are loaded in the background once it is up.
+        # Only the starting theme is built here; the other is built on first toggle.
+        self.root = tb.Window(themename=Config.DEFAULT_THEME)
+        StartupProfiler.mark("window created")
         
         self.root.title("Schedule Calculator")
         self.root.geometry("1200x800")
         
+        # Empty until the background load finishes
+        self.cases = CaseRepository()
+        self.agenda = AgendaIndex()
+        self.search_index = CaseSearchIndex()
+        # Saves are written on a background thread so editing never waits on disk
+        # (looked up on each call so instrumentation can wrap write_changes)
+        self.save_worker = SaveWorker(lambda changes: StorageManager.write_changes(changes))
+        # Case viewer window, created on first use and reused after that
+        self.case_viewer = None
+        # Form changes within one event-loop tick are recalculated once;
+        # the last schedule is kept to skip recalculating unchanged inputs
+        self.updates = UpdateScheduler(self.root)
+        self._schedule_inputs: Optional[tuple] = None
+        self._schedule_text = ""
+        # Changes saved by other instances sharing the files are read on a
+        # worker thread; _saves tells whether a save happened meanwhile
+        self._sync_queue: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._syncing = False
+        self._saves = 0
+        
         self._create_theme_toggle()
         self._create_main_frame()
+        StartupProfiler.mark("widgets built")
+
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.after(Config.SAVE_ERROR_POLL_MS, self._poll_save_errors)
         
-        # Set the initial theme correctly
-        self.root.style.theme_use("solar")  # Set initial theme to dark
-        self.theme_button.config(text="🌙 Light Theme")  # Set the button text correctly
+        self._start_loading()
+        self.root.after_idle(StartupProfiler.mark, "window shown")
 
     def _create_theme_toggle(self) -> None:
-        """Create the theme toggle button"""
+        """Create the toolbar with the import, export, theme, verbose logging and stats buttons"""
+        toolbar = ttk.Frame(self.root)
+        toolbar.pack(fill=tk.X, padx=20, pady=10)
+        
+        self.import_button = ttk.Button(
+            toolbar,
+            text="Import Cases...",
+            command=self._import_cases,
+            style='primary.TButton'
+        )
+        self.import_button.pack(side=tk.LEFT)
+        
+        self.export_button = ttk.Button(
+            toolbar,
+            text="Export Cases...",
+            command=self._export_cases,
+            style='secondary.TButton'
+        )
+        self.export_button.pack(side=tk.LEFT, padx=(10, 0))
+        
         self.theme_button = ttk.Button(
-            self.root,
-            text="🌙 Light Theme",
+            toolbar,
+            text=self._theme_button_text(),
             command=self._toggle_theme,
             style='primary-outline.TButton'
         )
-        self.theme_button.pack(anchor='ne', padx=20, pady=10)
+        self.theme_button.pack(side=tk.RIGHT)
+        
+        ttk.Button(
+            toolbar,
+            text="Stats",
+            command=self._show_stats,
+            style='secondary-outline.TButton'
+        ).pack(side=tk.RIGHT, padx=(0, 10))
+        
+        self.logging_button = ttk.Button(
+            toolbar,
+            text="Enable Verbose Logging",
+            command=self._toggle_logging,
+            style='secondary-outline.TButton'
+        )
+        self.logging_button.pack(side=tk.RIGHT, padx=(0, 10))
 
     def _create_main_frame(self) -> None:
         """Create the main application frame"""
@@ -55,7 +121,7 @@ class MainWindow:
         self.case_list = CaseListFrame(
             display_frame,
             on_case_select=self._on_case_select,
-            view_case_callback=self._view_case,
+            view_case_callback=self._view_cases,
             edit_case=self._edit_case,
             delete_cases=self._delete_cases
         )
@@ -70,89 +136,375 @@ class MainWindow:
         )
         self.case_details.pack(side=tk.RIGHT, fill=tk.BOTH)
 
-        # Initialize the case list
-        self.case_list.refresh_case_list(self.cases)
+    def _start_loading(self) -> None:
+        """Load cases on a worker thread, with editing disabled until it finishes"""
+        self._load_queue: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self.case_list.start_loading()
+        self.case_details.set_editable(False)
+        self.import_button.state(['disabled'])
+        self.export_button.state(['disabled'])
+        threading.Thread(target=self._load_cases, name="CaseLoader", daemon=True).start()
+        self.root.after(Config.LOAD_POLL_MS, self._poll_loading)
+
+    def _load_cases(self) -> None:
+        """Load cases and build the agenda; runs on the loader thread"""
+        try:
+            cases = StorageManager.load_cases(
+                on_chunk=lambda keys, fraction: self._load_queue.put(("chunk", keys, fraction))
+            )
+            agenda = AgendaIndex.from_repository(cases)
+        except Exception as error:
+            self._load_queue.put(("error", error, None))
+        else:
+            self._load_queue.put(("done", cases, agenda))
+
+    def _poll_loading(self) -> None:
+        """Stream loaded rows into the list and finish once the loader is done"""
+        keys, fraction = [], None
+        while True:
+            try:
+                kind, payload, extra = self._load_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "chunk":
+                # Merge everything that arrived since the last poll into one update
+                keys.extend(payload)
+                fraction = extra
+            elif kind == "done":
+                self._finish_loading(payload, extra)
+                return
+            else:
+                self.case_list.show_load_error("Could not load cases")
+                self._show_error(f"Loading cases failed.\n\n{payload}", "Load Error")
+                return
+        if fraction is not None:
+            self.case_list.add_loaded(keys, fraction)
+        self.root.after(Config.LOAD_POLL_MS, self._poll_loading)
 
+    @instrumented
+    def _finish_loading(self, cases: CaseRepository, agenda: AgendaIndex) -> None:
+        """Switch to the loaded cases and enable editing"""
+        self.cases = cases
+        self.agenda = agenda
+        self.search_index = CaseSearchIndex.from_repository(cases)
+        self.case_list.agenda_query = self.agenda.due_on
+        self.case_list.search_query = self.search_index.search
+        self.case_list.finish_loading(self.cases)
+        self.case_details.set_editable(True)
+        self.import_button.state(['!disabled'])
+        self.export_button.state(['!disabled'])
+        self.root.after(Config.SHARED_POLL_MS, self._poll_external_changes)
+        StartupProfiler.mark("cases loaded")
+        StartupProfiler.report()
+
+    def _theme_button_text(self) -> str:
+        """Label for the theme button, naming the theme it switches to"""
+        return "🌙 Light Theme" if self.is_dark else "🌑 Dark Mode"
+
+    @instrumented
     def _toggle_theme(self) -> None:
         """Toggle between light and dark themes"""
         self.is_dark = not self.is_dark
-        new_theme = "solar" if self.is_dark else "litera"
+        new_theme = Config.DARK_THEME if self.is_dark else Config.LIGHT_THEME
+        # ttkbootstrap builds a theme the first time it is used and reuses it after
         self.root.style.theme_use(new_theme)
-        self.theme_button.config(
-            text="🌙 Light Theme" if self.is_dark else "🌑 Dark Mode"
-        )
+        self.theme_button.config(text=self._theme_button_text())
         self.root.update_idletasks()  # Ensure the UI updates immediately
 
+    def _toggle_logging(self) -> None:
+        """Turn instrumentation and verbose logging on or off"""
+        if Instrumentation.enabled:
+            Instrumentation.disable()
+            self.logging_button.config(text="Enable Verbose Logging")
+        else:
+            Instrumentation.enable()
+            self.logging_button.config(text="Disable Verbose Logging")
+
+    def _show_stats(self) -> None:
+        """Open the performance stats panel"""
+        # Only imported once the panel is first opened
+        from .stats_panel import StatsPanel
+        StatsPanel(self.root)
+
+    @instrumented
     def _on_case_select(self) -> None:
         """Handle case selection from the list"""
         case_number, case_type = self.case_list.get_selected_case()
         if case_number and case_type:
-            case = self.cases[case_type][case_number]
-            self.case_details.set_form_data(case)
-            self._calculate_schedule()
+            case = self.cases.get(case_number, case_type)
+            if case:
+                self.case_details.set_form_data(case)
+                self._calculate_schedule()
 
+    @instrumented
     def _on_field_change(self, *args) -> None:
         """Handle form field changes"""
-        case = self.case_details.get_form_data()
-        if case:
-            self._calculate_schedule()
+        self._calculate_schedule()
 
     def _calculate_schedule(self) -> None:
-        """Calculate and display the schedule"""
+        """Recalculate the schedule once the current burst of form changes is over.
+
+        Filling the form fires a trace per field; these requests are
+        coalesced into a single _update_schedule per event-loop tick.
+        """
+        self.updates.request("schedule", self._update_schedule)
+
+    @instrumented
+    def _update_schedule(self) -> None:
+        """Calculate and display the schedule, skipping work if the inputs are unchanged"""
         case = self.case_details.get_form_data()
         if case:
-            schedule = ScheduleCalculator.format_schedule(case)
-            self.case_details.show_result(schedule)
+            inputs = (case.case_type, case.last_contact_day, case.severity, case.last_contact_date)
+            if inputs != self._schedule_inputs:
+                self._schedule_inputs = inputs
+                self._schedule_text = ScheduleCalculator.format_schedule(case)
+            self.case_details.show_result(self._schedule_text)
 
+    @instrumented
     def _add_or_update_case(self) -> None:
         """Add or update a case in storage"""
         case = self.case_details.get_form_data()
         if case:
-            unique_id = case.unique_id
-            self.cases[case.case_type][unique_id] = case
-            StorageManager.save_cases(self.cases)
-            self.case_list.refresh_case_list(self.cases)
+            is_new = self.cases.upsert(case)
+            if is_new:
+                self.search_index.add(case.case_number, case.case_type)
+            self.agenda.add(case)
+            self._save()
+            if is_new:
+                self.case_list.apply_changes(inserted=[case.key])
+            else:
+                self.case_list.apply_changes(updated=[case.key])
+            self.case_list.refresh_agenda()
             self.case_details.clear_form()
 
+    @instrumented
     def _delete_case(self, case: Case) -> None:
         """Delete a case from storage"""
-        unique_id = case.unique_id
-        if case.case_type in self.cases and unique_id in self.cases[case.case_type]:
-            del self.cases[case.case_type][unique_id]
-            StorageManager.save_cases(self.cases)
-            self.case_list.refresh_case_list(self.cases)
+        if self.cases.delete(case.case_number, case.case_type):
+            self.agenda.remove(case.key)
+            self.search_index.remove(case.case_number, case.case_type)
+            self._save()
+            self.case_list.apply_changes(removed=[case.key])
+            self.case_list.refresh_agenda()
             self.case_details.clear_form()
 
-    def _view_case(self, selected_case: tuple[str, str]) -> None:
-        """Open the case view dialog for the selected case"""
-        case_number, case_type = selected_case  # Unpack the tuple
-        if case_number and case_type:
-            # Find the case using the unique_id
-            unique_id = f"{case_number}_{case_type}"
-            case = self.cases[case_type].get(unique_id)
-            if case:
-                CaseViewDialog(
-                    self.root,
-                    case,
-                    self._edit_case
-                )
+    @instrumented
+    def _view_cases(self, selected_cases: list[tuple[str, str]]) -> None:
+        """Show the selected cases in the case viewer, one page per case"""
+        keys = [(case_number, case_type) for case_number, case_type in selected_cases if case_number and case_type]
+        if not keys:
+            return
+        if self.case_viewer is None or not self.case_viewer.exists():
+            # Only imported once a case is first viewed; the window is then reused
+            from .case_view import CaseViewDialog
+            self.case_viewer = CaseViewDialog(self.root, self.cases.get, self._edit_case)
+        # Cases are looked up through the repository current at the time
+        self.case_viewer.get_case = self.cases.get
+        self.case_viewer.show(keys)
 
+    @instrumented
     def _edit_case(self, case: Case) -> None:
         """Handle editing a case"""
         self.case_details.set_form_data(case)
         self._calculate_schedule()
 
+    @instrumented
     def _delete_cases(self, selected_cases: list[tuple[str, str]]) -> None:
         """Delete multiple cases from storage"""
-        for case_number, case_type in selected_cases:
-            unique_id = f"{case_number}_{case_type}"
-            if case_type in self.cases and unique_id in self.cases[case_type]:
-                del self.cases[case_type][unique_id]
+        deleted = self.cases.delete_many(selected_cases)
+        self.agenda.remove_many(case.key for case in deleted)
+        for case in deleted:
+            self.search_index.remove(case.case_number, case.case_type)
         
-        StorageManager.save_cases(self.cases)
-        self.case_list.refresh_case_list(self.cases)
+        # All deletions above are written out together in one save
+        self._save()
+        self.case_list.apply_changes(removed=[case.key for case in deleted])
+        self.case_list.refresh_agenda()
         self.case_details.clear_form()
 
+    @instrumented
+    def _import_cases(self) -> None:
+        """Bulk import cases from a CSV or JSON Lines file as one change"""
+        from tkinter import filedialog
+        path = filedialog.askopenfilename(
+            parent=self.root,
+            title="Import Cases",
+            filetypes=[("Cases", "*.csv *.jsonl *.ndjson *.json"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+
+        self.root.config(cursor="watch")
+        self.root.update_idletasks()
+        try:
+            with open(path, "r", encoding="utf-8", newline="") as file:
+                result = import_cases(file, detect_format(path), self.cases)
+        except (OSError, UnicodeDecodeError) as error:
+            self._show_error(f"Could not read {path}.\n\n{error}", "Import Failed")
+            return
+        finally:
+            self.root.config(cursor="")
+
+        for key in result.added + result.updated:
+            self.agenda.add(self.cases[key])
+        for case_number, case_type in result.added:
+            self.search_index.add(case_number, case_type)
+        if result.added or result.updated:
+            # The whole import is written in one save and shown in one refresh
+            self._save()
+            self.case_list.apply_changes(inserted=result.added, updated=result.updated)
+            self.case_list.refresh_agenda()
+        self._report_import(result)
+
+    def _report_import(self, result: ImportResult) -> None:
+        """Summarize an import and offer to save the rejected rows"""
+        from ttkbootstrap.dialogs import Messagebox
+        if not result.rejected:
+            Messagebox.show_info(result.summary(), "Import Complete", parent=self.root)
+            return
+
+        shown = 10
+        details = "\n".join(f"Line {line}: {reason}" for line, reason in result.rejected[:shown])
+        if len(result.rejected) > shown:
+            details += f"\n... and {len(result.rejected) - shown} more"
+        answer = Messagebox.show_question(
+            f"{result.summary()}.\n\n{details}\n\nSave a report of the rejected rows?",
+            "Import Complete",
+            parent=self.root,
+            buttons=['Save Report:primary', 'Close:secondary']
+        )
+        if answer != 'Save Report':
+            return
+
+        from tkinter import filedialog
+        path = filedialog.asksaveasfilename(
+            parent=self.root,
+            title="Save Rejected Rows",
+            initialfile="import_errors.csv",
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl")]
+        )
+        if path:
+            try:
+                with open(path, "w", encoding="utf-8", newline="") as file:
+                    write_error_report(file, detect_format(path, default="csv"), result.rejected)
+            except OSError as error:
+                self._show_error(f"Could not write {path}.\n\n{error}", "Save Report Failed")
+
+    @instrumented
+    def _export_cases(self) -> None:
+        """Stream every case to a CSV or JSON Lines file"""
+        from tkinter import filedialog
+        path = filedialog.asksaveasfilename(
+            parent=self.root,
+            title="Export Cases",
+            initialfile="cases.csv",
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl")]
+        )
+        if not path:
+            return
+        try:
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                export_cases(file, detect_format(path, default="csv"), self.cases)
+        except OSError as error:
+            self._show_error(f"Could not write {path}.\n\n{error}", "Export Failed")
+
+    def _save(self) -> None:
+        """Hand the pending changes to the background save worker"""
+        self._saves += 1
+        self.save_worker.submit(StorageManager.collect_changes(self.cases))
+
+    def _poll_external_changes(self) -> None:
+        """Pick up changes other instances saved to the shared files.
+
+        The check is a few stat calls. Only when something changed, and
+        nothing of ours is waiting to be written, are the changes read on a
+        worker thread; the result is merged on a later poll.
+        """
+        try:
+            saves, changes = self._sync_queue.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            self._syncing = False
+            self._merge_external_changes(saves, changes)
+
+        if not self._syncing and self.save_worker.idle and StorageManager.has_external_changes():
+            self._syncing = True
+            threading.Thread(
+                target=self._read_external_changes,
+                args=(self._saves,),
+                name="ExternalChanges",
+                daemon=True
+            ).start()
+        # Look for the result soon while a read is running
+        self.root.after(
+            Config.LOAD_POLL_MS if self._syncing else Config.SHARED_POLL_MS,
+            self._poll_external_changes
+        )
+
+    def _read_external_changes(self, saves: int) -> None:
+        """Read other instances' changes; runs on a worker thread"""
+        try:
+            changes = StorageManager.read_external_changes()
+        except Exception as error:
+            changes = error
+        self._sync_queue.put((saves, changes))
+
+    @instrumented
+    def _merge_external_changes(self, saves: int, changes) -> None:
+        """Apply changes read from the shared files to the cases and the list"""
+        if not isinstance(changes, ExternalChanges):
+            # The files could not be read, e.g. while being replaced on a
+            # network share; the next poll tries again
+            Instrumentation.count("MainWindow.sync_errors")
+            return
+        if saves != self._saves or not self.save_worker.idle:
+            # Our own edits were saved while reading and the read may
+            # predate them; read again once they are written
+            return
+
+        inserted, updated, removed = self.cases.merge_stored(changes.entries, changes.complete)
+        StorageManager.mark_synced(changes)
+        if not (inserted or updated or removed):
+            return
+
+        for key in removed:
+            self.agenda.remove(key)
+            self.search_index.remove(*key)
+        for key in inserted:
+            self.search_index.add(*key)
+        for key in inserted + updated:
+            self.agenda.add(self.cases[key])
+        self.case_list.apply_changes(inserted=inserted, updated=updated, removed=removed)
+        self.case_list.refresh_agenda()
+        if self.case_viewer is not None and self.case_viewer.exists():
+            self.case_viewer.refresh()
+
+    def _poll_save_errors(self) -> None:
+        """Report background save failures on the UI thread"""
+        errors = self.save_worker.poll_errors()
+        if errors:
+            self._show_error(
+                f"Saving cases failed; the changes will be retried.\n\n{errors[-1]}",
+                "Save Error"
+            )
+        self.root.after(Config.SAVE_ERROR_POLL_MS, self._poll_save_errors)
+
+    def _on_close(self) -> None:
+        """Write any pending changes before closing the window"""
+        if not self.save_worker.stop():
+            errors = self.save_worker.poll_errors()
+            detail = f"\n\n{errors[-1]}" if errors else ""
+            self._show_error(f"Some changes could not be saved.{detail}", "Save Error")
+        self.root.destroy()
+
+    def _show_error(self, message: str, title: str) -> None:
+        """Show an error dialog; the dialogs module is only imported when needed"""
+        from ttkbootstrap.dialogs import Messagebox
+        Messagebox.show_error(message, title, parent=self.root)
+
     def _show_message(self, message: str) -> None:
         """Show a message to the user"""
         print(message)  # In a production app, you might want to use a proper message box
@@ -0,0 +1,62 @@
+# src/ui/stats_panel.py
+import tkinter as tk
+from tkinter import filedialog, ttk
+import ttkbootstrap as tb
+from ..config import Config
+from ..utils.instrumentation import Instrumentation
+
+class StatsPanel:
+    """Window showing the collected instrumentation metrics"""
+
+    def __init__(self, parent: tk.Tk):
+        self.popup = tb.Toplevel(parent)
+        self.popup.title("Performance Stats")
+        self.popup.geometry("820x480")
+
+        button_frame = ttk.Frame(self.popup)
+        button_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
+        ttk.Button(button_frame, text="Refresh", command=self.refresh).pack(side=tk.LEFT, padx=2)
+        ttk.Button(
+            button_frame,
+            text="Reset",
+            command=self._reset,
+            style='danger.TButton'
+        ).pack(side=tk.LEFT, padx=2)
+        ttk.Button(
+            button_frame,
+            text="Dump to File...",
+            command=self._dump,
+            style='secondary.TButton'
+        ).pack(side=tk.LEFT, padx=2)
+
+        self.text = tk.Text(self.popup, wrap=tk.NONE, font=('TkFixedFont', 10), state=tk.DISABLED)
+        self.text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Show the current metrics"""
+        self.text.config(state=tk.NORMAL)
+        self.text.delete(1.0, tk.END)
+        self.text.insert(tk.END, Instrumentation.format_stats())
+        self.text.config(state=tk.DISABLED)
+
+    def _reset(self) -> None:
+        Instrumentation.reset()
+        self.refresh()
+
+    def _dump(self) -> None:
+        """Write the metrics as JSON to a file the user picks"""
+        path = filedialog.asksaveasfilename(
+            parent=self.popup,
+            title="Dump Metrics",
+            initialfile=Config.METRICS_FILE.split("/")[-1],
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            Instrumentation.dump(path)
+        except OSError as error:
+            from ttkbootstrap.dialogs import Messagebox
+            Messagebox.show_error(f"Could not write {path}.\n\n{error}", "Dump Failed", parent=self.popup)
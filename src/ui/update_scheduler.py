@@ -0,0 +1,41 @@
+# src/ui/update_scheduler.py
+import tkinter as tk
+from typing import Callable, Dict, Hashable, Optional
+from ..utils.instrumentation import Instrumentation
+
+class UpdateScheduler:
+    """Coalesces UI updates requested during one event-loop tick.
+
+    ``request(key, callback)`` only queues the update; the first request
+    schedules a flush with ``after_idle`` and every queued update runs once
+    when Tk goes idle, however many times it was requested. A later request
+    under the same key replaces the earlier callback.
+    """
+
+    def __init__(self, widget: tk.Misc):
+        self.widget = widget
+        self._pending: Dict[Hashable, Callable[[], None]] = {}
+        self._job: Optional[str] = None
+
+    def request(self, key: Hashable, callback: Callable[[], None]) -> None:
+        """Run ``callback`` once the current burst of events has been handled"""
+        # Requests vs. updates run show how much is coalesced in the stats panel
+        Instrumentation.count("UpdateScheduler.requests")
+        self._pending[key] = callback
+        if self._job is None:
+            self._job = self.widget.after_idle(self.flush)
+
+    def cancel(self, key: Hashable) -> None:
+        """Drop a queued update"""
+        self._pending.pop(key, None)
+
+    def flush(self) -> None:
+        """Run every queued update now"""
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        # Updates may request further updates; those run in the next flush
+        pending, self._pending = self._pending, {}
+        for callback in pending.values():
+            Instrumentation.count("UpdateScheduler.updates")
+            callback()
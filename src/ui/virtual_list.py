@@ -0,0 +1,254 @@
+# src/ui/virtual_list.py
+import tkinter as tk
+from tkinter import ttk
+from tkinter import font as tkfont
+from bisect import bisect_left
+from typing import Callable, Iterable, List, Optional, Sequence, Set
+
+class VirtualListbox(ttk.Frame):
+    """Listbox that only creates rows for the part of the list that is visible.
+
+    The full list lives in ``items`` (a sorted list of strings); the
+    underlying ``tk.Listbox`` only ever holds the rows in the viewport, and
+    they are refilled from ``items`` as the view scrolls. Single rows are
+    inserted or removed at their bisected position without a full reset.
+    Selection is kept by item value, with EXTENDED semantics: click,
+    Ctrl-click, Shift-click and drag.
+    """
+
+    BUFFER_ROWS = 1  # Extra row so a partially visible last row is drawn
+
+    def __init__(
+        self,
+        parent: tk.Widget,
+        on_double_click: Optional[Callable] = None,
+        font=('TkDefaultFont', 10),
+        **kwargs
+    ):
+        super().__init__(parent, **kwargs)
+        self.on_double_click = on_double_click
+        self._items: List[str] = []
+        self._selected: Set[str] = set()
+        self._anchor: Optional[str] = None
+        self._top = 0
+        self._rows = 1
+        self._row_height = tkfont.Font(font=font).metrics('linespace') + 1
+
+        self._listbox = tk.Listbox(
+            self,
+            height=20,
+            selectmode=tk.EXTENDED,
+            activestyle='none',
+            font=font,
+            borderwidth=0,
+            highlightthickness=1,
+            exportselection=False
+        )
+        self._scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self._scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        # Take over the listbox bindings: its own selection only knows visible rows
+        self._listbox.bind('<Configure>', self._on_resize)
+        self._listbox.bind('<Button-1>', self._on_click)
+        self._listbox.bind('<Control-Button-1>', self._on_control_click)
+        self._listbox.bind('<Shift-Button-1>', self._on_shift_click)
+        self._listbox.bind('<B1-Motion>', self._on_shift_click)
+        self._listbox.bind('<Double-Button-1>', self._on_double_click)
+        self._listbox.bind('<MouseWheel>', self._on_mousewheel)
+        self._listbox.bind('<Button-4>', lambda event: self._scroll_to(self._top - 3))
+        self._listbox.bind('<Button-5>', lambda event: self._scroll_to(self._top + 3))
+        self._listbox.bind('<Up>', lambda event: self._move_anchor(-1))
+        self._listbox.bind('<Down>', lambda event: self._move_anchor(1))
+        self._listbox.bind('<Prior>', lambda event: self._scroll_to(self._top - self._rows))
+        self._listbox.bind('<Next>', lambda event: self._scroll_to(self._top + self._rows))
+
+    @property
+    def items(self) -> Sequence[str]:
+        return self._items
+
+    def set_items(self, items: Sequence[str]) -> None:
+        """Replace the list contents; ``items`` must be sorted"""
+        self._items = list(items)
+        # Drop selections of items that are gone
+        self._selected = {item for item in self._selected if self._position(item) is not None}
+        if self._anchor is not None and self._position(self._anchor) is None:
+            self._anchor = None
+        self._scroll_to(self._top)
+
+    def add_items(self, items: Iterable[str]) -> None:
+        """Merge a batch of items into the list, e.g. while it is being loaded"""
+        batch = sorted(items)
+        if not batch:
+            return
+        # Two sorted runs: sort() merges them in linear time
+        self._items.extend(batch)
+        self._items.sort()
+        self._refresh_if_visible(bisect_left(self._items, batch[0]))
+
+    def insert_item(self, item: str) -> None:
+        """Insert one item at its sorted position, keeping scroll and selection"""
+        index = bisect_left(self._items, item)
+        if index < len(self._items) and self._items[index] == item:
+            return
+        self._items.insert(index, item)
+        if index < self._top:
+            # Keep the same rows in view rather than shifting them down
+            self._top += 1
+        self._refresh_if_visible(index)
+
+    def remove_item(self, item: str) -> None:
+        """Remove one item, keeping scroll and the rest of the selection"""
+        index = self._position(item)
+        if index is None:
+            return
+        del self._items[index]
+        self._selected.discard(item)
+        if self._anchor == item:
+            self._anchor = None
+        if index < self._top:
+            self._top -= 1
+        self._refresh_if_visible(index)
+
+    def _refresh_if_visible(self, index: int) -> None:
+        """Redraw after a change at ``index`` only if it touches the viewport"""
+        if index < self._top + self._rows + self.BUFFER_ROWS:
+            self._scroll_to(self._top)
+        else:
+            self._update_scrollbar()
+
+    def size(self) -> int:
+        return len(self._items)
+
+    def _position(self, item: str) -> Optional[int]:
+        """Return the index of ``item`` in the sorted items, or None"""
+        index = bisect_left(self._items, item)
+        if index < len(self._items) and self._items[index] == item:
+            return index
+        return None
+
+    def selected_items(self) -> List[str]:
+        """Return the selected items in list order"""
+        return sorted(self._selected)
+
+    def clear_selection(self) -> None:
+        self._selected.clear()
+        self._anchor = None
+        self._render()
+
+    # Rendering
+
+    def _render(self) -> None:
+        """Refill the listbox with the rows in the viewport"""
+        visible = self._items[self._top:self._top + self._rows + self.BUFFER_ROWS]
+        self._listbox.delete(0, tk.END)
+        if visible:
+            self._listbox.insert(tk.END, *visible)
+        for offset, item in enumerate(visible):
+            if item in self._selected:
+                self._listbox.selection_set(offset)
+        self._update_scrollbar()
+
+    def _update_scrollbar(self) -> None:
+        """Match the scrollbar to the viewport position and list length"""
+        total = len(self._items)
+        if total:
+            self._scrollbar.set(self._top / total, min(1.0, (self._top + self._rows) / total))
+        else:
+            self._scrollbar.set(0.0, 1.0)
+
+    def _scroll_to(self, top: int) -> str:
+        """Make ``top`` the first visible row, clamped to the list"""
+        self._top = max(0, min(top, len(self._items) - self._rows))
+        self._render()
+        return "break"
+
+    def see(self, index: int) -> None:
+        """Scroll so the row at ``index`` is visible"""
+        if index < self._top:
+            self._scroll_to(index)
+        elif index >= self._top + self._rows:
+            self._scroll_to(index - self._rows + 1)
+
+    def _on_resize(self, event) -> None:
+        rows = max(1, event.height // self._row_height)
+        if rows != self._rows:
+            self._rows = rows
+            self._scroll_to(self._top)
+
+    def _on_scrollbar(self, action: str, amount, unit: Optional[str] = None) -> None:
+        if action == tk.MOVETO:
+            self._scroll_to(int(float(amount) * len(self._items)))
+        elif action == tk.SCROLL:
+            step = self._rows if unit == tk.PAGES else 1
+            self._scroll_to(self._top + int(amount) * step)
+
+    def _on_mousewheel(self, event) -> str:
+        # Windows reports multiples of 120, macOS small deltas
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self._scroll_to(self._top - delta * 3)
+
+    # Selection
+
+    def _item_at(self, y: int) -> Optional[str]:
+        """Return the item under a y coordinate, or None below the last row"""
+        row = self._listbox.nearest(y)
+        if row < 0:
+            return None
+        if row == self._listbox.size() - 1:
+            # nearest() returns the last row for any y below it, so check
+            # the click is inside that row: its text plus selection border
+            bbox = self._listbox.bbox(row)
+            border = int(self._listbox.cget('selectborderwidth'))
+            if bbox is None or y >= bbox[1] + bbox[3] + border:
+                return None
+        index = self._top + row
+        if 0 <= index < len(self._items):
+            return self._items[index]
+        return None
+
+    def _on_click(self, event) -> str:
+        self._listbox.focus_set()
+        item = self._item_at(event.y)
+        self._selected = {item} if item is not None else set()
+        self._anchor = item
+        self._render()
+        return "break"
+
+    def _on_control_click(self, event) -> str:
+        item = self._item_at(event.y)
+        if item is not None:
+            if item in self._selected:
+                self._selected.discard(item)
+            else:
+                self._selected.add(item)
+            self._anchor = item
+            self._render()
+        return "break"
+
+    def _on_shift_click(self, event) -> str:
+        item = self._item_at(event.y)
+        if item is None:
+            return "break"
+        if self._anchor is None:
+            self._anchor = item
+        start, end = sorted((self._position(self._anchor), self._position(item)))
+        self._selected = set(self._items[start:end + 1])
+        self._render()
+        return "break"
+
+    def _move_anchor(self, step: int) -> str:
+        if not self._items:
+            return "break"
+        current = self._position(self._anchor) if self._anchor is not None else None
+        index = 0 if current is None else max(0, min(current + step, len(self._items) - 1))
+        self._anchor = self._items[index]
+        self._selected = {self._anchor}
+        self.see(index)
+        self._render()
+        return "break"
+
+    def _on_double_click(self, event) -> str:
+        if self.on_double_click is not None and self._item_at(event.y) is not None:
+            self.on_double_click(event)
+        return "break"
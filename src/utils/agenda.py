@@ -0,0 +1,126 @@
+# src/utils/agenda.py
+import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from ..config import Config
+from ..models.case import Case, parse_date
+from ..models.case_repository import CaseKey, CaseRepository
+from .scheduler import ScheduleCalculator
+
+# Event names, in the order they are listed in the agenda
+FOLLOW_UP = "Follow-up"
+STRIKE = "Strike"
+LQR = "LQR"
+RECOVERY = "Recovery"
+EVENTS = (FOLLOW_UP, STRIKE, LQR, RECOVERY)
+
+AgendaEntry = Tuple[str, CaseKey]
+
+class AgendaIndex:
+    """Per-weekday buckets of the cases that have something due that day.
+
+    Every case contributes its follow-ups, or its first two strikes, its
+    third strike (the Last Quality Response) and both recovery-window days.
+    The index is updated one case at a time, so a query costs the size of
+    its answer rather than the size of the backlog.
+    """
+
+    def __init__(self):
+        # event -> day -> ordered set of case keys
+        self._buckets: Dict[str, Dict[str, Dict[CaseKey, None]]] = {
+            event: {} for event in EVENTS
+        }
+        # case key -> the (event, day) pairs it was filed under
+        self._entries: Dict[CaseKey, Tuple[Tuple[str, str], ...]] = {}
+
+    @classmethod
+    def from_repository(cls, cases: CaseRepository) -> 'AgendaIndex':
+        """Build an index over every case in a repository"""
+        agenda = cls()
+        for case_type, case_map in cases.maps.items():
+            # records() avoids materializing lazily loaded cases
+            for case_number, data in case_map.records():
+                agenda._file(
+                    (case_number, case_type),
+                    cls._events_for(case_type, data['day'], data['severity'], parse_date(data.get('date')))
+                )
+        return agenda
+
+    @staticmethod
+    def _events_for(
+        case_type: str,
+        day: str,
+        severity: str,
+        contact_date: Optional[datetime.date] = None
+    ) -> Tuple[Tuple[str, str], ...]:
+        """Return the (event, day) pairs for one schedule.
+
+        Dated cases are filed under the weekdays of their calendar-date
+        schedule, which can differ from the weekday schedule around holidays.
+        """
+        if contact_date is not None:
+            try:
+                schedule = ScheduleCalculator.calculate_dates(contact_date, severity)
+            except ValueError:
+                # The schedule runs off the business calendar; parse_case and
+                # the form reject such dates, but older files may hold them
+                return ()
+            # Business days are Monday to Friday, the order of Config.WEEKDAYS
+            followups, strikes, recovery = (
+                [Config.WEEKDAYS[event_date.weekday()] for event_date in event_dates]
+                for event_dates in schedule
+            )
+        else:
+            entry = ScheduleCalculator.schedule_table().get((case_type, day, severity))
+            if entry is not None:
+                followups, strikes, recovery = entry
+            else:
+                # Not in the table (unknown day or severity): compute it directly
+                case = Case("", case_type, day, severity)
+                followups = ScheduleCalculator.calculate_followups(case)
+                strikes, recovery = ScheduleCalculator.calculate_strikes(case)
+
+        if case_type == 'Follow-ups':
+            return tuple((FOLLOW_UP, followup) for followup in followups)
+
+        *strikes, last_strike = strikes
+        return (
+            tuple((STRIKE, strike) for strike in strikes)
+            + ((LQR, last_strike),)
+            + tuple((RECOVERY, recovery_day) for recovery_day in recovery)
+        )
+
+    def _file(self, key: CaseKey, events: Tuple[Tuple[str, str], ...]) -> None:
+        """Add a case key to the buckets for its events"""
+        self._entries[key] = events
+        for event, day in events:
+            self._buckets[event].setdefault(day, {})[key] = None
+
+    def add(self, case: Case) -> None:
+        """Add a case, replacing any earlier schedule for the same key"""
+        key = case.key
+        self.remove(key)
+        self._file(key, self._events_for(case.case_type, case.last_contact_day, case.severity, case.last_contact_date))
+
+    def remove(self, key: CaseKey) -> None:
+        """Remove a case from every bucket it is in"""
+        for event, day in self._entries.pop(key, ()):
+            bucket = self._buckets[event].get(day)
+            if bucket is not None:
+                bucket.pop(key, None)
+
+    def remove_many(self, keys: Iterable[CaseKey]) -> None:
+        """Remove several cases"""
+        for key in keys:
+            self.remove(key)
+
+    def due_on(self, day: str, event: Optional[str] = None) -> List[AgendaEntry]:
+        """Return (event, case key) pairs due on ``day``, optionally for one event"""
+        events = EVENTS if event is None else (event,)
+        return [
+            (current_event, key)
+            for current_event in events
+            for key in self._buckets[current_event].get(day, ())
+        ]
+
+    def __len__(self) -> int:
+        return len(self._entries)
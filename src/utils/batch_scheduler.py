@@ -0,0 +1,182 @@
+# src/utils/batch_scheduler.py
+import datetime
+from typing import Iterable, NamedTuple, Tuple
+import numpy as np
+from ..models.case import Case
+from ..config import Config
+from .scheduler import ScheduleCalculator
+
+class BatchSchedule(NamedTuple):
+    """Schedules for a batch of cases as weekday-index arrays.
+
+    Rows that do not apply to a case's type are filled with -1, mirroring
+    ``ScheduleCalculator.format_schedule`` which only shows one of them.
+    ``calculate_dates`` returns ``datetime64[D]`` arrays instead, with NaT
+    in the rows that do not apply.
+    """
+    followups: np.ndarray   # shape (n, 3)
+    strikes: np.ndarray     # shape (n, 3)
+    recovery: np.ndarray    # shape (n, 2)
+
+class BatchScheduleCalculator:
+    """Vectorized follow-up and strike scheduling over columns of cases"""
+
+    @staticmethod
+    def _offset_table() -> np.ndarray:
+        """Return the business-day offset table as a 2-D integer array"""
+        table = np.asarray(
+            ScheduleCalculator._week_offset_table(len(Config.WEEKDAYS)),
+            dtype=np.int64
+        )
+        if table.ndim != 2 or table.shape[1] == 0:
+            raise ValueError("Config.WEEKDAYS contains no business days")
+        return table
+
+    @staticmethod
+    def encode_cases(cases: Iterable[Case]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Convert cases to (day index, severity code, case type code) columns"""
+        day_codes = {day: i for i, day in enumerate(Config.WEEKDAYS)}
+        severity_codes = {level: i for i, level in enumerate(Config.SEVERITY_LEVELS)}
+        type_codes = {case_type: i for i, case_type in enumerate(Config.CASE_TYPES)}
+
+        rows = [
+            (
+                day_codes[case.last_contact_day],
+                severity_codes[case.severity],
+                type_codes[case.case_type]
+            )
+            for case in cases
+        ]
+        columns = np.array(rows, dtype=np.int64).reshape(-1, 3)
+        return columns[:, 0], columns[:, 1], columns[:, 2]
+
+    @classmethod
+    def calculate(
+        cls,
+        day_index: np.ndarray,
+        severity: np.ndarray,
+        case_type: np.ndarray
+    ) -> BatchSchedule:
+        """Calculate schedules for whole columns at once.
+
+        ``severity`` and ``case_type`` hold indices into
+        ``Config.SEVERITY_LEVELS`` and ``Config.CASE_TYPES``.
+        """
+        day_index = np.asarray(day_index, dtype=np.int64)
+        severity = np.asarray(severity, dtype=np.int64)
+        case_type = np.asarray(case_type, dtype=np.int64)
+        # Negative codes would silently wrap around to another weekday
+        if day_index.size and (day_index.min() < 0 or day_index.max() >= len(Config.WEEKDAYS)):
+            raise ValueError(f"Day indices must be from 0 to {len(Config.WEEKDAYS) - 1}")
+
+        table = cls._offset_table()
+        width = table.shape[1]
+
+        # Severity B moves one business day at a time, everything else two
+        interval = np.where(severity == Config.SEVERITY_LEVELS.index('B'), 1, 2)
+
+        followups = np.stack(
+            [table[day_index, ((i + 1) * interval - 1) % width] for i in range(3)],
+            axis=1
+        )
+
+        first_strike = table[day_index, (interval - 1) % width]
+        second_strike = table[first_strike, 1 % width]
+        third_strike = table[second_strike, 1 % width]
+        strikes = np.stack([first_strike, second_strike, third_strike], axis=1)
+
+        # Recovery period starts after the second strike
+        recovery = np.stack(
+            [table[second_strike, 0], table[second_strike, 1 % width]],
+            axis=1
+        )
+
+        is_followup = (case_type == Config.CASE_TYPES.index('Follow-ups'))[:, None]
+        return BatchSchedule(
+            followups=np.where(is_followup, followups, -1),
+            strikes=np.where(is_followup, -1, strikes),
+            recovery=np.where(is_followup, -1, recovery)
+        )
+
+    @classmethod
+    def calculate_cases(cls, cases: Iterable[Case]) -> BatchSchedule:
+        """Encode a sequence of cases and calculate their schedules"""
+        return cls.calculate(*cls.encode_cases(cases))
+
+    @staticmethod
+    def encode_case_dates(cases: Iterable[Case]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Convert dated cases to (date ordinal, severity code, case type code) columns"""
+        severity_codes = {level: i for i, level in enumerate(Config.SEVERITY_LEVELS)}
+        type_codes = {case_type: i for i, case_type in enumerate(Config.CASE_TYPES)}
+
+        rows = [
+            (
+                ScheduleCalculator._contact_date(case).toordinal(),
+                severity_codes[case.severity],
+                type_codes[case.case_type]
+            )
+            for case in cases
+        ]
+        columns = np.array(rows, dtype=np.int64).reshape(-1, 3)
+        return columns[:, 0], columns[:, 1], columns[:, 2]
+
+    @classmethod
+    def calculate_dates(
+        cls,
+        date_ordinal: np.ndarray,
+        severity: np.ndarray,
+        case_type: np.ndarray
+    ) -> BatchSchedule:
+        """Calculate calendar-date schedules for whole columns at once.
+
+        ``date_ordinal`` holds ``date.toordinal()`` values of the last
+        contact dates, as returned by ``CaseStore.date_column``. Each step is
+        a lookup in the business calendar's arrays, the same index
+        ``ScheduleCalculator.calculate_dates`` uses one case at a time.
+        """
+        calendar = ScheduleCalculator.calendar()
+        counts, business_days = calendar.columns()
+        offsets = np.asarray(date_ordinal, dtype=np.int64) - calendar.first.toordinal()
+        severity = np.asarray(severity, dtype=np.int64)
+        case_type = np.asarray(case_type, dtype=np.int64)
+        if offsets.size and (offsets.min() < 0 or offsets.max() >= len(counts)):
+            raise ValueError(f"Dates outside the business calendar ({calendar.first} to {calendar.last})")
+
+        def add(positions: np.ndarray, interval) -> np.ndarray:
+            # positions: business-day counts up to each date; returns the
+            # count of the target day, which indexes business_days directly
+            target = positions + interval
+            if target.size and target.max() > len(business_days):
+                raise ValueError(f"Schedule runs past the end of the business calendar ({calendar.last})")
+            return target
+
+        start = counts[offsets].astype(np.int64)
+        interval = np.where(severity == Config.SEVERITY_LEVELS.index('B'), 1, 2)
+
+        followups = np.stack([add(start, (i + 1) * interval) for i in range(3)], axis=1)
+        first_strike = add(start, interval)
+        second_strike = add(first_strike, 2)
+        third_strike = add(second_strike, 2)
+        strikes = np.stack([first_strike, second_strike, third_strike], axis=1)
+        # Recovery period starts after the second strike
+        recovery = np.stack([add(second_strike, 1), add(second_strike, 2)], axis=1)
+
+        # Business-day counts are 1-based positions in business_days; shift
+        # date ordinals to the NumPy epoch (1970-01-01)
+        epoch = np.int64(datetime.date(1970, 1, 1).toordinal())
+
+        def to_dates(positions: np.ndarray) -> np.ndarray:
+            return (business_days[positions - 1].astype(np.int64) - epoch).astype('datetime64[D]')
+
+        is_followup = (case_type == Config.CASE_TYPES.index('Follow-ups'))[:, None]
+        not_a_time = np.datetime64('NaT', 'D')
+        return BatchSchedule(
+            followups=np.where(is_followup, to_dates(followups), not_a_time),
+            strikes=np.where(is_followup, not_a_time, to_dates(strikes)),
+            recovery=np.where(is_followup, not_a_time, to_dates(recovery))
+        )
+
+    @classmethod
+    def calculate_case_dates(cls, cases: Iterable[Case]) -> BatchSchedule:
+        """Encode a sequence of dated cases and calculate their calendar-date schedules"""
+        return cls.calculate_dates(*cls.encode_case_dates(cases))
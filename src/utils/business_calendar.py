@@ -0,0 +1,118 @@
+# src/utils/business_calendar.py
+import datetime
+import os
+from array import array
+from typing import Iterable, List, Set
+from ..config import Config
+
+def load_holidays(path: str) -> List[datetime.date]:
+    """Read holiday dates from a text file.
+
+    Each line holds an ISO date (YYYY-MM-DD), optionally followed by a name;
+    blank lines and lines starting with ``#`` are ignored. A missing file
+    means no holidays.
+    """
+    holidays = []
+    if not os.path.exists(path):
+        return holidays
+    with open(path, "r", encoding="utf-8") as file:
+        for line_number, line in enumerate(file, 1):
+            text = line.split("#", 1)[0].strip()
+            if not text:
+                continue
+            try:
+                holidays.append(datetime.date.fromisoformat(text.split(None, 1)[0]))
+            except ValueError:
+                raise ValueError(f"{path}, line {line_number}: expected a YYYY-MM-DD date, got {text!r}") from None
+    return holidays
+
+class BusinessCalendar:
+    """Business-day ordinal index over a fixed range of dates.
+
+    Every business day in the range (not a weekend, not a holiday) gets a
+    consecutive ordinal. ``_counts[i]`` is the number of business days up to
+    and including day ``i`` of the range, and ``_business_days`` lists the
+    date ordinals of the business days in order, so moving N business days
+    from any date is two array lookups instead of a day-by-day walk.
+    """
+
+    WEEKEND = (5, 6)  # date.weekday() of Saturday and Sunday
+
+    def __init__(self, first: datetime.date, last: datetime.date, holidays: Iterable[datetime.date] = ()):
+        if last < first:
+            raise ValueError(f"Calendar ends ({last}) before it starts ({first})")
+        self.first = first
+        self.last = last
+        self.holidays: Set[datetime.date] = {day for day in holidays if first <= day <= last}
+        self._start = first.toordinal()
+        # 'l' holds date ordinals (up to 3.7 million) on every platform
+        self._counts = array('l')
+        self._business_days = array('l')
+        count = 0
+        day = first
+        weekday = first.weekday()
+        for ordinal in range(self._start, last.toordinal() + 1):
+            if weekday not in self.WEEKEND and day not in self.holidays:
+                count += 1
+                self._business_days.append(ordinal)
+            self._counts.append(count)
+            day += datetime.timedelta(days=1)
+            weekday = (weekday + 1) % 7
+
+    @classmethod
+    def from_config(cls) -> 'BusinessCalendar':
+        """Build the calendar for Config's year range and holidays file"""
+        return cls(
+            datetime.date(Config.CALENDAR_FIRST_YEAR, 1, 1),
+            datetime.date(Config.CALENDAR_LAST_YEAR, 12, 31),
+            load_holidays(Config.HOLIDAYS_FILE)
+        )
+
+    def _offset(self, day: datetime.date) -> int:
+        """Position of ``day`` in the range, raising ValueError outside it"""
+        offset = day.toordinal() - self._start
+        if not 0 <= offset < len(self._counts):
+            raise ValueError(f"{day} is outside the business calendar ({self.first} to {self.last})")
+        return offset
+
+    def is_business_day(self, day: datetime.date) -> bool:
+        offset = self._offset(day)
+        previous = self._counts[offset - 1] if offset else 0
+        return self._counts[offset] != previous
+
+    def business_day_number(self, day: datetime.date) -> int:
+        """Number of business days in the range up to and including ``day``"""
+        return self._counts[self._offset(day)]
+
+    def add_business_days(self, day: datetime.date, interval: int) -> datetime.date:
+        """Return the ``interval``-th business day after ``day``.
+
+        ``day`` itself does not have to be a business day. An interval of
+        zero or less returns ``day`` unchanged, like
+        ``ScheduleCalculator.calculate_next_business_day``.
+        """
+        if interval <= 0:
+            return day
+        index = self._counts[self._offset(day)] + interval - 1
+        if index >= len(self._business_days):
+            raise ValueError(f"{interval} business days after {day} is past the end of the business calendar ({self.last})")
+        return datetime.date.fromordinal(self._business_days[index])
+
+    def business_days_between(self, start: datetime.date, end: datetime.date) -> int:
+        """Business days after ``start`` up to and including ``end``"""
+        return self._counts[self._offset(end)] - self._counts[self._offset(start)]
+
+    def columns(self):
+        """Return (counts, business day ordinals) as NumPy arrays for batch lookups.
+
+        The arrays share memory with the calendar, which never changes
+        after it is built.
+        """
+        import numpy as np
+        return (
+            np.frombuffer(self._counts, dtype=np.dtype(f"i{self._counts.itemsize}")),
+            np.frombuffer(self._business_days, dtype=np.dtype(f"i{self._business_days.itemsize}"))
+        )
+
+    def __repr__(self) -> str:
+        return f"BusinessCalendar({self.first}, {self.last}, {len(self.holidays)} holidays)"
@@ -0,0 +1,306 @@
+# src/utils/case_io.py
+import csv
+import datetime
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from ..models.case import Case
+from ..models.case_repository import CaseKey, CaseRepository
+from ..config import Config
+from .scheduler import ScheduleCalculator
+
+FORMATS = ("csv", "jsonl")
+
+# Column order for case rows in CSV files; last_contact_date is optional
+CASE_FIELDS = ["case_number", "case_type", "last_contact_day", "severity", "last_contact_date"]
+SCHEDULE_FIELDS = CASE_FIELDS + ["followups", "strikes", "recovery"]
+
+# Field names from the cases JSON file, accepted as aliases in input rows
+_ALIASES = {"number": "case_number", "type": "case_type", "day": "last_contact_day", "date": "last_contact_date"}
+
+# Called with the input line number and the reason a row was rejected
+ErrorHandler = Callable[[int, str], None]
+
+# Columns of the rejected-rows report
+ERROR_FIELDS = ["line", "reason"]
+
+class CaseRecordError(ValueError):
+    """An input row that does not describe a valid case"""
+
+    def __init__(self, line: int, message: str):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+        self.message = message
+
+def detect_format(path: Optional[str], default: str = "jsonl") -> str:
+    """Guess csv or jsonl from a file name, falling back to ``default``"""
+    if path and path != "-":
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".csv":
+            return "csv"
+        if extension in (".jsonl", ".ndjson", ".json"):
+            return "jsonl"
+    return default
+
+def read_records(
+    file: TextIO,
+    fmt: str,
+    on_error: Optional[ErrorHandler] = None
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (line number, row) from a CSV or JSON Lines stream, one row at a time.
+
+    Lines that are not valid JSON and CSV rows with more fields than the
+    header raise CaseRecordError, or are passed to ``on_error`` and skipped
+    if it is given.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(file)
+        for row in reader:
+            # DictReader puts fields past the header under None
+            extra = row.get(None)
+            if extra is not None:
+                message = f"{len(extra)} more field(s) than the {len(reader.fieldnames)} header columns"
+                if on_error is None:
+                    raise CaseRecordError(reader.line_num, message)
+                on_error(reader.line_num, message)
+                continue
+            yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as error:
+            if on_error is None:
+                raise CaseRecordError(line_number, f"invalid JSON: {error.msg}") from None
+            on_error(line_number, f"invalid JSON: {error.msg}")
+            continue
+        yield line_number, record
+
+def parse_case(record: Dict[str, Any]) -> Case:
+    """Build a Case from an input row, raising ValueError if a field is missing or invalid"""
+    if not isinstance(record, dict):
+        raise ValueError("expected an object with case fields")
+    fields = {_ALIASES.get(key, key): value for key, value in record.items()}
+
+    case_number = str(fields.get("case_number") or "").strip()
+    if not case_number:
+        raise ValueError("missing case_number")
+
+    contact_date = None
+    if fields.get("last_contact_date"):
+        try:
+            contact_date = datetime.date.fromisoformat(str(fields["last_contact_date"]).strip())
+        except ValueError:
+            raise ValueError(f"last_contact_date must be a YYYY-MM-DD date, got {fields['last_contact_date']!r}") from None
+        try:
+            # The whole schedule has to fit, not just the date itself
+            ScheduleCalculator.check_contact_date(contact_date)
+        except ValueError as error:
+            raise ValueError(f"last_contact_date {error}") from None
+        if contact_date.weekday() >= len(Config.WEEKDAYS):
+            raise ValueError(f"last_contact_date {contact_date} is not a weekday")
+        day = Config.WEEKDAYS[contact_date.weekday()]
+        if not fields.get("last_contact_day"):
+            fields["last_contact_day"] = day  # The day can be left out when a date is given
+        elif fields["last_contact_day"] != day:
+            raise ValueError(f"last_contact_day {fields['last_contact_day']!r} does not match last_contact_date {contact_date} ({day})")
+
+    for name, allowed in (
+        ("case_type", Config.CASE_TYPES),
+        ("last_contact_day", Config.WEEKDAYS),
+        ("severity", Config.SEVERITY_LEVELS)
+    ):
+        if fields.get(name) not in allowed:
+            raise ValueError(f"{name} must be one of {', '.join(allowed)}, got {fields.get(name)!r}")
+
+    return Case(
+        case_number=case_number,
+        case_type=fields["case_type"],
+        last_contact_day=fields["last_contact_day"],
+        severity=fields["severity"],
+        last_contact_date=contact_date
+    )
+
+def read_cases(
+    file: TextIO,
+    fmt: str,
+    on_error: Optional[ErrorHandler] = None
+) -> Iterator[Case]:
+    """Yield cases from a CSV or JSON Lines stream.
+
+    Invalid rows raise CaseRecordError, or are passed to ``on_error`` and
+    skipped if it is given.
+    """
+    for _, case in read_numbered_cases(file, fmt, on_error):
+        yield case
+
+def read_numbered_cases(
+    file: TextIO,
+    fmt: str,
+    on_error: Optional[ErrorHandler] = None
+) -> Iterator[Tuple[int, Case]]:
+    """Like read_cases, but yield (line number, case)"""
+    for line_number, record in read_records(file, fmt, on_error):
+        try:
+            yield line_number, parse_case(record)
+        except ValueError as error:
+            if on_error is None:
+                raise CaseRecordError(line_number, str(error)) from None
+            on_error(line_number, str(error))
+
+def dedupe_cases(
+    numbered: Iterable[Tuple[int, Case]],
+    on_error: ErrorHandler
+) -> Iterator[Tuple[int, Case]]:
+    """Pass on the first row for each (case number, case type); report repeats to ``on_error``"""
+    first_lines: Dict[CaseKey, int] = {}
+    for line_number, case in numbered:
+        first_line = first_lines.setdefault(case.key, line_number)
+        if first_line != line_number:
+            on_error(line_number, f"duplicate of line {first_line} ({case.case_number}, {case.case_type})")
+            continue
+        yield line_number, case
+
+@dataclass
+class ImportResult:
+    """What an import changed in the repository and which rows it rejected"""
+    added: List[CaseKey] = field(default_factory=list)
+    updated: List[CaseKey] = field(default_factory=list)
+    unchanged: int = 0
+    rejected: List[Tuple[int, str]] = field(default_factory=list)  # (input line number, reason)
+
+    def summary(self) -> str:
+        return (
+            f"Imported {len(self.added)} new and {len(self.updated)} updated cases, "
+            f"{self.unchanged} unchanged, rejected {len(self.rejected)} rows"
+        )
+
+def import_cases(
+    file: TextIO,
+    fmt: str,
+    cases: CaseRepository,
+    on_error: Optional[ErrorHandler] = None
+) -> ImportResult:
+    """Stream cases from a CSV or JSON Lines file into a repository.
+
+    Rows are parsed, validated and deduplicated one at a time. The
+    repository is only changed once the whole input has been read, so a
+    read error part way through leaves it as it was. Rows identical to the
+    stored case are left alone so they are not written again. Nothing is
+    saved: the caller commits the whole import with one save and refreshes
+    its views once. Rejected rows are collected in the result and also
+    passed to ``on_error`` if given.
+    """
+    result = ImportResult()
+
+    def rejected(line_number: int, message: str) -> None:
+        result.rejected.append((line_number, message))
+        if on_error is not None:
+            on_error(line_number, message)
+
+    staged = [case for _, case in dedupe_cases(read_numbered_cases(file, fmt, rejected), rejected)]
+    for case in staged:
+        if cases.get(case.case_number, case.case_type) == case:
+            result.unchanged += 1
+        elif cases.upsert(case):
+            result.added.append(case.key)
+        else:
+            result.updated.append(case.key)
+    return result
+
+def export_cases(
+    file: TextIO,
+    fmt: str,
+    cases: CaseRepository,
+    case_types: Optional[Iterable[str]] = None
+) -> int:
+    """Write stored cases (optionally only some types) as case rows; return how many"""
+    writer = RecordWriter(file, fmt, CASE_FIELDS)
+    for case_type in (case_types if case_types is not None else list(cases.maps)):
+        case_map = cases.maps.get(case_type)
+        if case_map is not None:
+            # records() reads lazily loaded entries without building Case objects
+            writer.write_all(case_record(case_number, data) for case_number, data in case_map.records())
+    return writer.count
+
+def write_error_report(file: TextIO, fmt: str, rejected: Iterable[Tuple[int, str]]) -> int:
+    """Write rejected rows as (line, reason) rows; return how many"""
+    writer = RecordWriter(file, fmt, ERROR_FIELDS)
+    writer.write_all({"line": line_number, "reason": reason} for line_number, reason in rejected)
+    return writer.count
+
+def case_record(case_number: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Row for a stored case, from its number and stored fields"""
+    record = {
+        "case_number": case_number,
+        "case_type": data["type"],
+        "last_contact_day": data["day"],
+        "severity": data["severity"]
+    }
+    if data.get("date"):
+        record["last_contact_date"] = data["date"]
+    return record
+
+def schedule_record(case: Case) -> Dict[str, Any]:
+    """Row with a case and its computed schedule.
+
+    Dated cases get ISO dates from the business calendar; others get
+    weekday names.
+    """
+    record: Dict[str, Any] = {
+        "case_number": case.case_number,
+        "case_type": case.case_type,
+        "last_contact_day": case.last_contact_day,
+        "severity": case.severity
+    }
+    if case.last_contact_date is not None:
+        record["last_contact_date"] = case.last_contact_date.isoformat()
+        schedule = ScheduleCalculator.calculate_dates(case.last_contact_date, case.severity)
+        if case.case_type == 'Follow-ups':
+            record["followups"] = [day.isoformat() for day in schedule.followups]
+        else:
+            record["strikes"] = [day.isoformat() for day in schedule.strikes]
+            record["recovery"] = [day.isoformat() for day in schedule.recovery]
+    elif case.case_type == 'Follow-ups':
+        record["followups"] = ScheduleCalculator.calculate_followups(case)
+    else:
+        strikes, recovery = ScheduleCalculator.calculate_strikes(case)
+        record["strikes"] = strikes
+        record["recovery"] = list(recovery)
+    return record
+
+class RecordWriter:
+    """Writes rows to a stream as JSON Lines or CSV, one row at a time.
+
+    In CSV, list values are joined with ``;`` and missing fields are left
+    empty. ``header=False`` leaves out the CSV header, for output written in
+    pieces.
+    """
+
+    def __init__(self, file: TextIO, fmt: str, fields: List[str], header: bool = True):
+        self.fmt = fmt
+        self.count = 0
+        self._file = file
+        self._csv = None
+        if fmt == "csv":
+            self._csv = csv.DictWriter(file, fieldnames=fields, extrasaction="ignore")
+            if header:
+                self._csv.writeheader()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        if self._csv is not None:
+            self._csv.writerow({
+                key: ";".join(value) if isinstance(value, list) else value
+                for key, value in record.items()
+            })
+        else:
+            self._file.write(json.dumps(record) + "\n")
+        self.count += 1
+
+    def write_all(self, records: Iterable[Dict[str, Any]]) -> None:
+        for record in records:
+            self.write(record)
@@ -0,0 +1,139 @@
+# src/utils/file_lock.py
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# The generation is stored as fixed-width text at the start of the lock file,
+# so it can be rewritten in place and read at any time without the lock
+_GENERATION_WIDTH = 20
+# msvcrt locks byte ranges, so the lock is taken on a byte past the
+# generation and readers are never blocked by it
+_WINDOWS_LOCK_OFFSET = 64
+
+# (inode, size, modification time in ns) of a file
+FileStat = Tuple[int, int, int]
+
+def file_stat(path: str) -> Optional[FileStat]:
+    """Return what identifies the current contents of a file, or None if it does not exist.
+
+    Files are replaced by renaming, which changes the inode, and appended to,
+    which changes the size, so comparing stats is a cheap change check.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+class FileLock:
+    """Advisory exclusive lock shared by every process using the same data files.
+
+    The lock is held on a small sidecar file with ``flock`` (``msvcrt.locking``
+    on Windows) and also carries a generation counter that writers bump on
+    every change, so other instances can spot a change with one small read.
+
+    There is one ``FileLock`` per path in a process (see ``for_path``); it is
+    re-entrant and also serializes the threads of the process, because an
+    ``flock`` taken twice by one process on different descriptors would
+    deadlock.
+    """
+
+    _instances: Dict[str, 'FileLock'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    @classmethod
+    def for_path(cls, path: str) -> 'FileLock':
+        """Return the process-wide lock for ``path``"""
+        key = os.path.abspath(path)
+        with cls._instances_lock:
+            lock = cls._instances.get(key)
+            if lock is None:
+                lock = cls._instances[key] = cls(path)
+            return lock
+
+    def __enter__(self) -> 'FileLock':
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._acquire()
+            except BaseException:
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self._release()
+        self._thread_lock.release()
+
+    def _acquire(self) -> None:
+        """Open the lock file and block until the OS lock is ours"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        file = os.fdopen(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666), "r+b")
+        try:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+            else:
+                file.seek(_WINDOWS_LOCK_OFFSET)
+                while True:
+                    try:
+                        # LK_LOCK retries for about ten seconds before giving up
+                        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+        except BaseException:
+            file.close()
+            raise
+        self._file = file
+
+    def _release(self) -> None:
+        file, self._file = self._file, None
+        try:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+            else:
+                file.seek(_WINDOWS_LOCK_OFFSET)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            file.close()
+
+    def generation(self) -> int:
+        """Return the generation counter; does not need the lock"""
+        try:
+            with open(self.path, "rb") as file:
+                text = file.read(_GENERATION_WIDTH)
+        except FileNotFoundError:
+            return 0
+        try:
+            return int(text)
+        except ValueError:
+            # Empty, or caught half-written; the next read sees the new value
+            return 0
+
+    def bump(self) -> int:
+        """Increment and return the generation counter; the lock must be held"""
+        if self._file is None:
+            raise RuntimeError(f"{self.path} is not locked")
+        generation = self.generation() + 1
+        self._file.seek(0)
+        self._file.write(str(generation).zfill(_GENERATION_WIDTH).encode("ascii"))
+        self._file.flush()
+        return generation
+
+    def __repr__(self) -> str:
+        return f"FileLock({self.path!r}, held={self._depth > 0})"
@@ -0,0 +1,234 @@
+# src/utils/instrumentation.py
+import functools
+import importlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+logger = logging.getLogger("schedule_calculator")
+
+class LatencyHistogram:
+    """Latency samples in power-of-two microsecond buckets.
+
+    Bucket ``i`` counts samples below ``2 ** i`` microseconds (and at least
+    ``2 ** (i - 1)``), so percentiles are accurate to within a factor of two
+    whatever the range, in constant memory.
+    """
+    __slots__ = ('count', 'total', 'minimum', 'maximum', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float('inf')
+        self.maximum = 0.0
+        self.buckets: List[int] = []
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+        index = int(seconds * 1e6).bit_length()
+        if index >= len(self.buckets):
+            self.buckets.extend([0] * (index + 1 - len(self.buckets)))
+        self.buckets[index] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound, in seconds, of the bucket holding the given fraction of samples"""
+        target = fraction * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= target and bucket:
+                return min((1 << index) / 1e6, self.maximum)
+        return self.maximum
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "min_ms": self.minimum * 1000 if self.count else 0.0,
+            "p50_ms": self.percentile(0.5) * 1000,
+            "p95_ms": self.percentile(0.95) * 1000,
+            "p99_ms": self.percentile(0.99) * 1000,
+            "max_ms": self.maximum * 1000,
+            "buckets_us": {f"<{1 << index}": bucket for index, bucket in enumerate(self.buckets) if bucket}
+        }
+
+class _Span:
+    """Context manager that times a block into a histogram"""
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> '_Span':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        Instrumentation.record(self.name, time.perf_counter() - self.start, failed=exc_type is not None)
+
+class Instrumentation:
+    """Timing spans, counters and latency histograms behind a single toggle.
+
+    ``enable`` swaps timed wrappers in for the StorageManager and
+    ScheduleCalculator methods listed in ``_TARGETS`` and ``disable`` puts
+    the originals back, so those calls cost nothing while it is off.
+    MainWindow handlers, which Tk holds as bound methods, are wrapped with
+    ``instrumented`` instead and check the flag on each event.
+    """
+
+    enabled = False
+    _lock = threading.Lock()
+    _counters: Dict[str, int] = {}
+    _histograms: Dict[str, LatencyHistogram] = {}
+    _started = time.time()
+    # (class, attribute) -> original descriptor, while enabled
+    _originals: Dict[Tuple[type, str], Any] = {}
+
+    _TARGETS = (
+        (".storage", "StorageManager", (
+            "load_cases", "save_cases", "collect_changes", "write_changes", "query_cases"
+        )),
+        (".scheduler", "ScheduleCalculator", (
+            "calculate_followups", "calculate_strikes", "format_schedule", "calculate_next_business_day"
+        )),
+    )
+
+    @classmethod
+    def enable(cls) -> None:
+        """Start recording and log every span"""
+        if cls.enabled:
+            return
+        for module_name, class_name, attributes in cls._TARGETS:
+            target = getattr(importlib.import_module(module_name, __package__), class_name)
+            for attribute in attributes:
+                original = target.__dict__[attribute]
+                cls._originals[(target, attribute)] = original
+                setattr(target, attribute, cls._wrap_descriptor(f"{class_name}.{attribute}", original))
+        if not logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        cls.enabled = True
+        logger.info("Verbose logging enabled")
+
+    @classmethod
+    def disable(cls) -> None:
+        """Stop recording and restore the original methods; collected data is kept"""
+        if not cls.enabled:
+            return
+        cls.enabled = False
+        for (target, attribute), original in cls._originals.items():
+            setattr(target, attribute, original)
+        cls._originals.clear()
+        logger.info("Verbose logging disabled")
+        logger.setLevel(logging.WARNING)
+
+    @staticmethod
+    def _wrap_descriptor(name: str, original: Any) -> Any:
+        """Wrap a function, classmethod or staticmethod in a timing span"""
+        if isinstance(original, (classmethod, staticmethod)):
+            return type(original)(_timed(name, original.__func__))
+        return _timed(name, original)
+
+    @classmethod
+    def span(cls, name: str) -> _Span:
+        """Time a block: ``with Instrumentation.span("name"): ...``"""
+        return _Span(name)
+
+    @classmethod
+    def record(cls, name: str, seconds: float, failed: bool = False) -> None:
+        """Add one timed call to the histogram for ``name``"""
+        with cls._lock:
+            histogram = cls._histograms.get(name)
+            if histogram is None:
+                histogram = cls._histograms[name] = LatencyHistogram()
+            histogram.add(seconds)
+            if failed:
+                cls._counters[f"{name}.errors"] = cls._counters.get(f"{name}.errors", 0) + 1
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s took %.3f ms%s", name, seconds * 1000, " (failed)" if failed else "")
+
+    @classmethod
+    def count(cls, name: str, amount: int = 1) -> None:
+        """Increment a counter while instrumentation is enabled"""
+        if cls.enabled:
+            with cls._lock:
+                cls._counters[name] = cls._counters.get(name, 0) + amount
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget every counter and histogram"""
+        with cls._lock:
+            cls._counters = {}
+            cls._histograms = {}
+            cls._started = time.time()
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, Any]:
+        """Return all metrics as plain data"""
+        with cls._lock:
+            return {
+                "since": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(cls._started)),
+                "enabled": cls.enabled,
+                "counters": dict(cls._counters),
+                "spans": {name: histogram.summary() for name, histogram in sorted(cls._histograms.items())}
+            }
+
+    @classmethod
+    def dump(cls, path: str) -> None:
+        """Write all metrics to ``path`` as JSON"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(cls.snapshot(), file, indent=4)
+
+    @classmethod
+    def format_stats(cls) -> str:
+        """Render the metrics as a fixed-width table"""
+        snapshot = cls.snapshot()
+        lines = [
+            f"Since {snapshot['since']}, recording {'on' if snapshot['enabled'] else 'off'}",
+            "",
+            f"{'span':<44}{'calls':>8}{'mean ms':>10}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}"
+        ]
+        for name, stats in snapshot["spans"].items():
+            lines.append(
+                f"{name:<44}{stats['count']:>8}{stats['mean_ms']:>10.3f}{stats['p50_ms']:>9.3f}"
+                f"{stats['p95_ms']:>9.3f}{stats['p99_ms']:>9.3f}{stats['max_ms']:>9.3f}"
+            )
+        if snapshot["counters"]:
+            lines += ["", f"{'counter':<44}{'value':>8}"]
+            lines += [f"{name:<44}{value:>8}" for name, value in sorted(snapshot["counters"].items())]
+        return "\n".join(lines)
+
+def _timed(name: str, func: Callable) -> Callable:
+    """Return ``func`` wrapped in a span; used while instrumentation is enabled"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _Span(name):
+            return func(*args, **kwargs)
+    return wrapper
+
+def instrumented(func: Callable) -> Callable:
+    """Decorator for UI handlers: timed while instrumentation is enabled.
+
+    Handlers are registered with Tk as bound methods, so they cannot be
+    swapped like the library methods; when disabled this costs one flag
+    check per event.
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not Instrumentation.enabled:
+            return func(*args, **kwargs)
+        with _Span(name):
+            return func(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,252 @@
+# src/utils/journal.py
+import contextlib
+import json
+import os
+import threading
+import uuid
+from typing import Any, ContextManager, Dict, Iterable, List, Optional, Tuple
+from .file_lock import file_stat
+
+RawCases = Dict[str, Dict[str, Dict[str, Any]]]
+# Stored data, or None for a deleted case, by (case number, case type)
+RawChanges = Dict[Tuple[str, str], Optional[Dict[str, Any]]]
+# (id of a journal file, bytes of it read)
+JournalPosition = Tuple[Optional[str], int]
+
+class CaseJournal:
+    """Append-only change log on top of a JSON snapshot of all cases.
+
+    Each mutation is appended to the journal as one JSON line. Loading reads
+    the snapshot and replays the journal over it. Once the journal holds more
+    than ``compact_threshold`` records it is rotated aside and folded into a
+    new snapshot on a background thread, so appends never wait for it.
+
+    Every journal file starts with a header carrying a unique id, and the
+    last one folded in is kept next to the snapshot, so another process
+    can follow the journal across rotations (see ``changes_since``).
+
+    When several processes share the files, pass a ``file_lock`` (see
+    ``FileLock``); it is held, before the thread lock, whenever the files
+    are read or changed.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        journal_path: str,
+        compact_threshold: int,
+        file_lock: Optional[ContextManager] = None
+    ):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.compacting_path = journal_path + ".compacting"
+        self.folded_path = journal_path + ".folded"
+        self.compact_threshold = compact_threshold
+        self._file_lock = file_lock if file_lock is not None else contextlib.nullcontext()
+        self._lock = threading.Lock()
+        self._record_count = 0
+        self._compactor: Optional[threading.Thread] = None
+
+    @staticmethod
+    def put_record(case_type: str, case_number: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a journal record that stores a case"""
+        return {"op": "put", "type": case_type, "number": case_number, "data": data}
+
+    @staticmethod
+    def delete_record(case_type: str, case_number: str) -> Dict[str, Any]:
+        """Build a journal record that removes a case"""
+        return {"op": "del", "type": case_type, "number": case_number}
+
+    @staticmethod
+    def _file_id(path: str) -> Optional[str]:
+        """Return the id in a journal file's header, or None if it has none or does not exist"""
+        try:
+            with open(path, "rb") as file:
+                record = json.loads(file.readline())
+        except (OSError, ValueError):
+            return None
+        return record.get("id") if record.get("op") == "start" else None
+
+    @staticmethod
+    def _replay(path: str, data: RawCases) -> int:
+        """Apply the records in a journal file to ``data`` and return how many were read"""
+        if not os.path.exists(path):
+            return 0
+
+        count = 0
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A crash mid-append can leave a partial last line behind
+                    continue
+                if record["op"] == "start":
+                    continue
+                bucket = data.setdefault(record["type"], {})
+                if record["op"] == "put":
+                    bucket[record["number"]] = record["data"]
+                else:
+                    bucket.pop(record["number"], None)
+                count += 1
+        return count
+
+    @staticmethod
+    def _read_changes(path: str, offset: int, changes: RawChanges) -> None:
+        """Collect the final state of each case touched by the records after ``offset``"""
+        with open(path, "rb") as file:
+            file.seek(offset)
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record["op"] == "start":
+                    continue
+                key = (record["number"], record["type"])
+                changes[key] = record["data"] if record["op"] == "put" else None
+
+    def _read_snapshot(self) -> RawCases:
+        """Read the snapshot file, or return an empty mapping if there is none"""
+        if not os.path.exists(self.snapshot_path):
+            return {}
+        with open(self.snapshot_path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def _write_temp_snapshot(self, data: RawCases) -> str:
+        """Write ``data`` next to the snapshot file and return the temp path"""
+        os.makedirs(os.path.dirname(self.snapshot_path) or ".", exist_ok=True)
+        # Per process, as another instance may be compacting at the same time
+        temp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=4)
+            file.flush()
+            os.fsync(file.fileno())
+        return temp_path
+
+    def load(self) -> RawCases:
+        """Rebuild the full case data from the snapshot and the journal"""
+        with self._file_lock, self._lock:
+            data = self._read_snapshot()
+            # A leftover rotated journal means a compaction was interrupted;
+            # replaying it again is harmless because records are idempotent.
+            self._replay(self.compacting_path, data)
+            self._record_count = self._replay(self.journal_path, data)
+        return data
+
+    def _journal_files(self) -> List[Tuple[str, Optional[str], int]]:
+        """Return (path, id, size) of the journal files that exist, oldest first"""
+        files = []
+        for path in (self.folded_path, self.compacting_path, self.journal_path):
+            stat = file_stat(path)
+            if stat is not None:
+                files.append((path, self._file_id(path), stat[1]))
+        return files
+
+    def position(self) -> JournalPosition:
+        """Return the end of the newest journal file, for ``changes_since``"""
+        with self._file_lock, self._lock:
+            files = self._journal_files()
+        if not files:
+            return None, 0
+        _, file_id, size = files[-1]
+        return file_id, size
+
+    def changes_since(self, position: JournalPosition) -> Optional[RawChanges]:
+        """Return the changes appended since ``position``, usually by another process.
+
+        Only what was appended after the position is read, following the
+        journal through one rotation and compaction. Returns None if the
+        records after it are no longer in any journal file; the caller then
+        has to ``load`` everything again.
+        """
+        file_id, offset = position
+        changes: RawChanges = {}
+        with self._file_lock, self._lock:
+            files = self._journal_files()
+            ids = [found_id for _, found_id, _ in files]
+            if file_id is None:
+                # There was no journal at all; only new files can exist now,
+                # unless one was already folded in
+                if self.folded_path in (path for path, _, _ in files):
+                    return None
+                start = 0
+                offset = 0
+            elif file_id in ids:
+                start = ids.index(file_id)
+                if files[start][2] < offset:
+                    return None
+            else:
+                return None
+            for index, (path, _, _) in enumerate(files[start:]):
+                self._read_changes(path, offset if index == 0 else 0, changes)
+        return changes
+
+    def append(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Append records to the journal in a single write"""
+        lines = "".join(json.dumps(record) + "\n" for record in records)
+        if not lines:
+            return
+
+        with self._file_lock, self._lock:
+            os.makedirs(os.path.dirname(self.journal_path) or ".", exist_ok=True)
+            with open(self.journal_path, "a", encoding="utf-8") as file:
+                if file.tell() == 0:
+                    file.write(json.dumps({"op": "start", "id": uuid.uuid4().hex}) + "\n")
+                file.write(lines)
+            self._record_count += lines.count("\n")
+            if self._record_count >= self.compact_threshold:
+                self._start_compaction()
+
+    def _start_compaction(self) -> None:
+        """Rotate the journal aside and fold it into the snapshot in the background"""
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        # A leftover rotated journal (possibly being folded in by another
+        # process) is folded in first; the current journal is rotated on the
+        # next append after that compaction finishes.
+        if not os.path.exists(self.compacting_path):
+            os.replace(self.journal_path, self.compacting_path)
+            self._record_count = 0
+        self._spawn_compactor()
+
+    def _spawn_compactor(self) -> None:
+        """Start the background thread that performs the compaction"""
+        self._compactor = threading.Thread(
+            target=self._compact,
+            name="CaseJournalCompactor",
+            daemon=True
+        )
+        self._compactor.start()
+
+    def _compact(self) -> None:
+        """Write a new snapshot containing the rotated journal, then drop it"""
+        with self._file_lock:
+            snapshot = file_stat(self.snapshot_path)
+            rotated = file_stat(self.compacting_path)
+            if rotated is None:
+                return  # Another process folded it in already
+            data = self._read_snapshot()
+        # Folded without the lock so appends, which go to the new journal,
+        # never wait for it
+        try:
+            self._replay(self.compacting_path, data)
+        except FileNotFoundError:
+            return  # Another process folded it in meanwhile
+        temp_path = self._write_temp_snapshot(data)
+        # Swap the snapshot and retire the rotated journal together so a
+        # concurrent load never sees one without the other, unless another
+        # process got there first. The rotated journal is kept as the folded
+        # one for processes that have not read all of it yet.
+        with self._file_lock, self._lock:
+            if file_stat(self.snapshot_path) == snapshot and file_stat(self.compacting_path) == rotated:
+                os.replace(temp_path, self.snapshot_path)
+                os.replace(self.compacting_path, self.folded_path)
+            else:
+                os.remove(temp_path)
+
+    def wait_for_compaction(self) -> None:
+        """Block until a running compaction has finished"""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
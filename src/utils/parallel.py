@@ -0,0 +1,164 @@
+# src/utils/parallel.py
+import datetime
+import io
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+from ..models.case import Case, CASE_TYPE_CODES, DAY_CODES, SEVERITY_CODES
+from ..config import Config
+from .business_calendar import BusinessCalendar
+from .case_io import SCHEDULE_FIELDS, RecordWriter, read_cases, schedule_record
+from .scheduler import ScheduleCalculator
+
+class ChunkResult(NamedTuple):
+    """Serialized schedules for one chunk of input, plus its rejected rows"""
+    text: str
+    count: int
+    errors: List[Tuple[int, str]]  # (input line number, reason)
+
+def _init_worker(
+    weekdays: List[str],
+    case_types: List[str],
+    severities: List[str],
+    calendar: Optional[BusinessCalendar]
+) -> None:
+    """Give a worker process the parent's Config lists and business calendar"""
+    Config.WEEKDAYS = weekdays
+    Config.CASE_TYPES = case_types
+    Config.SEVERITY_LEVELS = severities
+    # None if the parent has not built one; the worker then builds its own
+    ScheduleCalculator.set_calendar(calendar)
+
+def _render(cases: Iterable[Case], output_format: str, errors: List[Tuple[int, str]]) -> ChunkResult:
+    """Compute and serialize schedules for a chunk of cases"""
+    buffer = io.StringIO()
+    writer = RecordWriter(buffer, output_format, SCHEDULE_FIELDS, header=False)
+    writer.write_all(schedule_record(case) for case in cases)
+    return ChunkResult(buffer.getvalue(), writer.count, errors)
+
+def _render_codes(job: Tuple[Any, ...]) -> ChunkResult:
+    """Worker: decode a chunk sent as code table codes and render it"""
+    type_values, day_values, severity_values, numbers, codes, dates, output_format = job
+    dates = array('l', dates)
+    cases = (
+        Case(
+            number,
+            type_values[codes[i * 3]],
+            day_values[codes[i * 3 + 1]],
+            severity_values[codes[i * 3 + 2]],
+            datetime.date.fromordinal(dates[i]) if dates[i] else None
+        )
+        for i, number in enumerate(numbers)
+    )
+    return _render(cases, output_format, [])
+
+def _render_lines(job: Tuple[Any, ...]) -> ChunkResult:
+    """Worker: parse a chunk of raw input lines, validate and render it"""
+    input_format, header_line, first_line, lines, output_format = job
+    errors: List[Tuple[int, str]] = []
+
+    def rejected(line: int, message: str) -> None:
+        # Line numbers within the chunk, shifted to the whole input
+        errors.append((first_line + line - 1, message))
+
+    if input_format == "csv":
+        source = io.StringIO("".join([header_line] + lines))
+        first_line -= 1  # The header added above takes up line one
+    else:
+        source = io.StringIO("".join(lines))
+    return _render(read_cases(source, input_format, on_error=rejected), output_format, errors)
+
+class ParallelScheduleExecutor:
+    """Computes schedules for large inputs on a pool of worker processes.
+
+    Input is split into chunks of ``chunk_size`` cases. Chunks are sent to
+    the workers as compact encodings: raw input lines, or case numbers plus
+    a byte array of code table codes, never pickled ``Case`` objects. Each
+    worker returns its chunk already serialized, and results are yielded in
+    input order. At most two chunks per worker are in flight, so memory
+    stays bounded however large the input is.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: Optional[int] = None):
+        self.workers = workers or Config.PARALLEL_WORKERS or os.cpu_count() or 1
+        self.chunk_size = chunk_size or Config.PARALLEL_CHUNK_SIZE
+
+    def _ordered(self, worker, jobs: Iterable[Tuple[Any, ...]]) -> Iterator[ChunkResult]:
+        """Run jobs on the pool and yield their results in submission order"""
+        if self.workers == 1:
+            # Not worth starting processes for
+            for job in jobs:
+                yield worker(job)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(Config.WEEKDAYS, Config.CASE_TYPES, Config.SEVERITY_LEVELS, ScheduleCalculator._calendar)
+        ) as pool:
+            pending = deque()
+            for job in jobs:
+                pending.append(pool.submit(worker, job))
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _code_jobs(self, cases: Iterable[Case], output_format: str) -> Iterator[Tuple[Any, ...]]:
+        """Encode cases as (numbers, 3 codes per case, date ordinals) chunks"""
+        numbers: List[str] = []
+        codes = array('B')
+        dates = array('l')  # 0 for cases without a date
+        for case in cases:
+            numbers.append(case.case_number)
+            codes.extend((case.type_code, case.day_code, case.severity_code))
+            dates.append(case.last_contact_date.toordinal() if case.last_contact_date is not None else 0)
+            if len(numbers) >= self.chunk_size:
+                yield self._code_job(numbers, codes, dates, output_format)
+                numbers, codes, dates = [], array('B'), array('l')
+        if numbers:
+            yield self._code_job(numbers, codes, dates, output_format)
+
+    @staticmethod
+    def _code_job(numbers: List[str], codes: array, dates: array, output_format: str) -> Tuple[Any, ...]:
+        # The code tables only grow, so sending their values with each chunk
+        # keeps workers decoding with the parent's codes
+        return (
+            CASE_TYPE_CODES.values[:], DAY_CODES.values[:], SEVERITY_CODES.values[:],
+            numbers, codes.tobytes(), dates.tobytes(), output_format
+        )
+
+    def render_cases(self, cases: Iterable[Case], output_format: str) -> Iterator[ChunkResult]:
+        """Yield serialized schedules for ``cases``, chunk by chunk, in order"""
+        if len(CASE_TYPE_CODES.values) > 256 or len(DAY_CODES.values) > 256 or len(SEVERITY_CODES.values) > 256:
+            raise ValueError("Code tables no longer fit the one-byte encoding")
+        return self._ordered(_render_codes, self._code_jobs(cases, output_format))
+
+    def render_file(self, file: TextIO, input_format: str, output_format: str) -> Iterator[ChunkResult]:
+        """Yield serialized schedules for a CSV or JSON Lines stream, chunk by chunk, in order.
+
+        Only whole lines are read in the parent; parsing, validation and
+        scheduling all happen in the workers. CSV fields must not contain
+        line breaks.
+        """
+        header_line = ""
+        first_line = 1
+        if input_format == "csv":
+            header_line = file.readline()
+            first_line = 2
+
+        def jobs() -> Iterator[Tuple[Any, ...]]:
+            line_number = first_line
+            lines: List[str] = []
+            for line in file:
+                lines.append(line)
+                if len(lines) >= self.chunk_size:
+                    yield (input_format, header_line, line_number, lines, output_format)
+                    line_number += len(lines)
+                    lines = []
+            if lines:
+                yield (input_format, header_line, line_number, lines, output_format)
+
+        return self._ordered(_render_lines, jobs())
@@ -0,0 +1,157 @@
+# src/utils/save_worker.py
+import queue
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+from ..config import Config
+from .storage import ChangeSet
+from .instrumentation import Instrumentation
+
+_STOP = object()
+
+class SaveWorker:
+    """Writes change sets on a background thread so the UI never waits on disk.
+
+    ``submit`` hands a ChangeSet to a bounded queue and returns at once. The
+    worker waits ``coalesce_delay`` seconds after the first change set of a
+    burst, then merges everything queued into one write. A failed write is
+    kept and retried with the next batch; the error is queued for the UI
+    thread to pick up with ``poll_errors``.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[ChangeSet], None],
+        max_pending: int = Config.SAVE_QUEUE_SIZE,
+        coalesce_delay: float = Config.SAVE_COALESCE_SECONDS,
+        retry_delay: float = Config.SAVE_RETRY_SECONDS
+    ):
+        self._write = write
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._errors: "queue.SimpleQueue[Exception]" = queue.SimpleQueue()
+        self._coalesce_delay = coalesce_delay
+        self._retry_delay = retry_delay
+        # Changes that did not fit in the queue; only touched by the submitting thread
+        self._overflow: Optional[ChangeSet] = None
+        # Batch whose last write failed, retried with the next one
+        self._failed: Optional[ChangeSet] = None
+        # Change sets queued or being written, for flush()
+        self._outstanding = 0
+        self._done = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="SaveWorker", daemon=True)
+        self._thread.start()
+
+    def _put(self, item, block: bool, timeout: Optional[float] = None) -> None:
+        """Queue an item, counting it as outstanding until it is written"""
+        with self._done:
+            self._outstanding += 1
+        try:
+            self._queue.put(item, block, timeout)
+        except queue.Full:
+            with self._done:
+                self._outstanding -= 1
+            raise
+
+    def submit(self, changes: ChangeSet) -> None:
+        """Queue changes for writing without blocking"""
+        if self._overflow is not None:
+            self._overflow.merge(changes)
+            changes, self._overflow = self._overflow, None
+        if not changes:
+            return
+        try:
+            self._put(changes, block=False)
+        except queue.Full:
+            # The writer is behind; hold the changes here and fold later
+            # submits into them until there is room again
+            self._overflow = changes
+
+    @property
+    def idle(self) -> bool:
+        """Whether everything submitted has been written; call from the UI thread"""
+        with self._done:
+            return self._outstanding == 0 and self._overflow is None and self._failed is None
+
+    def poll_errors(self) -> List[Exception]:
+        """Return write errors raised since the last poll; call from the UI thread"""
+        if self._overflow is not None:
+            self.submit(ChangeSet())
+        errors = []
+        while True:
+            try:
+                errors.append(self._errors.get_nowait())
+            except queue.Empty:
+                return errors
+
+    def _put_overflow(self, timeout: Optional[float]) -> None:
+        """Queue held-back changes, waiting for room if needed"""
+        if self._overflow is not None:
+            overflow, self._overflow = self._overflow, None
+            self._put(overflow, block=True, timeout=timeout)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted change is written; False on timeout or failure"""
+        self._put_overflow(timeout)
+        with self._done:
+            self._done.wait_for(
+                lambda: self._outstanding == 0 or self._failed is not None,
+                timeout
+            )
+            return self._outstanding == 0 and self._failed is None
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """Write what is pending, then stop the thread; False if changes were not saved"""
+        self._put_overflow(timeout)
+        self._queue.put(_STOP, timeout=timeout)
+        self._thread.join(timeout)
+        return not self._thread.is_alive() and self._failed is None
+
+    def _next_batch(self) -> Tuple[ChangeSet, int, bool]:
+        """Wait for changes and merge the rest of the burst into one batch.
+
+        Returns the batch, how many submitted change sets it holds and
+        whether the worker was asked to stop.
+        """
+        try:
+            item = self._queue.get(timeout=self._retry_delay if self._failed else None)
+        except queue.Empty:
+            return ChangeSet(), 0, False  # Nothing new; just retry the failed batch
+        if item is _STOP:
+            return ChangeSet(), 0, True
+
+        batch, count = item, 1
+        if self._coalesce_delay:
+            # Let the rest of a burst of edits arrive before writing
+            time.sleep(self._coalesce_delay)
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return batch, count, False
+            if item is _STOP:
+                return batch, count, True
+            batch.merge(item)
+            count += 1
+
+    def _run(self) -> None:
+        while True:
+            batch, count, stopping = self._next_batch()
+            if self._failed is not None:
+                self._failed.merge(batch)
+                batch, self._failed = self._failed, None
+            failed = None
+            if batch:
+                try:
+                    self._write(batch)
+                except Exception as error:
+                    failed = batch
+                    self._errors.put(error)
+                # How well bursts coalesce: change sets submitted vs. writes made
+                Instrumentation.count("SaveWorker.change_sets", count)
+                Instrumentation.count("SaveWorker.writes")
+            with self._done:
+                self._failed = failed
+                self._outstanding -= count
+                self._done.notify_all()
+            if stopping:
+                return
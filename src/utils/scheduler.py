@@ -1,6 +1,21 @@
-from typing import List, Tuple
+import datetime
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from ..models.case import Case
 from ..config import Config
+from .business_calendar import BusinessCalendar
+
+class ScheduleEntry(NamedTuple):
+    """Precomputed schedule for one (case type, day, severity) combination"""
+    followups: Tuple[str, ...]
+    strikes: Tuple[str, ...]
+    recovery: Tuple[str, str]
+
+class DateSchedule(NamedTuple):
+    """Schedule for a case with a last contact date, as calendar dates"""
+    followups: Tuple[datetime.date, ...]
+    strikes: Tuple[datetime.date, ...]
+    recovery: Tuple[datetime.date, datetime.date]
 
 class ScheduleCalculator:
     """Handles calculation of follow-up and strike schedules"""
@@ -10,9 +25,48 @@ class ScheduleCalculator:
         """Check if the day is a weekend (5 and 6 represent Saturday and Sunday)"""
         return day_index in [5, 6]
 
+    # When True, business-day arithmetic walks day by day instead of using
+    # the precomputed offset table. Useful for cross-checking the fast path.
+    reference_mode: bool = False
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _week_offset_table(cls, week_length: int) -> Tuple[Tuple[int, ...], ...]:
+        """Build the table of business-day targets for each start day.
+
+        Row ``s`` lists, in order, the indices of the business days that follow
+        day ``s`` within one full cycle of ``week_length`` days.
+        """
+        table = []
+        for start in range(week_length):
+            row = tuple(
+                (start + offset) % week_length
+                for offset in range(1, week_length + 1)
+                if not cls.is_weekend((start + offset) % week_length)
+            )
+            table.append(row)
+        return tuple(table)
+
     @classmethod
     def calculate_next_business_day(cls, start_day_index: int, interval: int) -> int:
         """Calculate the next business day, skipping weekends"""
+        if cls.reference_mode:
+            return cls._calculate_next_business_day_reference(start_day_index, interval)
+
+        if interval <= 0:
+            return start_day_index
+
+        row = cls._week_offset_table(len(Config.WEEKDAYS))[start_day_index]
+        if not row:
+            raise ValueError("Config.WEEKDAYS contains no business days")
+
+        # Every full cycle lands back on the same weekday, so only the
+        # position within the cycle matters.
+        return row[(interval - 1) % len(row)]
+
+    @classmethod
+    def _calculate_next_business_day_reference(cls, start_day_index: int, interval: int) -> int:
+        """Calculate the next business day by walking one day at a time"""
         current_index = start_day_index
         days_added = 0
         
@@ -22,23 +76,68 @@ class ScheduleCalculator:
                 days_added += 1
         
         return current_index
+
+    @classmethod
+    def verify_closed_form(cls, max_interval: int = 10_000) -> bool:
+        """Check the offset table against the day-by-day walk.
+
+        Compares every start day with every interval from 0 to ``max_interval``,
+        then every (case type, day, severity) entry of the schedule table with
+        one rebuilt in ``reference_mode``, and raises ``AssertionError`` on the
+        first mismatch.
+        """
+        for start in range(len(Config.WEEKDAYS)):
+            # Walking N business days is N single-day walks, so the reference
+            # result for each interval extends the previous one by one step.
+            expected = start
+            for interval in range(max_interval + 1):
+                if interval:
+                    expected = cls._calculate_next_business_day_reference(expected, 1)
+                actual = cls.calculate_next_business_day(start, interval)
+                if actual != expected:
+                    raise AssertionError(
+                        f"start={start} interval={interval}: "
+                        f"expected {expected}, got {actual}"
+                    )
+
+        table = cls.schedule_table()
+        previous_mode = cls.reference_mode
+        cls.reference_mode = True
+        try:
+            for (case_type, day, severity), entry in table.items():
+                expected_entry = ScheduleEntry(
+                    cls._compute_followups(day, severity),
+                    *cls._compute_strikes(day, severity)
+                )
+                if entry != expected_entry:
+                    raise AssertionError(
+                        f"{case_type} {day} {severity}: "
+                        f"expected {expected_entry}, got {entry}"
+                    )
+        finally:
+            cls.reference_mode = previous_mode
+        return True
     
     @classmethod
-    def calculate_followups(cls, case: Case) -> List[str]:
-        """Calculate follow-up schedule for a case"""
-        day_index = Config.WEEKDAYS.index(case.last_contact_day)
-        interval = 1 if case.severity == 'B' else 2  # Adjusted for severity 'C'
+    def _compute_followups(cls, last_contact_day: str, severity: str) -> Tuple[str, ...]:
+        """Compute follow-up days without consulting the schedule table"""
+        day_index = Config.WEEKDAYS.index(last_contact_day)
+        interval = 1 if severity == 'B' else 2  # Adjusted for severity 'C'
        
-        return [
+        return tuple(
             Config.WEEKDAYS[cls.calculate_next_business_day(day_index, (i + 1) * interval)]
             for i in range(3)  # Start from the next day after last contact
-        ]
+        )
     
     @classmethod
-    def calculate_strikes(cls, case: Case) -> Tuple[List[str], Tuple[str, str]]:
-        """Calculate strike schedule and recovery period for a case"""
-        day_index = Config.WEEKDAYS.index(case.last_contact_day)
-        intervals = [1 if case.severity == 'B' else 2, 2, 2]
+    def _compute_strikes(
+        cls,
+        last_contact_day: str,
+        severity: str
+    ) -> Tuple[Tuple[str, ...], Tuple[str, str]]:
+        """Compute strike days and recovery period without consulting the schedule table"""
+        day_index = Config.WEEKDAYS.index(last_contact_day)
+        intervals = [1 if severity == 'B' else 2, 2, 2]
        
         # Calculate strike days
         current_index = day_index
@@ -53,22 +152,201 @@ class ScheduleCalculator:
                 recovery_start = Config.WEEKDAYS[cls.calculate_next_business_day(current_index, 1)]
                 recovery_end = Config.WEEKDAYS[cls.calculate_next_business_day(current_index, 2)]
        
-        return strike_days, (recovery_start, recovery_end)
+        return tuple(strike_days), (recovery_start, recovery_end)
+
+    # Schedule table keyed on (case type, last contact day, severity). It is
+    # rebuilt whenever the Config lists it was built from change.
+    _table_signature: Optional[Tuple[Tuple[str, ...], ...]] = None
+    _schedule_table: Dict[Tuple[str, str, str], ScheduleEntry] = {}
+    _format_cache: Dict[Tuple[str, str, str], str] = {}
+
+    @staticmethod
+    def _config_signature() -> Tuple[Tuple[str, ...], ...]:
+        """Snapshot the Config lists the schedule table depends on"""
+        return (
+            tuple(Config.WEEKDAYS),
+            tuple(Config.CASE_TYPES),
+            tuple(Config.SEVERITY_LEVELS)
+        )
+
+    @classmethod
+    def schedule_table(cls) -> Dict[Tuple[str, str, str], ScheduleEntry]:
+        """Return the precomputed schedule table, rebuilding it if Config changed"""
+        signature = cls._config_signature()
+        if signature != cls._table_signature:
+            weekdays, case_types, severities = signature
+            table = {}
+            for day in weekdays:
+                for severity in severities:
+                    entry = ScheduleEntry(
+                        cls._compute_followups(day, severity),
+                        *cls._compute_strikes(day, severity)
+                    )
+                    for case_type in case_types:
+                        table[(case_type, day, severity)] = entry
+            cls._schedule_table = table
+            cls._format_cache = {}
+            cls._table_signature = signature
+        return cls._schedule_table
+
+    # Business-day index for dated cases, built on first use
+    _calendar: Optional[BusinessCalendar] = None
+
+    @classmethod
+    def calendar(cls) -> BusinessCalendar:
+        """Return the business calendar, building it from Config on first use"""
+        if cls._calendar is None:
+            cls._calendar = BusinessCalendar.from_config()
+        return cls._calendar
+
+    @classmethod
+    def set_calendar(cls, calendar: Optional[BusinessCalendar]) -> None:
+        """Use another calendar; None rebuilds it from Config (e.g. after editing holidays)"""
+        cls._calendar = calendar
+
+    @classmethod
+    def calculate_dates(cls, last_contact_date: datetime.date, severity: str) -> DateSchedule:
+        """Calculate follow-up, strike and recovery dates, skipping weekends and holidays.
+
+        Same intervals as the weekday schedule, but counted on the business
+        calendar, so schedules cross weeks and holidays correctly.
+        """
+        calendar = cls.calendar()
+        interval = 1 if severity == 'B' else 2
+        followups = tuple(
+            calendar.add_business_days(last_contact_date, (i + 1) * interval)
+            for i in range(3)
+        )
+        first_strike = calendar.add_business_days(last_contact_date, interval)
+        second_strike = calendar.add_business_days(first_strike, 2)
+        third_strike = calendar.add_business_days(second_strike, 2)
+        # Recovery period starts after the second strike
+        recovery = (
+            calendar.add_business_days(second_strike, 1),
+            calendar.add_business_days(second_strike, 2)
+        )
+        return DateSchedule(followups, (first_strike, second_strike, third_strike), recovery)
+
+    @classmethod
+    def check_contact_date(cls, last_contact_date: datetime.date) -> None:
+        """Raise ValueError unless every schedule from ``last_contact_date`` fits on the business calendar.
+
+        Being inside the calendar's years is not enough: from the last few
+        business days of the calendar the schedule runs past its end.
+        """
+        calendar = cls.calendar()
+        if not calendar.first <= last_contact_date <= calendar.last:
+            raise ValueError(
+                f"{last_contact_date} is outside the business calendar ({calendar.first} to {calendar.last})"
+            )
+        try:
+            for severity in Config.SEVERITY_LEVELS:
+                cls.calculate_dates(last_contact_date, severity)
+        except ValueError:
+            raise ValueError(
+                f"{last_contact_date} is too close to the end of the business calendar ({calendar.last}) to schedule"
+            ) from None
+
+    @classmethod
+    def calculate_followup_dates(cls, case: Case) -> List[datetime.date]:
+        """Calculate follow-up dates for a case with a last contact date"""
+        return list(cls.calculate_dates(cls._contact_date(case), case.severity).followups)
+
+    @classmethod
+    def calculate_strike_dates(cls, case: Case) -> Tuple[List[datetime.date], Tuple[datetime.date, datetime.date]]:
+        """Calculate strike dates and recovery period for a case with a last contact date"""
+        schedule = cls.calculate_dates(cls._contact_date(case), case.severity)
+        return list(schedule.strikes), schedule.recovery
+
+    @staticmethod
+    def _contact_date(case: Case) -> datetime.date:
+        if case.last_contact_date is None:
+            raise ValueError(f"{case} has no last contact date")
+        return case.last_contact_date
+
+    @staticmethod
+    def format_date(day: datetime.date) -> str:
+        """Weekday name and ISO date, e.g. 'Tuesday 2026-10-20'"""
+        # Business days are Monday to Friday, which is the order of Config.WEEKDAYS
+        name = Config.WEEKDAYS[day.weekday()] if day.weekday() < len(Config.WEEKDAYS) else day.strftime("%A")
+        return f"{name} {day.isoformat()}"
+
+    @classmethod
+    def _format_dated_schedule(cls, case: Case) -> str:
+        """Format the calendar-date schedule of a dated case"""
+        try:
+            schedule = cls.calculate_dates(case.last_contact_date, case.severity)
+        except ValueError as error:
+            # Stored before dates were checked against the end of the calendar
+            return f"⚠️ Cannot schedule this case: {error}"
+        if case.case_type == 'Follow-ups':
+            return "📅 Follow-up Schedule:\n\n" + "\n".join(
+                f"Follow-up #{i+1}: {cls.format_date(day)}"
+                for i, day in enumerate(schedule.followups)
+            )
+        recovery_start, recovery_end = schedule.recovery
+        return (
+            "⚠️ Strike Schedule:\n\n" +
+            "\n".join(f"Strike #{i+1}: {cls.format_date(day)}"
+                     for i, day in enumerate(schedule.strikes)) +
+            f"\n\nRecovery Period: {cls.format_date(recovery_start)} - {cls.format_date(recovery_end)}"
+        )
+
+    @classmethod
+    def _lookup(cls, case: Case) -> ScheduleEntry:
+        """Find the schedule entry for a case, computing it if it is not tabled"""
+        entry = cls.schedule_table().get(
+            (case.case_type, case.last_contact_day, case.severity)
+        )
+        if entry is None:
+            entry = ScheduleEntry(
+                cls._compute_followups(case.last_contact_day, case.severity),
+                *cls._compute_strikes(case.last_contact_day, case.severity)
+            )
+        return entry
+
+    @classmethod
+    def calculate_followups(cls, case: Case) -> List[str]:
+        """Calculate follow-up schedule for a case"""
+        return list(cls._lookup(case).followups)
+    
+    @classmethod
+    def calculate_strikes(cls, case: Case) -> Tuple[List[str], Tuple[str, str]]:
+        """Calculate strike schedule and recovery period for a case"""
+        entry = cls._lookup(case)
+        return list(entry.strikes), entry.recovery
     
     @classmethod
     def format_schedule(cls, case: Case) -> str:
         """Format the schedule as a human-readable string"""
+        if case.last_contact_date is not None:
+            return cls._format_dated_schedule(case)
+        key = (case.case_type, case.last_contact_day, case.severity)
+        table = cls.schedule_table()
+        cached = cls._format_cache.get(key)
+        if cached is not None:
+            return cached
+
+        entry = cls._lookup(case)
         if case.case_type == 'Follow-ups':
-            followups = cls.calculate_followups(case)
-            return "📅 Follow-up Schedule:\n\n" + "\n".join(
+            result = "📅 Follow-up Schedule:\n\n" + "\n".join(
                 f"Follow-up #{i+1}: {day}"
-                for i, day in enumerate(followups)
+                for i, day in enumerate(entry.followups)
             )
         else:
-            strike_days, (recovery_start, recovery_end) = cls.calculate_strikes(case)
-            return (
+            recovery_start, recovery_end = entry.recovery
+            result = (
                 "⚠️ Strike Schedule:\n\n" +
                 "\n".join(f"Strike #{i+1}: {day}"
-                         for i, day in enumerate(strike_days)) +
+                         for i, day in enumerate(entry.strikes)) +
                 f"\n\nRecovery Period: {recovery_start} - {recovery_end}"
-            )
\ No newline at end of file
+            )
+
+        # Only cache combinations that belong to the table so the cache stays bounded
+        if key in table:
+            cls._format_cache[key] = result
+        return result
+
+
+# Build the schedule table up front so the first lookup is already a dict hit
+ScheduleCalculator.schedule_table()
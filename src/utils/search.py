@@ -0,0 +1,97 @@
+# src/utils/search.py
+from typing import Dict, Iterator, List, Optional, Set
+from ..models.case_repository import CaseRepository
+
+class CaseSearchIndex:
+    """N-gram index over case numbers for case-insensitive substring search.
+
+    Every case number is indexed under all of its 1-, 2- and 3-character
+    substrings, per case type. Queries up to three characters are a single
+    posting lookup; longer queries intersect the postings of their
+    trigrams, starting from the smallest, and confirm each candidate.
+
+    An index created with a repository is built on the first search, so
+    startup does not pay for it; changes made before then are picked up
+    from the repository when it is built.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self, cases: Optional[CaseRepository] = None):
+        # case type -> n-gram -> case numbers containing it
+        self._postings: Optional[Dict[str, Dict[str, Set[str]]]] = {} if cases is None else None
+        self._cases = cases
+
+    @classmethod
+    def from_repository(cls, cases: CaseRepository) -> 'CaseSearchIndex':
+        """Create an index over every case number in a repository"""
+        return cls(cases)
+
+    def _ensure_built(self) -> Dict[str, Dict[str, Set[str]]]:
+        """Build the postings from the repository if that has not happened yet"""
+        if self._postings is None:
+            self._postings = {}
+            for case_type in self._cases.maps:
+                for case_number in self._cases.numbers(case_type):
+                    self._index(case_number, case_type)
+        return self._postings
+
+    @classmethod
+    def _grams(cls, text: str) -> Iterator[str]:
+        """Yield every distinct substring of ``text`` up to GRAM_SIZE characters"""
+        text = text.lower()
+        seen = set()
+        for size in range(1, cls.GRAM_SIZE + 1):
+            for start in range(len(text) - size + 1):
+                gram = text[start:start + size]
+                if gram not in seen:
+                    seen.add(gram)
+                    yield gram
+
+    def add(self, case_number: str, case_type: str) -> None:
+        """Index a case number under a case type"""
+        if self._postings is not None:
+            self._index(case_number, case_type)
+
+    def _index(self, case_number: str, case_type: str) -> None:
+        """Add a case number's n-grams to the postings"""
+        postings = self._postings.setdefault(case_type, {})
+        for gram in self._grams(case_number):
+            postings.setdefault(gram, set()).add(case_number)
+
+    def remove(self, case_number: str, case_type: str) -> None:
+        """Remove a case number from a case type's index"""
+        if self._postings is None:
+            return
+        postings = self._postings.get(case_type)
+        if postings is None:
+            return
+        for gram in self._grams(case_number):
+            numbers = postings.get(gram)
+            if numbers is not None:
+                numbers.discard(case_number)
+                if not numbers:
+                    del postings[gram]
+
+    def search(self, term: str, case_type: str) -> List[str]:
+        """Return the sorted case numbers of a type that contain ``term``"""
+        term = term.lower()
+        postings = self._ensure_built().get(case_type, {})
+        if len(term) <= self.GRAM_SIZE:
+            return sorted(postings.get(term, ()))
+
+        trigrams = {
+            term[start:start + self.GRAM_SIZE]
+            for start in range(len(term) - self.GRAM_SIZE + 1)
+        }
+        candidate_sets = sorted(
+            (postings.get(gram, set()) for gram in trigrams),
+            key=len
+        )
+        candidates = set(candidate_sets[0])
+        for numbers in candidate_sets[1:]:
+            if not candidates:
+                break
+            candidates &= numbers
+        # Trigrams can all match without the full term being contiguous
+        return sorted(number for number in candidates if term in number.lower())
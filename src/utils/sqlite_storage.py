@@ -0,0 +1,193 @@
+# src/utils/sqlite_storage.py
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from ..models.case import Case, parse_date
+
+class SqliteCaseStore:
+    """Stores cases in an indexed SQLite table with single-row writes.
+
+    Triggers log the key of every changed row in ``case_changes``, keeping
+    the last ``change_log_size`` entries, so other processes sharing the
+    database can fetch just the rows that changed (see ``changes_since``).
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS cases (
+            case_number TEXT NOT NULL,
+            case_type TEXT NOT NULL,
+            last_contact_day TEXT NOT NULL,
+            severity TEXT NOT NULL,
+            last_contact_date TEXT,
+            PRIMARY KEY (case_type, case_number)
+        );
+        CREATE INDEX IF NOT EXISTS idx_cases_number ON cases (case_number);
+        CREATE INDEX IF NOT EXISTS idx_cases_type ON cases (case_type);
+        CREATE INDEX IF NOT EXISTS idx_cases_day ON cases (last_contact_day);
+        CREATE INDEX IF NOT EXISTS idx_cases_severity ON cases (severity);
+        CREATE INDEX IF NOT EXISTS idx_cases_type_severity_day
+            ON cases (case_type, severity, last_contact_day);
+        CREATE TABLE IF NOT EXISTS case_changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            case_number TEXT NOT NULL,
+            case_type TEXT NOT NULL
+        );
+        CREATE TRIGGER IF NOT EXISTS cases_logged_insert AFTER INSERT ON cases BEGIN
+            INSERT INTO case_changes (case_number, case_type) VALUES (new.case_number, new.case_type);
+        END;
+        CREATE TRIGGER IF NOT EXISTS cases_logged_update AFTER UPDATE ON cases BEGIN
+            INSERT INTO case_changes (case_number, case_type) VALUES (new.case_number, new.case_type);
+        END;
+        CREATE TRIGGER IF NOT EXISTS cases_logged_delete AFTER DELETE ON cases BEGIN
+            INSERT INTO case_changes (case_number, case_type) VALUES (old.case_number, old.case_type);
+        END;
+    """
+
+    _UPSERT = """
+        INSERT INTO cases (case_number, case_type, last_contact_day, severity, last_contact_date)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (case_type, case_number) DO UPDATE SET
+            last_contact_day = excluded.last_contact_day,
+            severity = excluded.severity,
+            last_contact_date = excluded.last_contact_date
+    """
+
+    _COLUMNS = "case_number, case_type, last_contact_day, severity, last_contact_date"
+
+    def __init__(self, path: str, change_log_size: int = 10000):
+        self.path = path
+        self.change_log_size = change_log_size
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # The connection may be used from a background thread; the lock
+        # serializes access so one connection can be shared safely.
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.executescript(self._SCHEMA)
+            columns = {row[1] for row in self._connection.execute("PRAGMA table_info(cases)")}
+            if "last_contact_date" not in columns:
+                # Databases created before cases could carry a date
+                self._connection.execute("ALTER TABLE cases ADD COLUMN last_contact_date TEXT")
+
+    @staticmethod
+    def _row(case: Case) -> tuple:
+        """Convert a case to a row tuple in column order"""
+        contact_date = case.last_contact_date.isoformat() if case.last_contact_date is not None else None
+        return (case.case_number, case.case_type, case.last_contact_day, case.severity, contact_date)
+
+    @staticmethod
+    def _case(row: tuple) -> Case:
+        """Convert a row tuple back into a Case"""
+        case_number, case_type, last_contact_day, severity, last_contact_date = row
+        return Case(
+            case_number=case_number,
+            case_type=case_type,
+            last_contact_day=last_contact_day,
+            severity=severity,
+            last_contact_date=parse_date(last_contact_date)
+        )
+
+    def load(self) -> List[Case]:
+        """Return every stored case"""
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT {self._COLUMNS} FROM cases"
+            ).fetchall()
+        return [self._case(row) for row in rows]
+
+    def _trim_change_log(self) -> None:
+        """Drop all but the newest change log entries; call inside a write transaction"""
+        self._connection.execute(
+            "DELETE FROM case_changes WHERE seq <= (SELECT MAX(seq) FROM case_changes) - ?",
+            (self.change_log_size,)
+        )
+
+    def data_version(self) -> int:
+        """Return a number that changes whenever another connection commits a change"""
+        with self._lock:
+            return self._connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def last_change(self) -> int:
+        """Return the sequence number of the newest change log entry"""
+        with self._lock:
+            return self._connection.execute("SELECT COALESCE(MAX(seq), 0) FROM case_changes").fetchone()[0]
+
+    def changes_since(self, seq: int) -> Optional[Tuple[int, Dict[Tuple[str, str], Optional[Case]]]]:
+        """Return the newest sequence number and the current state of every row changed after ``seq``.
+
+        Deleted rows map to None. Returns None if entries after ``seq`` were
+        already trimmed from the log; the caller then has to ``load``
+        everything again.
+        """
+        with self._lock:
+            # One read transaction, so the rows match the sequence number
+            self._connection.execute("BEGIN")
+            try:
+                oldest, newest = self._connection.execute(
+                    "SELECT MIN(seq), COALESCE(MAX(seq), 0) FROM case_changes"
+                ).fetchone()
+                if oldest is not None and oldest > seq + 1:
+                    return None
+                rows = self._connection.execute(
+                    """
+                    SELECT changed.case_number, changed.case_type,
+                           cases.last_contact_day, cases.severity, cases.last_contact_date
+                    FROM (SELECT DISTINCT case_number, case_type FROM case_changes WHERE seq > ?) AS changed
+                    LEFT JOIN cases
+                        ON cases.case_type = changed.case_type AND cases.case_number = changed.case_number
+                    """,
+                    (seq,)
+                ).fetchall()
+            finally:
+                self._connection.execute("COMMIT")
+        return newest, {
+            (row[0], row[1]): self._case(row) if row[2] is not None else None
+            for row in rows
+        }
+
+    def upsert(self, cases: Iterable[Case]) -> None:
+        """Insert or update the given cases in one transaction"""
+        with self._lock, self._connection:
+            self._connection.executemany(self._UPSERT, (self._row(case) for case in cases))
+            self._trim_change_log()
+
+    def delete(self, keys: Iterable[Tuple[str, str]]) -> None:
+        """Delete the cases with the given (case number, case type) keys in one transaction"""
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM cases WHERE case_number = ? AND case_type = ?",
+                keys
+            )
+            self._trim_change_log()
+
+    def query(
+        self,
+        case_type: Optional[str] = None,
+        severity: Optional[str] = None,
+        last_contact_day: Optional[str] = None,
+        case_number: Optional[str] = None
+    ) -> List[Case]:
+        """Return cases matching every filter that is given"""
+        filters = {
+            "case_type": case_type,
+            "severity": severity,
+            "last_contact_day": last_contact_day,
+            "case_number": case_number
+        }
+        clauses = [f"{column} = ?" for column, value in filters.items() if value is not None]
+        params = [value for value in filters.values() if value is not None]
+
+        sql = f"SELECT {self._COLUMNS} FROM cases"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY case_number"
+
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        return [self._case(row) for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,104 @@
+# src/utils/startup.py
+import importlib.abc
+import sys
+import time
+from typing import List, Optional, Tuple
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps a module loader and records how long executing the module takes"""
+
+    def __init__(self, loader, finder: '_ImportTimer'):
+        self._loader = loader
+        self._finder = finder
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        finder = self._finder
+        finder.depth += 1
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            finder.depth -= 1
+            finder.records.append((module.__name__, finder.depth, time.perf_counter() - start))
+
+    def __getattr__(self, name):
+        # get_resource_reader, is_package and friends
+        return getattr(self._loader, name)
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Meta path hook that times every module imported while it is installed"""
+
+    def __init__(self):
+        self.records: List[Tuple[str, int, float]] = []
+        self.depth = 0
+        self._finding = set()
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname in self._finding:
+            return None
+        self._finding.add(fullname)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self)
+                    return spec
+            return None
+        finally:
+            self._finding.discard(fullname)
+
+class StartupProfiler:
+    """Optional breakdown of where startup time goes.
+
+    Disabled by default, in which case ``mark`` is a single flag check.
+    ``enable`` starts timing imports and phases; ``report`` prints the
+    phases with the time since the previous one and the slowest imports.
+    """
+
+    enabled = False
+    _start = 0.0
+    _phases: List[Tuple[str, float]] = []
+    _imports: Optional[_ImportTimer] = None
+
+    @classmethod
+    def enable(cls) -> None:
+        """Start profiling; call before importing the modules to be measured"""
+        cls.enabled = True
+        cls._start = time.perf_counter()
+        cls._phases = []
+        cls._imports = _ImportTimer()
+        sys.meta_path.insert(0, cls._imports)
+
+    @classmethod
+    def mark(cls, phase: str) -> None:
+        """Record that a startup phase has finished"""
+        if cls.enabled:
+            cls._phases.append((phase, time.perf_counter()))
+
+    @classmethod
+    def report(cls, top: int = 15) -> None:
+        """Print the phase and import breakdown, then stop profiling"""
+        if not cls.enabled:
+            return
+        cls.enabled = False
+        if cls._imports in sys.meta_path:
+            sys.meta_path.remove(cls._imports)
+
+        print("Startup phases (ms since start / since previous):")
+        previous = cls._start
+        for phase, moment in cls._phases:
+            print(f"  {phase:<28} {(moment - cls._start) * 1000:9.1f} {(moment - previous) * 1000:9.1f}")
+            previous = moment
+
+        records = cls._imports.records if cls._imports is not None else []
+        top_level = sum(seconds for _, depth, seconds in records if depth == 0)
+        print(f"Imports: {len(records)} modules, {top_level * 1000:.1f} ms")
+        print(f"Slowest imports (cumulative ms, top {top}):")
+        for name, _, seconds in sorted(records, key=lambda record: record[2], reverse=True)[:top]:
+            print(f"  {name:<40} {seconds * 1000:9.1f}")
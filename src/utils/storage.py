@@ -1,52 +1,600 @@
 # src/utils/storage.py
+import contextlib
 import json
 import os
-from typing import Dict
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Dict, List, Optional, Set, Tuple
 from ..models.case import Case
+from ..models.case_map import LazyCaseMap, TrackedCaseMap
+from ..models.case_repository import CaseKey, CaseRepository
 from ..config import Config
+from .file_lock import FileLock, file_stat
+from .journal import CaseJournal
+from .streaming import iter_case_entries
+
+if TYPE_CHECKING:
+    # Imported on first use so json and journal mode never load sqlite3
+    from .sqlite_storage import SqliteCaseStore
+
+# Start of a JSON mode change log line, which is written with the generation first
+_LOG_GENERATION = re.compile(r'\{"generation": (\d+),')
+
+# Called with the keys loaded since the last call and the fraction done
+LoadCallback = Callable[[List[CaseKey], float], None]
+
+@dataclass
+class ChangeSet:
+    """Serialized changes waiting to be written, keyed by (case number, case type).
+
+    A change set holds plain data only, so it can be handed to another
+    thread while the repository keeps changing.
+    """
+    upserts: Dict[Tuple[str, str], Dict[str, Any]] = field(default_factory=dict)
+    deletes: Set[Tuple[str, str]] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.upserts or self.deletes)
+
+    def merge(self, later: 'ChangeSet') -> None:
+        """Fold a later change set into this one; the later change wins"""
+        for key in later.deletes:
+            self.upserts.pop(key, None)
+            self.deletes.add(key)
+        for key, data in later.upserts.items():
+            self.deletes.discard(key)
+            self.upserts[key] = data
+
+@dataclass
+class ExternalChanges:
+    """Cases another instance changed in shared storage since the repository was last in sync.
+
+    ``entries`` maps (case number, case type) to the stored data, or to None
+    for a deleted case. If ``complete`` is set, storage had to be read in
+    full and ``entries`` holds every stored case. Once the changes are
+    applied, ``StorageManager.mark_synced`` moves the sync position on.
+    """
+    entries: Dict[CaseKey, Optional[Dict[str, Any]]] = field(default_factory=dict)
+    complete: bool = False
+    # Sync positions the changes were read from and lead to
+    base: Any = None
+    position: Any = None
+
+    def __bool__(self) -> bool:
+        return bool(self.entries) or self.complete
 
 class StorageManager:
-    """Handles saving and loading cases from persistent storage"""
+    """Handles saving and loading cases from persistent storage.
+
+    Several instances can share the same files: writes hold an advisory
+    ``FileLock`` (SQLite does its own locking), and each instance can ask
+    for the changes the others made since its repository was loaded or
+    last synced (``has_external_changes``, ``read_external_changes``).
+    """
+
+    _journal: Optional[CaseJournal] = None
+    _sqlite: Optional['SqliteCaseStore'] = None
+    # Serializes writes, which may come from a background save worker
+    _write_lock = threading.Lock()
+
+    # Serialized JSON text of every stored case, by type and case number, so a
+    # save only has to re-serialize the cases that changed, and the file
+    # stamp it matches; if another instance wrote since, it is read again
+    _fragments: Dict[str, Dict[str, str]] = {}
+    _fragments_path: Optional[str] = None
+    _fragments_stamp: Any = None
+
+    # Position in storage the last loaded repository is in sync with, as
+    # (quick check, read position); see _sync_position
+    _synced: Any = None
+
+    @classmethod
+    def _get_journal(cls) -> CaseJournal:
+        """Return the journal for the configured files, creating it on first use"""
+        journal = cls._journal
+        if (
+            journal is None
+            or journal.snapshot_path != Config.CASES_FILE
+            or journal.journal_path != Config.JOURNAL_FILE
+        ):
+            journal = CaseJournal(
+                Config.CASES_FILE,
+                Config.JOURNAL_FILE,
+                Config.JOURNAL_COMPACT_THRESHOLD,
+                cls._file_lock()
+            )
+            cls._journal = journal
+        return journal
+
+    @classmethod
+    def _get_sqlite(cls) -> 'SqliteCaseStore':
+        """Return the SQLite store for the configured file, opening it on first use"""
+        from .sqlite_storage import SqliteCaseStore
+        store = cls._sqlite
+        if store is None or store.path != Config.SQLITE_FILE:
+            if store is not None:
+                store.close()
+            store = SqliteCaseStore(Config.SQLITE_FILE, Config.SHARED_CHANGE_LOG_SIZE)
+            cls._sqlite = store
+        return store
+
+    @staticmethod
+    def _file_lock() -> FileLock:
+        """Return the lock that instances sharing the JSON and journal files write under"""
+        return FileLock.for_path(Config.CASES_FILE + Config.LOCK_FILE_SUFFIX)
+
+    @classmethod
+    def _storage_lock(cls) -> ContextManager:
+        """Lock to hold while reading or writing the configured storage"""
+        if Config.STORAGE_MODE == "sqlite":
+            return contextlib.nullcontext()  # SQLite locks the database itself
+        return cls._file_lock()
+
+    @classmethod
+    def _stamp(cls) -> tuple:
+        """Cheap fingerprint of the JSON or journal files, which changes with every write.
+
+        The lock file's generation is bumped by every writer; the file
+        stats also catch writers that do not use the lock.
+        """
+        if Config.STORAGE_MODE == "journal":
+            journal = cls._get_journal()
+            return (
+                cls._file_lock().generation(),
+                file_stat(journal.snapshot_path),
+                file_stat(journal.journal_path),
+                file_stat(journal.compacting_path)
+            )
+        return cls._file_lock().generation(), file_stat(Config.CASES_FILE)
+
+    @classmethod
+    def _sync_position(cls) -> tuple:
+        """Return (quick check, read position) for the current storage contents.
+
+        The quick check is the file stamp, or SQLite's data version; the
+        read position is where ``read_external_changes`` continues from: the
+        journal position, or the last SQLite change log entry. Call with
+        the storage lock held.
+        """
+        if Config.STORAGE_MODE == "sqlite":
+            store = cls._get_sqlite()
+            return store.data_version(), store.last_change()
+        if Config.STORAGE_MODE == "journal":
+            return cls._stamp(), cls._get_journal().position()
+        return cls._stamp(), None
+
+    @staticmethod
+    def _atomic_write(path: str, text: str) -> None:
+        """Write ``text`` to ``path`` so a crash leaves either the old or the new file"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _render_entry(case_number: str, data: Dict[str, Any]) -> str:
+        """Serialize one case as it appears inside the JSON file"""
+        if all(isinstance(value, str) for value in data.values()):
+            # Flat string fields: build the indented text directly, which is
+            # much faster than json.dumps(indent=...)'s pure-Python encoder
+            fields = ",\n".join(
+                f"            {json.dumps(key)}: {json.dumps(value)}"
+                for key, value in data.items()
+            )
+            body = f"{{\n{fields}\n        }}" if fields else "{}"
+        else:
+            body = json.dumps(data, indent=4).replace("\n", "\n        ")
+        return f"        {json.dumps(case_number)}: {body}"
+
+    @staticmethod
+    def _render_file(fragments: Dict[str, Dict[str, str]]) -> str:
+        """Join serialized cases into the same layout as ``json.dump(..., indent=4)``"""
+        sections = []
+        for case_type, entries in fragments.items():
+            if entries:
+                body = ",\n".join(entries.values())
+                sections.append(f"    {json.dumps(case_type)}: {{\n{body}\n    }}")
+            else:
+                sections.append(f"    {json.dumps(case_type)}: {{}}")
+        return "{\n" + ",\n".join(sections) + "\n}" if sections else "{}"
+
+    @staticmethod
+    def collect_changes(cases: CaseRepository) -> ChangeSet:
+        """Take the pending changes out of a repository as a ChangeSet.
+
+        Must run on the thread that modifies ``cases``; the repository is
+        marked clean, so the caller becomes responsible for writing them.
+        """
+        changes = ChangeSet()
+        for case_type, case_map in cases.maps.items():
+            if not case_map.has_changes:
+                continue
+            upserted, deleted = case_map.changes()
+            changes.deletes.update((case.case_number, case_type) for case in deleted)
+            changes.upserts.update((case.key, case.to_dict()) for case in upserted)
+            case_map.mark_clean()
+        return changes
+
+    @staticmethod
+    def _mark_clean(cases: CaseRepository) -> None:
+        """Forget pending changes after they have been written"""
+        for case_map in cases.maps.values():
+            case_map.mark_clean()
     
+    @classmethod
+    def load_cases(cls, on_chunk: Optional[LoadCallback] = None) -> CaseRepository:
+        """Load cases from storage into a CaseRepository.
+
+        JSON and journal files are read into lazy maps that only build a
+        ``Case`` when an entry is accessed; the JSON file is also parsed
+        incrementally so memory use does not spike on large files.
+
+        If ``on_chunk`` is given it is called every ``Config.LOAD_CHUNK_SIZE``
+        cases with the keys loaded since the last call and the fraction of
+        the load done, so a caller on another thread can show progress.
+        """
+        cases, synced, chunk = cls._read_cases(on_chunk)
+        with cls._write_lock:
+            cls._synced = synced
+        if on_chunk is not None:
+            on_chunk(chunk, 1.0)
+        return cases
+
+    @classmethod
+    def _read_cases(cls, on_chunk: Optional[LoadCallback] = None) -> Tuple[CaseRepository, tuple, List[CaseKey]]:
+        """Read every stored case without moving the sync position.
+
+        Returns the cases, the sync position they match and the keys loaded
+        since the last ``on_chunk`` call. One-off reads use this so they do
+        not hide external changes from ``has_external_changes``.
+        """
+        chunk: List[CaseKey] = []
+
+        def loaded(case_number: str, case_type: str, progress: Callable[[], float]) -> None:
+            chunk.append((case_number, case_type))
+            if len(chunk) >= Config.LOAD_CHUNK_SIZE:
+                on_chunk(chunk[:], progress())
+                chunk.clear()
+
+        if Config.STORAGE_MODE == "sqlite":
+            cases = CaseRepository()
+            # Taken first: changes made while loading are read again at the
+            # next sync, where they match and are skipped
+            synced = cls._sync_position()
+            stored = cls._get_sqlite().load()
+            for count, case in enumerate(stored, 1):
+                cases.upsert(case)
+                if on_chunk is not None:
+                    loaded(case.case_number, case.case_type, lambda: count / len(stored))
+            cls._mark_clean(cases)
+        else:
+            maps: Dict[str, TrackedCaseMap] = {
+                case_type: LazyCaseMap(case_type) for case_type in Config.CASE_TYPES
+            }
+
+            if Config.STORAGE_MODE == "journal":
+                with cls._file_lock():
+                    data = cls._get_journal().load()
+                    synced = cls._sync_position()
+                total = sum(len(data.get(case_type, {})) for case_type in maps) or 1
+                count = 0
+                for case_type, case_map in maps.items():
+                    for case_number, case_data in data.get(case_type, {}).items():
+                        case_map.add_raw(case_number, case_data)
+                        count += 1
+                        if on_chunk is not None:
+                            loaded(case_number, case_type, lambda: count / total)
+            else:
+                # Held so another instance cannot replace the file mid-read
+                with cls._file_lock():
+                    synced = cls._sync_position()
+                    if os.path.exists(Config.CASES_FILE):
+                        total = os.path.getsize(Config.CASES_FILE) or 1
+                        with open(Config.CASES_FILE, "r", encoding="utf-8") as file:
+                            for case_type, case_number, case_data in iter_case_entries(file, maps):
+                                maps[case_type].add_raw(case_number, case_data)
+                                if on_chunk is not None:
+                                    # Bytes the decoder has read so far, a close enough position
+                                    loaded(case_number, case_type, lambda: file.buffer.tell() / total)
+
+            cases = CaseRepository(maps)
+
+        return cases, synced, chunk
+
+    @classmethod
+    def save_cases(cls, cases: CaseRepository) -> None:
+        """Save the cases that changed since the last save"""
+        cls.write_changes(cls.collect_changes(cases))
+
+    @classmethod
+    def write_changes(cls, changes: ChangeSet) -> None:
+        """Write a ChangeSet to the configured storage.
+
+        Safe to call from a background thread; only the changed cases are
+        serialized. Other instances sharing the files are locked out until
+        the write is done.
+        """
+        if not changes:
+            return
+        with cls._write_lock:
+            if Config.STORAGE_MODE == "sqlite":
+                # Not synced here: another connection may commit in between,
+                # so these rows are read back, and skipped, at the next sync
+                cls._save_sqlite(changes)
+                return
+
+            with cls._file_lock() as lock:
+                stamp = cls._stamp()
+                if Config.STORAGE_MODE == "journal":
+                    cls._save_journal(changes)
+                else:
+                    cls._save_json(changes, stamp)
+                generation = lock.bump()
+                if Config.STORAGE_MODE == "json":
+                    cls._log_changes(generation, changes)
+                    cls._fragments_stamp = cls._stamp()
+                if cls._synced is not None and cls._synced[0] == stamp:
+                    # Nobody else wrote since the last sync, so the repository,
+                    # which these changes came from, is still in sync
+                    cls._synced = cls._sync_position()
+
     @staticmethod
-    def load_cases() -> Dict[str, Dict[str, Case]]:
-        """Load cases from the JSON file and convert them to Case objects"""
-        cases: Dict[str, Dict[str, Case]] = {
-            "Follow-ups": {},
-            "Strikes": {}
-        }
-        
+    def _change_log_path() -> str:
+        return Config.CASES_FILE + Config.CHANGE_LOG_SUFFIX
+
+    @classmethod
+    def _read_change_log(cls, after: int = 0) -> List[Dict[str, Any]]:
+        """Return the JSON mode change log entries after generation ``after``, oldest first"""
+        entries = []
+        try:
+            with open(cls._change_log_path(), "r", encoding="utf-8") as file:
+                for line in file:
+                    # Lines start with the generation, so older entries are
+                    # skipped without decoding their changes
+                    match = _LOG_GENERATION.match(line)
+                    if match is None or int(match.group(1)) <= after:
+                        continue
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        continue  # A crash mid-append can leave a partial line
+        except FileNotFoundError:
+            pass
+        return entries
+
+    @classmethod
+    def _log_changes(cls, generation: int, changes: ChangeSet) -> None:
+        """Record what a JSON save changed, under its generation; the file lock must be held.
+
+        Other instances apply these entries instead of reading the whole
+        cases file. The log keeps about the last ``SHARED_CHANGE_LOG_SIZE``
+        changed cases; a write bigger than that is not logged, so readers
+        fall back to reading the file.
+        """
+        changed = [[case_number, case_type, None] for case_number, case_type in changes.deletes]
+        changed.extend([case_number, case_type, data] for (case_number, case_type), data in changes.upserts.items())
+        line = json.dumps({"generation": generation, "changes": changed}) + "\n"
+        if len(changed) > Config.SHARED_CHANGE_LOG_SIZE:
+            cls._atomic_write(cls._change_log_path(), "")
+            return
+
+        # Only read the log back to trim it once it is about twice the size
+        # to keep, going by the size of this entry per change
+        path = cls._change_log_path()
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if size + len(line) <= 2 * Config.SHARED_CHANGE_LOG_SIZE * len(line) / max(len(changed), 1):
+            with open(path, "a", encoding="utf-8") as file:
+                file.write(line)
+            return
+        entries = cls._read_change_log()
+        if sum(len(entry["changes"]) for entry in entries) + len(changed) <= 2 * Config.SHARED_CHANGE_LOG_SIZE:
+            with open(path, "a", encoding="utf-8") as file:
+                file.write(line)
+            return
+        # Trim to the newest entries
+        kept: List[str] = [line]
+        count = len(changed)
+        for entry in reversed(entries):
+            count += len(entry["changes"])
+            if count > Config.SHARED_CHANGE_LOG_SIZE:
+                break
+            kept.append(json.dumps(entry) + "\n")
+        cls._atomic_write(path, "".join(reversed(kept)))
+
+    @classmethod
+    def _logged_changes(cls, since: tuple, stamp: tuple) -> Optional[Dict[CaseKey, Optional[Dict[str, Any]]]]:
+        """Return the cases changed between two JSON file stamps, from the change log.
+
+        Returns None unless the log holds every generation in between, e.g.
+        after a write by an instance without the lock, a crash before
+        logging, or a write too large to log; then the file must be read.
+        """
+        first, last = since[0], stamp[0]
+        if last <= first:
+            return None  # The file changed without a logged write
+        changes: Dict[CaseKey, Optional[Dict[str, Any]]] = {}
+        expected = first + 1
+        for entry in cls._read_change_log(after=first):
+            if entry["generation"] != expected:
+                return None
+            for case_number, case_type, data in entry["changes"]:
+                changes[(case_number, case_type)] = data
+            expected += 1
+        return changes if expected == last + 1 else None
+
+    @classmethod
+    def _load_fragments(cls) -> Dict[str, Dict[str, str]]:
+        """Serialize the cases currently on disk, one fragment per case"""
+        fragments: Dict[str, Dict[str, str]] = {case_type: {} for case_type in Config.CASE_TYPES}
         if os.path.exists(Config.CASES_FILE):
             with open(Config.CASES_FILE, "r", encoding="utf-8") as file:
-                data = json.load(file)
-                
-                for case_type in Config.CASE_TYPES:
-                    for case_number, case_data in data.get(case_type, {}).items():
-                        # Create case instance
-                        case = Case.from_dict(
-                            case_number=case_number,
-                            data=case_data
-                        )
-                        # Store using unique_id as the key
-                        cases[case_type][case.unique_id] = case
-        
-        return cases
+                for case_type, case_number, data in iter_case_entries(file, fragments):
+                    fragments[case_type][case_number] = cls._render_entry(case_number, data)
+        return fragments
 
-    @staticmethod
-    def save_cases(cases: Dict[str, Dict[str, Case]]) -> None:
-        """Save cases to the JSON file"""
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(Config.CASES_FILE), exist_ok=True)
-        
-        # Convert cases to dictionary format
-        data = {
-            case_type: {
-                case.case_number: case.to_dict()  # Use case_number for storage
-                for case in case_dict.values()
-            }
-            for case_type, case_dict in cases.items()
-        }
-        
-        # Save to file
-        with open(Config.CASES_FILE, "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=4)
\ No newline at end of file
+    @classmethod
+    def _save_json(cls, changes: ChangeSet, stamp: tuple) -> None:
+        """Rewrite the JSON file atomically, re-serializing only changed cases"""
+        if cls._fragments_path != Config.CASES_FILE:
+            # First save: start from what is on disk, which is everything
+            # loaded plus every change written since
+            cls._fragments = cls._load_fragments()
+            cls._fragments_path = Config.CASES_FILE
+        elif cls._fragments_stamp != stamp:
+            # Another instance wrote since the last save; bring its changes
+            # in so none of them are overwritten
+            logged = cls._logged_changes(cls._fragments_stamp, stamp)
+            if logged is None:
+                cls._fragments = cls._load_fragments()
+            else:
+                for (case_number, case_type), data in logged.items():
+                    if data is None:
+                        cls._fragments.get(case_type, {}).pop(case_number, None)
+                    elif case_type in Config.CASE_TYPES:
+                        cls._fragments.setdefault(case_type, {})[case_number] = cls._render_entry(case_number, data)
+
+        for case_number, case_type in changes.deletes:
+            cls._fragments.get(case_type, {}).pop(case_number, None)
+        for (case_number, case_type), data in changes.upserts.items():
+            # Use case_number for storage
+            cls._fragments.setdefault(case_type, {})[case_number] = cls._render_entry(case_number, data)
+
+        cls._atomic_write(Config.CASES_FILE, cls._render_file(cls._fragments))
+
+    @classmethod
+    def _save_journal(cls, changes: ChangeSet) -> None:
+        """Append changed cases to the journal"""
+        records = [
+            CaseJournal.delete_record(case_type, case_number)
+            for case_number, case_type in changes.deletes
+        ]
+        records.extend(
+            CaseJournal.put_record(case_type, case_number, data)
+            for (case_number, case_type), data in changes.upserts.items()
+        )
+        cls._get_journal().append(records)
+
+    @classmethod
+    def _save_sqlite(cls, changes: ChangeSet) -> None:
+        """Write changed rows to SQLite"""
+        store = cls._get_sqlite()
+        store.delete(changes.deletes)
+        store.upsert(
+            Case.from_dict(case_number, data)
+            for (case_number, _), data in changes.upserts.items()
+        )
+
+    @classmethod
+    def has_external_changes(cls) -> bool:
+        """Whether another instance changed storage since the last load or sync.
+
+        Only a few stat calls (one query in sqlite mode), so it can be
+        polled from the UI thread.
+        """
+        synced = cls._synced
+        if synced is None:
+            return False
+        if Config.STORAGE_MODE == "sqlite":
+            return cls._get_sqlite().data_version() != synced[0]
+        return cls._stamp() != synced[0]
+
+    @classmethod
+    def read_external_changes(cls) -> ExternalChanges:
+        """Read the cases other instances changed since the last load or sync.
+
+        Only the changes are read where possible: the JSON mode change log,
+        the end of the journal, or the rows in the SQLite change log.
+        Storage whose log no longer reaches back to the last sync is read in
+        full. Safe to call from a background thread.
+        """
+        with cls._write_lock, cls._storage_lock():
+            base = cls._synced
+            if base is None or not cls.has_external_changes():
+                return ExternalChanges(base=base, position=base)
+            position = cls._sync_position()
+
+            if Config.STORAGE_MODE == "sqlite":
+                store = cls._get_sqlite()
+                found = store.changes_since(base[1])
+                if found is not None:
+                    last_change, changed = found
+                    position = (position[0], last_change)
+                    return ExternalChanges(
+                        {key: case.to_dict() if case is not None else None for key, case in changed.items()},
+                        base=base,
+                        position=position
+                    )
+                entries = {case.key: case.to_dict() for case in store.load()}
+            elif Config.STORAGE_MODE == "journal":
+                journal = cls._get_journal()
+                changed = journal.changes_since(base[1])
+                if changed is not None:
+                    return ExternalChanges(
+                        {key: data for key, data in changed.items() if key[1] in Config.CASE_TYPES},
+                        base=base,
+                        position=position
+                    )
+                entries = {
+                    (case_number, case_type): case_data
+                    for case_type, stored in journal.load().items()
+                    if case_type in Config.CASE_TYPES
+                    for case_number, case_data in stored.items()
+                }
+            else:
+                changed = cls._logged_changes(base[0], position[0])
+                if changed is not None:
+                    return ExternalChanges(
+                        {key: data for key, data in changed.items() if key[1] in Config.CASE_TYPES},
+                        base=base,
+                        position=position
+                    )
+                entries = {}
+                if os.path.exists(Config.CASES_FILE):
+                    with open(Config.CASES_FILE, "r", encoding="utf-8") as file:
+                        for case_type, case_number, case_data in iter_case_entries(file, Config.CASE_TYPES):
+                            entries[(case_number, case_type)] = case_data
+            return ExternalChanges(entries, complete=True, base=base, position=position)
+
+    @classmethod
+    def mark_synced(cls, changes: ExternalChanges) -> None:
+        """Record that ``changes`` were applied to the repository"""
+        with cls._write_lock:
+            if cls._synced == changes.base:
+                cls._synced = changes.position
+
+    @classmethod
+    def close(cls) -> None:
+        """Finish background journal compaction, close the SQLite store and drop cached file state"""
+        if cls._journal is not None:
+            cls._journal.wait_for_compaction()
+        if cls._sqlite is not None:
+            cls._sqlite.close()
+            cls._sqlite = None
+        cls._fragments = {}
+        cls._fragments_path = None
+        cls._fragments_stamp = None
+        cls._synced = None
+
+    @classmethod
+    def query_cases(
+        cls,
+        case_type: Optional[str] = None,
+        severity: Optional[str] = None,
+        last_contact_day: Optional[str] = None,
+        case_number: Optional[str] = None
+    ) -> List[Case]:
+        """Return stored cases matching every filter that is given.
+
+        Uses the SQLite indexes in sqlite mode. In json and journal mode the
+        file is read on every call, so this is for one-off queries such as
+        the CLI's; callers holding a loaded repository should use
+        ``CaseRepository.query`` instead.
+        """
+        if Config.STORAGE_MODE == "sqlite":
+            return cls._get_sqlite().query(case_type, severity, last_contact_day, case_number)
+        cases, _synced, _chunk = cls._read_cases()
+        return cases.query(case_type, severity, last_contact_day, case_number)
@@ -0,0 +1,102 @@
+# src/utils/streaming.py
+import json
+import re
+from typing import Any, Container, Dict, Iterator, TextIO, Tuple
+
+class _IncrementalReader:
+    """Decodes JSON values from a text file one chunk at a time"""
+
+    _WHITESPACE = re.compile(r"[ \t\r\n]*")
+
+    def __init__(self, file: TextIO, chunk_size: int):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read the next chunk, dropping consumed text; return False at end of file"""
+        if self._eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it"""
+        while True:
+            self._pos = self._WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON input")
+
+    def expect(self, char: str) -> None:
+        """Consume ``char`` or raise if something else comes next"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} but found {found!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number that touches the end of the buffer may continue in the
+            # next chunk, so only trust it once more input has been seen
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+def iter_case_entries(
+    file: TextIO,
+    case_types: Container[str],
+    chunk_size: int = 1 << 16
+) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    """Yield (case type, case number, case data) from a cases JSON file.
+
+    The file is parsed incrementally, so memory use is bounded by the chunk
+    size and the size of a single case rather than by the whole file.
+    Top-level keys that are not in ``case_types`` are skipped.
+    """
+    reader = _IncrementalReader(file, chunk_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        case_type = reader.value()
+        reader.expect(":")
+
+        if case_type in case_types and reader.peek() == "{":
+            reader.expect("{")
+            if reader.peek() != "}":
+                while True:
+                    case_number = reader.value()
+                    reader.expect(":")
+                    yield case_type, case_number, reader.value()
+                    if reader.peek() != ",":
+                        break
+                    reader.expect(",")
+            reader.expect("}")
+        else:
+            reader.value()
+
+        if reader.peek() != ",":
+            break
+        reader.expect(",")
+
+    reader.expect("}")